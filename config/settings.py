@@ -10,6 +10,8 @@ class ConfigManager:
         self.config_path = Path(config_path)
         self.config_data: Dict[str, Any] = {}
         self.encryption_key: Optional[bytes] = None
+        # Bumped whenever settings are loaded or changed so callers can drop values derived from them
+        self.generation = 0
         # Use DATABASE_PATH env var, fallback to database/music_library.db
         import os
         db_path = os.environ.get('DATABASE_PATH', 'database/music_library.db')
@@ -25,6 +27,7 @@ class ConfigManager:
             self.config_path = Path(config_path)
         
         self._load_config()
+        self.generation += 1
 
     def _get_encryption_key(self) -> bytes:
         key_file = self.config_path.parent / ".encryption_key"
@@ -262,6 +265,7 @@ class ConfigManager:
             config = config[k]
 
         config[keys[-1]] = value
+        self.generation += 1
         self._save_config()
 
     def get_spotify_config(self) -> Dict[str, str]:
@@ -1,5 +1,5 @@
 import requests
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 import json
@@ -839,6 +839,51 @@ class JellyfinClient:
             logger.error(f"Error getting recently updated tracks: {e}")
             return []
     
+    def iter_tracks(self, page_size: int = 500) -> Iterator[List[JellyfinTrackInfo]]:
+        """Yield every track in the music library one page at a time.
+        A failed page request raises, so a partial listing is never mistaken for the whole library."""
+        if not self.ensure_connection() or not self.music_library_id:
+            return
+        
+        start_index = 0
+        while True:
+            params = {
+                'ParentId': self.music_library_id,
+                'IncludeItemTypes': 'Audio',
+                'Recursive': True,
+                'SortBy': 'SortName',
+                'SortOrder': 'Ascending',
+                'StartIndex': start_index,
+                'Limit': page_size
+            }
+            
+            response = self._make_request(f'/Users/{self.user_id}/Items', params)
+            if response is None:
+                # _make_request has already logged the cause
+                raise RuntimeError(f"Error listing Jellyfin tracks at index {start_index}")
+            
+            items = response.get('Items', [])
+            if not items:
+                return
+            
+            yield [
+                JellyfinTrackInfo(
+                    id=item.get('Id', ''),
+                    title=item.get('Name', ''),
+                    artist=(item.get('Artists') or [item.get('AlbumArtist', '')])[0],
+                    album=item.get('Album', ''),
+                    duration=item.get('RunTimeTicks', 0) // 10000,  # Convert from ticks to milliseconds
+                    track_number=item.get('IndexNumber'),
+                    year=item.get('ProductionYear'),
+                    rating=item.get('UserData', {}).get('Rating')
+                )
+                for item in items
+            ]
+            
+            if len(items) < page_size:
+                return
+            start_index += page_size
+    
     def get_library_stats(self) -> Dict[str, int]:
         """Get library statistics - matches Plex interface"""
         if not self.ensure_connection() or not self.music_library_id:
@@ -1,4 +1,5 @@
 from typing import List, Optional, Dict, Any, Tuple
+from collections import defaultdict
 import re
 from dataclasses import dataclass
 from difflib import SequenceMatcher
@@ -10,9 +11,41 @@ from core.spotify_client import Track as SpotifyTrack
 from core.plex_client import PlexTrackInfo
 from core.soulseek_client import TrackResult, AlbumResult
 
+# rapidfuzz narrows whole-library fallback matching to plausible titles in C; without it every track is scored
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    _rf_process = None
 
 logger = get_logger("matching_engine")
 
+# normalize_string building blocks, compiled once rather than on every call
+# Handle Korn/KoЯn variations - both uppercase Я (U+042F) and lowercase я (U+044F)
+_STYLIZED_CHARS = str.maketrans({
+    'Я': 'R',  # Cyrillic 'Ya' to 'R'
+    'я': 'r',  # Lowercase Cyrillic 'ya' to 'r'
+})
+# Expand specific abbreviations for better matching
+_ABBREVIATION_RES = (
+    (re.compile(r'\bpt\.'), 'part'),      # "pt." → "part"
+    (re.compile(r'\bvol\.'), 'volume'),   # "vol." → "volume"
+    (re.compile(r'\bfeat\.'), 'featured') # "feat." → "featured"
+    # Removed "ft." → "featured" (ambiguous: could be "feet" in measurements)
+)
+# Include hyphen in separator replacement for artist names like "AC/DC" vs "AC-DC"
+_SEPARATORS = str.maketrans('._/-', '    ')
+_NON_WORD_RE = re.compile(r'[^a-z0-9\s$]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_CORE_RE = re.compile(r'[^a-z0-9]')
+
+# similarity_score results kept per engine; the cache is emptied when it reaches this many pairs
+_SIMILARITY_CACHE_SIZE = 100_000
+
+# Minimum rapidfuzz ratio between cleaned titles for a library track to be scored in the whole-library fallback.
+# A standard match needs a title score of at least 2/3, and fuzz.ratio (2*LCS/len) is never below SequenceMatcher's
+# ratio, so no track under the cutoff can match that way. Core-title and remaster matches are kept separately.
+_FALLBACK_TITLE_CUTOFF = 66
+
 @dataclass
 class MatchResult:
     spotify_track: SpotifyTrack
@@ -46,6 +79,12 @@ class MusicMatchingEngine:
             # REMOVED: r'\s*and.*' - This breaks artist names with "and"  
             # REMOVED: r',.*' - This can break legitimate artist names with commas
         ]
+
+        self._title_res = [re.compile(pattern, re.IGNORECASE) for pattern in self.title_patterns]
+        self._artist_res = [re.compile(pattern, re.IGNORECASE) for pattern in self.artist_patterns]
+
+        # (str1, str2) -> similarity_score result; scores depend only on the two strings
+        self._similarity_cache: Dict[Tuple[str, str], float] = {}
     
     def normalize_string(self, text: str) -> str:
         """
@@ -54,28 +93,12 @@ class MusicMatchingEngine:
         """
         if not text:
             return ""
-        # Handle Korn/KoЯn variations - both uppercase Я (U+042F) and lowercase я (U+044F)
-        char_map = {
-            'Я': 'R',  # Cyrillic 'Ya' to 'R'
-            'я': 'r',  # Lowercase Cyrillic 'ya' to 'r'
-        }
-
         # Apply the character replacements before other normalization steps
-        for original, replacement in char_map.items():
-            text = text.replace(original, replacement)
-        text = unidecode(text)
+        text = unidecode(text.translate(_STYLIZED_CHARS))
         text = text.lower()
         
-        # Expand specific abbreviations for better matching
-        abbreviation_map = {
-            r'\bpt\.': 'part',      # "pt." → "part"
-            r'\bvol\.': 'volume',   # "vol." → "volume"
-            r'\bfeat\.': 'featured' # "feat." → "featured"
-            # Removed "ft." → "featured" (ambiguous: could be "feet" in measurements)
-        }
-        
-        for pattern, replacement in abbreviation_map.items():
-            text = re.sub(pattern, replacement, text)
+        for pattern, replacement in _ABBREVIATION_RES:
+            text = pattern.sub(replacement, text)
         
         # --- IMPROVEMENT V4 ---
         # The user correctly pointed out that replacing '$' with 's' was incorrect
@@ -83,14 +106,13 @@ class MusicMatchingEngine:
         # The new approach is to PRESERVE the '$' symbol during normalization.
         
         # Replace common separators with spaces to preserve word boundaries.
-        # Include hyphen in separator replacement for artist names like "AC/DC" vs "AC-DC"
-        text = re.sub(r'[._/-]', ' ', text)
+        text = text.translate(_SEPARATORS)
 
         # Keep alphanumeric characters, spaces, AND the '$' sign.
-        text = re.sub(r'[^a-z0-9\s$]', '', text)
+        text = _NON_WORD_RE.sub('', text)
         
         # Consolidate multiple spaces into one
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         return text
     
@@ -100,14 +122,14 @@ class MusicMatchingEngine:
             return ""
         # Use normalize_string first to get abbreviation expansion, then strip to core
         normalized = self.normalize_string(text)
-        return re.sub(r'[^a-z0-9]', '', normalized)
+        return _NON_CORE_RE.sub('', normalized)
 
     def clean_title(self, title: str) -> str:
         """Cleans title by removing common extra info using regex for fuzzy matching."""
         cleaned = title
         
-        for pattern in self.title_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE).strip()
+        for pattern in self._title_res:
+            cleaned = pattern.sub('', cleaned).strip()
         
         return self.normalize_string(cleaned)
     
@@ -115,8 +137,8 @@ class MusicMatchingEngine:
         """Cleans artist name by removing featured artists and other noise."""
         cleaned = artist
         
-        for pattern in self.artist_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE).strip()
+        for pattern in self._artist_res:
+            cleaned = pattern.sub('', cleaned).strip()
         
         return self.normalize_string(cleaned)
     
@@ -170,6 +192,18 @@ class MusicMatchingEngine:
         if str1 == str2:
             return 1.0
 
+        # Matching scores the same artist/title pairs across many tracks; reuse earlier results
+        key = (str1, str2)
+        score = self._similarity_cache.get(key)
+        if score is None:
+            score = self._compute_similarity_score(str1, str2)
+            if len(self._similarity_cache) >= _SIMILARITY_CACHE_SIZE:
+                self._similarity_cache.clear()
+            self._similarity_cache[key] = score
+        return score
+
+    def _compute_similarity_score(self, str1: str, str2: str) -> float:
+        """Uncached similarity_score for two distinct, non-empty strings"""
         # Standard similarity
         standard_ratio = SequenceMatcher(None, str1, str2).ratio()
 
@@ -299,7 +333,129 @@ class MusicMatchingEngine:
             confidence=best_confidence,
             match_type=best_match_type
         )
-    
+
+    def build_track_index(self, plex_tracks: List[PlexTrackInfo]) -> Tuple[Dict[Tuple[str, str], PlexTrackInfo], Dict[str, List[PlexTrackInfo]]]:
+        """
+        Indexes library tracks for match_playlist_tracks.
+        Returns ({(artist, title): track}, {artist: [tracks]}) keyed by normalized strings.
+        """
+        exact_index: Dict[Tuple[str, str], PlexTrackInfo] = {}
+        artist_index: Dict[str, List[PlexTrackInfo]] = defaultdict(list)
+
+        for plex_track in plex_tracks:
+            artist_key = self.normalize_string(plex_track.artist)
+            exact_index.setdefault((artist_key, self.normalize_string(plex_track.title)), plex_track)
+            artist_index[artist_key].append(plex_track)
+
+        return exact_index, artist_index
+
+    def match_playlist_tracks(self, spotify_tracks: List[SpotifyTrack], plex_tracks: List[PlexTrackInfo],
+                              track_index: Optional[Tuple[Dict, Dict]] = None,
+                              fuzzy_limit: Optional[int] = None) -> List[MatchResult]:
+        """
+        Matches each Spotify track against the library.
+        Exact artist/title hits skip scoring; other tracks are only scored against the same artist's tracks,
+        falling back to the whole library when the artist isn't in it.
+        Tracks past the first fuzzy_limit only get the exact lookup and are otherwise reported as "not_checked".
+        """
+        exact_index, artist_index = track_index if track_index is not None else self.build_track_index(plex_tracks)
+        results = []
+        title_lookup = None  # _build_title_lookup(plex_tracks), built on the first whole-library fallback
+
+        for position, spotify_track in enumerate(spotify_tracks):
+            title_key = self.normalize_string(spotify_track.name)
+            artist_keys = [self.normalize_string(artist) for artist in spotify_track.artists if artist]
+
+            exact_hit = next((exact_index[(artist_key, title_key)] for artist_key in artist_keys
+                              if (artist_key, title_key) in exact_index), None)
+            if exact_hit is not None:
+                confidence, match_type = self.calculate_match_confidence(spotify_track, exact_hit)
+                results.append(MatchResult(spotify_track, exact_hit, confidence, match_type))
+                continue
+
+            if fuzzy_limit is not None and position >= fuzzy_limit:
+                results.append(MatchResult(spotify_track, None, 0.0, "not_checked"))
+                continue
+
+            candidates = [plex_track for artist_key in dict.fromkeys(artist_keys)
+                          for plex_track in artist_index.get(artist_key, ())]
+            prefiltered = False
+            if not candidates:
+                candidates = plex_tracks
+                if _rf_process is not None and plex_tracks:
+                    prefiltered = True
+                    if title_lookup is None:
+                        title_lookup = self._build_title_lookup(plex_tracks)
+                    # Keep library order so ties resolve as in a full scan
+                    candidates = [plex_tracks[i] for i in sorted(self._title_candidates(spotify_track, title_lookup))]
+            result = self.find_best_match(spotify_track, candidates)
+            if prefiltered and result.plex_track is None:
+                # No library title can reach the threshold; score the closest one so the track is still
+                # reported as a low-confidence match, as in a full scan, rather than as having no match
+                _, _, closest = _rf_process.extractOne(self.clean_title(spotify_track.name), title_lookup[0],
+                                                       scorer=_rf_fuzz.ratio)
+                result = self.find_best_match(spotify_track, [plex_tracks[closest]])
+            results.append(result)
+
+        return results
+
+    def _build_title_lookup(self, plex_tracks: List[PlexTrackInfo]) -> Tuple[List[str], Dict[str, List[int]], Dict[str, List[int]], List[int]]:
+        """Library title forms used by _title_candidates: (cleaned titles, core title -> positions,
+        cleaned title -> positions, positions of cleaned titles mentioning a remaster)"""
+        cleaned_titles = [self.clean_title(plex_track.title) for plex_track in plex_tracks]
+        by_core: Dict[str, List[int]] = defaultdict(list)
+        by_cleaned: Dict[str, List[int]] = defaultdict(list)
+        for i, plex_track in enumerate(plex_tracks):
+            by_core[self.get_core_string(plex_track.title)].append(i)
+            by_cleaned[cleaned_titles[i]].append(i)
+        remasters = [i for i, title in enumerate(cleaned_titles) if 'remaster' in title]
+        return cleaned_titles, by_core, by_cleaned, remasters
+
+    def _title_candidates(self, spotify_track: SpotifyTrack, title_lookup: Tuple) -> set:
+        """Positions of every library track whose title could still reach the match threshold in calculate_match_confidence"""
+        cleaned_titles, by_core, by_cleaned, remasters = title_lookup
+        query = self.clean_title(spotify_track.name)
+
+        # Standard match: title similarity of at least 2/3
+        positions = {i for _, _, i in _rf_process.extract(query, cleaned_titles, scorer=_rf_fuzz.ratio,
+                                                          score_cutoff=_FALLBACK_TITLE_CUTOFF, limit=None)}
+
+        # Core title match, whatever the edit distance of the cleaned titles
+        core_title = self.get_core_string(spotify_track.name)
+        if core_title:
+            positions.update(by_core.get(core_title, ()))
+
+        # similarity_score rates "title" against "title ... remaster" 0.75 regardless of length
+        if 'remaster' in query:
+            for end in range(len(query)):
+                positions.update(by_cleaned.get(query[:end], ()))
+        positions.update(i for i in remasters if cleaned_titles[i].startswith(query))
+
+        return positions
+
+    def get_match_statistics(self, match_results: List[MatchResult]) -> Dict[str, Any]:
+        """Summarizes match_playlist_tracks results."""
+        total_tracks = len(match_results)
+        matched_tracks = sum(1 for result in match_results if result.is_match)
+
+        confidence_distribution = {"high": 0, "medium": 0, "low": 0, "none": 0}
+        for result in match_results:
+            if result.plex_track is None:
+                confidence_distribution["none"] += 1
+            elif result.confidence >= 0.9:
+                confidence_distribution["high"] += 1
+            elif result.confidence >= 0.8:
+                confidence_distribution["medium"] += 1
+            else:
+                confidence_distribution["low"] += 1
+
+        return {
+            "total_tracks": total_tracks,
+            "matched_tracks": matched_tracks,
+            "match_percentage": (matched_tracks / total_tracks * 100) if total_tracks else 0.0,
+            "confidence_distribution": confidence_distribution
+        }
+
     def detect_album_in_title(self, track_title: str, album_name: str = None) -> Tuple[str, bool]:
         """
         Detect if album name appears in track title and return cleaned version.
@@ -1,7 +1,7 @@
 import requests
 import hashlib
 import secrets
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 import json
@@ -762,24 +762,57 @@ class NavidromeClient:
             search_result = response.get('searchResult3', {})
 
             for track_data in search_result.get('song', []):
-                track_info = NavidromeTrackInfo(
-                    id=track_data.get('id', ''),
-                    title=track_data.get('title', ''),
-                    artist=track_data.get('artist', ''),
-                    album=track_data.get('album', ''),
-                    duration=track_data.get('duration', 0) * 1000,  # Convert to milliseconds
-                    track_number=track_data.get('track'),
-                    year=track_data.get('year'),
-                    rating=track_data.get('userRating')
-                )
-
-                # Store reference to original track for playlist creation
-                track_info._original_navidrome_track = NavidromeTrack(track_data, self)
-                tracks.append(track_info)
+                tracks.append(self._track_info_from_song(track_data))
 
             logger.info(f"Found {len(tracks)} tracks for '{title}' by '{artist}'")
             return tracks
 
         except Exception as e:
             logger.error(f"Error searching for tracks: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def iter_tracks(self, page_size: int = 500) -> Iterator[List[NavidromeTrackInfo]]:
+        """Yield the whole library one page of tracks at a time (empty search3 query, paged by songOffset).
+        A failed page request raises, so a partial listing is never mistaken for the whole library."""
+        if not self.ensure_connection():
+            logger.warning("Navidrome not connected. Cannot list tracks.")
+            return
+
+        offset = 0
+        while True:
+            response = self._make_request('search3', {
+                'query': '',
+                'songCount': page_size,
+                'songOffset': offset,
+                'artistCount': 0,
+                'albumCount': 0
+            })
+            if response is None:
+                # _make_request has already logged the cause
+                raise RuntimeError(f"Error listing Navidrome tracks at offset {offset}")
+
+            songs = response.get('searchResult3', {}).get('song', [])
+            if not songs:
+                return
+
+            yield [self._track_info_from_song(track_data) for track_data in songs]
+
+            if len(songs) < page_size:
+                return
+            offset += page_size
+
+    def _track_info_from_song(self, track_data: Dict[str, Any]) -> NavidromeTrackInfo:
+        track_info = NavidromeTrackInfo(
+            id=track_data.get('id', ''),
+            title=track_data.get('title', ''),
+            artist=track_data.get('artist', ''),
+            album=track_data.get('album', ''),
+            duration=track_data.get('duration', 0) * 1000,  # Convert to milliseconds
+            track_number=track_data.get('track'),
+            year=track_data.get('year'),
+            rating=track_data.get('userRating')
+        )
+
+        # Store reference to original track for playlist creation
+        track_info._original_navidrome_track = NavidromeTrack(track_data, self)
+        return track_info
\ No newline at end of file
@@ -3,7 +3,7 @@ from plexapi.library import LibrarySection, MusicSection
 from plexapi.audio import Track as PlexTrack, Album as PlexAlbum, Artist as PlexArtist
 from plexapi.playlist import Playlist as PlexPlaylist
 from plexapi.exceptions import PlexApiException, NotFound
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from dataclasses import dataclass
 import requests
 from datetime import datetime, timedelta
@@ -598,6 +598,46 @@ class PlexClient:
 
 
 
+    def iter_tracks(self, page_size: int = 500) -> Iterator[List[PlexTrackInfo]]:
+        """Yield every track in the music library one page at a time.
+        A failed page request raises, so a partial listing is never mistaken for the whole library."""
+        if not self.music_library:
+            logger.warning("Plex music library not found. Cannot list tracks.")
+            return
+
+        offset = 0
+        while True:
+            try:
+                page = self.music_library.searchTracks(container_start=offset, container_size=page_size, maxresults=page_size)
+            except Exception as e:
+                logger.error(f"Error listing tracks at offset {offset}: {e}")
+                raise
+
+            if not page:
+                return
+
+            tracks = []
+            for track in page:
+                # Artist/album titles come with the listing; from_plex_track would fetch both per track
+                track_info = PlexTrackInfo(
+                    id=str(track.ratingKey),
+                    title=track.title,
+                    artist=track.grandparentTitle or "Unknown Artist",
+                    album=track.parentTitle or "Unknown Album",
+                    duration=track.duration,
+                    track_number=track.trackNumber,
+                    year=track.year,
+                    rating=track.userRating
+                )
+                # Store reference to original track for playlist creation
+                track_info._original_plex_track = track
+                tracks.append(track_info)
+            yield tracks
+
+            if len(page) < page_size:
+                return
+            offset += page_size
+
     def get_library_stats(self) -> Dict[str, int]:
         if not self.music_library:
             return {}
@@ -2,7 +2,8 @@ import requests
 import asyncio
 import aiohttp
 import os
-from typing import List, Optional, Dict, Any
+from collections import deque
+from typing import List, Optional, Dict, Any, Deque
 from dataclasses import dataclass
 import time
 from pathlib import Path
@@ -208,7 +209,7 @@ class SoulseekClient:
         self.active_searches: Dict[str, bool] = {}  # search_id -> still_active
         
         # Rate limiting for searches
-        self.search_timestamps: List[float] = []  # Track search timestamps
+        self.search_timestamps: Deque[float] = deque()  # Track search timestamps (oldest first)
         self.max_searches_per_window = 35  # Conservative limit to prevent Soulseek bans
         self.rate_limit_window = 220  # seconds (3 minutes 40 seconds)
         
@@ -247,15 +248,17 @@ class SoulseekClient:
     
     def _clean_old_timestamps(self):
         """Remove timestamps older than the rate limit window"""
-        current_time = time.time()
-        cutoff_time = current_time - self.rate_limit_window
-        self.search_timestamps = [ts for ts in self.search_timestamps if ts > cutoff_time]
+        cutoff_time = time.time() - self.rate_limit_window
+        # Timestamps are appended in time order, so expired ones are always at the left end
+        while self.search_timestamps and self.search_timestamps[0] <= cutoff_time:
+            self.search_timestamps.popleft()
     
     async def _wait_for_rate_limit(self):
         """Wait if necessary to respect rate limiting"""
         self._clean_old_timestamps()
         
-        if len(self.search_timestamps) >= self.max_searches_per_window:
+        # Loop rather than wait once: concurrent searches waking together must re-check the window
+        while len(self.search_timestamps) >= self.max_searches_per_window:
             # Calculate how long to wait
             oldest_timestamp = self.search_timestamps[0]
             wait_time = oldest_timestamp + self.rate_limit_window - time.time()
@@ -263,8 +266,8 @@ class SoulseekClient:
             if wait_time > 0:
                 logger.info(f"Rate limit reached ({len(self.search_timestamps)}/{self.max_searches_per_window} searches). Waiting {wait_time:.1f} seconds...")
                 await asyncio.sleep(wait_time)
-                # Clean up again after waiting
-                self._clean_old_timestamps()
+            # Clean up again after waiting
+            self._clean_old_timestamps()
         
         # Record this search attempt
         self.search_timestamps.append(time.time())
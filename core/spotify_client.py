@@ -58,11 +58,17 @@ class Track:
     artists: List[str]
     album: str
     duration_ms: int
-    popularity: int
+    popularity: int = 0
     preview_url: Optional[str] = None
     external_urls: Optional[Dict[str, str]] = None
     image_url: Optional[str] = None
 
+    def __post_init__(self):
+        # Tracks rebuilt from web/JSON payloads may carry Spotify artist objects; keep display names only
+        if self.artists and not all(isinstance(artist, str) for artist in self.artists):
+            self.artists = [artist['name'] if isinstance(artist, dict) and 'name' in artist else str(artist)
+                            for artist in self.artists]
+
     @classmethod
     def from_spotify_track(cls, track_data: Dict[str, Any]) -> 'Track':
         # Extract album image (medium size preferred)
@@ -1520,6 +1520,7 @@ class WatchlistScanner:
                         limit=20
                     )
 
+                    recent_albums = []
                     for album in albums:
                         try:
                             albums_checked += 1
@@ -1537,13 +1538,15 @@ class WatchlistScanner:
                                             'release_date': release_str,
                                             'album_type': album.album_type if hasattr(album, 'album_type') else 'album'
                                         }
-                                        if self.database.cache_discovery_recent_album(album_data):
-                                            cached_count += 1
-                                            logger.debug(f"Cached recent album: {album.name} by {artist.artist_name} ({release_str})")
+                                        recent_albums.append(album_data)
+                                        logger.debug(f"Found recent album: {album.name} by {artist.artist_name} ({release_str})")
                         except Exception as e:
                             logger.warning(f"Error checking album for recent releases: {e}")
                             continue
 
+                    # One write per artist instead of one per album
+                    cached_count += self.database.cache_discovery_recent_albums(recent_albums)
+
                 except Exception as e:
                     logger.debug(f"Error fetching albums for watchlist artist {artist.artist_name}: {e}")
                     continue
@@ -1560,6 +1563,7 @@ class WatchlistScanner:
                         limit=20
                     )
 
+                    recent_albums = []
                     for album in albums:
                         try:
                             albums_checked += 1
@@ -1577,13 +1581,15 @@ class WatchlistScanner:
                                             'release_date': release_str,
                                             'album_type': album.album_type if hasattr(album, 'album_type') else 'album'
                                         }
-                                        if self.database.cache_discovery_recent_album(album_data):
-                                            cached_count += 1
-                                            logger.debug(f"Cached recent album: {album.name} by {artist.similar_artist_name} ({release_str})")
+                                        recent_albums.append(album_data)
+                                        logger.debug(f"Found recent album: {album.name} by {artist.similar_artist_name} ({release_str})")
                         except Exception as e:
                             logger.warning(f"Error checking album for recent releases: {e}")
                             continue
 
+                    # One write per artist instead of one per album
+                    cached_count += self.database.cache_discovery_recent_albums(recent_albums)
+
                 except Exception as e:
                     logger.debug(f"Error fetching albums for similar artist {artist.similar_artist_name}: {e}")
                     continue
@@ -1712,11 +1718,13 @@ class WatchlistScanner:
                 release_radar_tracks = [track['id'] for track in top_tracks[:50]]
                 release_radar_track_data = top_tracks[:50]
 
-                # Add Release Radar tracks to discovery pool so they're available for fast lookup
-                logger.info(f"Adding {len(release_radar_track_data)} Release Radar tracks to discovery pool...")
+                # Add Release Radar tracks to discovery pool so they're available for fast lookup;
+                # tracks are formatted here and inserted together in one batch below
+                logger.info(f"Preparing {len(release_radar_track_data)} Release Radar tracks for discovery pool...")
 
                 # Cache genres by artist_id to avoid duplicate API calls
                 artist_genres_cache = {}
+                formatted_tracks = []
 
                 for track_data in release_radar_track_data:
                     try:
@@ -1752,18 +1760,22 @@ class WatchlistScanner:
                             'track_data_json': track_data,
                             'artist_genres': artist_genres
                         }
-                        self.database.add_to_discovery_pool(formatted_track)
+                        formatted_tracks.append(formatted_track)
                     except Exception as e:
-                        logger.warning(f"Failed to add track {track_data['name']} to discovery pool: {e}")
+                        logger.warning(f"Skipping Release Radar track {track_data.get('name')} for discovery pool batch: {e}")
                         continue
 
+                added_count = self.database.add_many_to_discovery_pool(formatted_tracks)
+                logger.info(f"Added {added_count} of {len(formatted_tracks)} Release Radar tracks to discovery pool in one batch")
+
             self.database.save_curated_playlist('release_radar', release_radar_tracks)
             logger.info(f"Release Radar curated: {len(release_radar_tracks)} tracks")
 
             # 2. Curate Discovery Weekly - 50 tracks from full discovery pool
             # IMPROVED: Spotify-style algorithm with balanced mix of popular, mid-tier, and deep cuts
             logger.info("Curating Discovery Weekly playlist...")
-            discovery_tracks = self.database.get_discovery_pool_tracks(limit=2000, new_releases_only=False)
+            discovery_tracks = self.database.get_discovery_pool_tracks(limit=2000, new_releases_only=False,
+                                                                      include_track_data=False)
 
             discovery_weekly_tracks = []
             if discovery_tracks:
@@ -4,7 +4,7 @@
 Wishlist Service - High-level service for managing failed download track wishlist
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from database.music_database import get_database
 from utils.logging_config import get_logger
@@ -99,6 +99,27 @@ class WishlistService:
             source_info=source_context or {}
         )
     
+    def add_spotify_tracks_to_wishlist(self, spotify_tracks_data: List[Dict[str, Any]], failure_reason: str,
+                                       source_type: str = "manual", source_context: Dict[str, Any] = None) -> int:
+        """
+        Add several Spotify tracks to the wishlist in a single database transaction.
+        
+        Args:
+            spotify_tracks_data: Full Spotify track data dictionaries
+            failure_reason: Reason for the failure
+            source_type: Source type ('playlist', 'album', 'manual')
+            source_context: Additional context information shared by all tracks
+        
+        Returns:
+            Number of tracks added (duplicates are skipped)
+        """
+        return self.database.add_tracks_to_wishlist(
+            spotify_tracks_data=spotify_tracks_data,
+            failure_reason=failure_reason,
+            source_type=source_type,
+            source_info=source_context or {}
+        )
+    
     def get_wishlist_tracks_for_download(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get wishlist tracks formatted for the download modal.
@@ -184,6 +205,18 @@ class WishlistService:
             error_message: Error message if failed
         """
         return self.database.update_wishlist_retry(spotify_track_id, success, error_message)
+
+    def mark_track_download_results(self, results: List[Tuple[str, bool, Optional[str]]]) -> int:
+        """
+        Mark the results of several download attempts in a single database transaction.
+        
+        Args:
+            results: (spotify_track_id, success, error_message) tuples
+        
+        Returns:
+            Number of wishlist entries removed or updated
+        """
+        return self.database.update_wishlist_retries(results)
     
     def remove_track_from_wishlist(self, spotify_track_id: str) -> bool:
         """Remove a track from the wishlist (typically after successful download)"""
@@ -255,14 +288,11 @@ class WishlistService:
                     'recent_failures': []
                 }
             
-            # Get detailed breakdown
-            wishlist_tracks = self.database.get_wishlist_tracks()
-            
-            # Group by source type
+            # Get detailed breakdown (streamed - the summary only needs a single pass)
             by_source_type = {}
             recent_failures = []
             
-            for track in wishlist_tracks:
+            for track in self.database.iter_wishlist_tracks():
                 source_type = track['source_type']
                 by_source_type[source_type] = by_source_type.get(source_type, 0) + 1
                 
@@ -4,17 +4,48 @@ import sqlite3
 import json
 import logging
 import os
+import queue
 import re
 import threading
 import time
-from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+import unicodedata
+import weakref
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 from utils.logging_config import get_logger
 
 logger = get_logger("music_database")
 
+try:
+    from unidecode import unidecode
+except ImportError:
+    unidecode = None
+    logger.warning("unidecode not available, accent matching may be limited")
+
+# orjson is an optional speedup for the per-row JSON in wishlist/discovery paths
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# rapidfuzz computes the fallback edit distance in C; the pure-Python loop is used without it
+try:
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:
+    _Levenshtein = None
+
 # Import matching engine for enhanced similarity logic
 try:
     from core.matching_engine import MusicMatchingEngine
@@ -22,8 +53,319 @@ try:
 except ImportError:
     logger.warning("Could not import MusicMatchingEngine, falling back to basic similarity")
     _matching_engine = None
-# Temporarily enable debug logging for edition matching
-logger.setLevel(logging.DEBUG)
+
+def _levenshtein_distance(s1: str, s2: str) -> int:
+    """Pure-Python edit distance (used when rapidfuzz is unavailable)"""
+    # A shared prefix or suffix never changes the distance, so only the differing middle goes through the DP
+    len1, len2 = len(s1), len(s2)
+    start = 0
+    while start < len1 and start < len2 and s1[start] == s2[start]:
+        start += 1
+    while len1 > start and len2 > start and s1[len1 - 1] == s2[len2 - 1]:
+        len1 -= 1
+        len2 -= 1
+    s1, s2 = s1[start:len1], s2[start:len2]
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if not s2:
+        return len(s1)
+
+    # Two-row DP over the shorter string
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        current_row = [i]
+        left = i
+        for j, c2 in enumerate(s2):
+            left = min(previous_row[j + 1] + 1, left + 1, previous_row[j] + (c1 != c2))
+            current_row.append(left)
+        previous_row = current_row
+    return previous_row[-1]
+
+# Below this artist similarity a track/album candidate can never reach a match threshold
+_MIN_ARTIST_SIMILARITY = 0.2
+
+# Noise removed by _clean_track_title_for_comparison, compiled once (applied in order, case-insensitive)
+_TRACK_TITLE_NOISE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Basic markers (content/parental ratings)
+    r'\s*explicit\s*',      # Remove explicit markers
+    r'\s*clean\s*',         # Remove clean markers
+
+    # Featuring/collaboration (metadata, not different version)
+    r'\s*feat\..*',         # Remove featuring
+    r'\s*featuring.*',      # Remove featuring
+    r'\s*ft\..*',           # Remove ft.
+    r'\s*with\s+.*',        # Remove "with Artist"
+
+    # Edit versions (same recording, different edit for format)
+    r'\s*radio\s+edit.*',   # Remove "radio edit" - same song, radio format
+    r'\s*single\s+edit.*',  # Remove "single edit" - same song, single format
+    r'\s*album\s+edit.*',   # Remove "album edit" - same song, album format
+    r'\s*edit\s*$',         # Remove trailing "edit"
+
+    # Remasters (same recording, different mastering)
+    r'\s*\d{4}\s*remaster.*',  # Remove "2015 remaster"
+    r'\s*remaster.*',       # Remove "remaster/remastered"
+    r'\s*remastered.*',     # Remove "remastered"
+
+    # Version clarifications (metadata, not different recordings)
+    r'\s*original\s+version.*',  # Remove "original version" - clarification
+    r'\s*album\s+version.*',     # Remove "album version" - clarification
+    r'\s*single\s+version.*',    # Remove "single version" - clarification
+    r'\s*version\s*$',           # Remove trailing "version"
+
+    # Soundtrack/source info (metadata about source)
+    r'\s*from\s+.*soundtrack.*', # Remove "from ... soundtrack"
+    r'\s*from\s+".*".*',         # Remove "from 'Movie Title'"
+    r'\s*soundtrack.*',          # Remove "soundtrack"
+))
+_TITLE_OPEN_BRACKET_RE = re.compile(r'\s*[\[\(]\s*')
+_TITLE_CLOSE_BRACKET_RE = re.compile(r'\s*[\]\)]\s*')
+_TITLE_DASH_RE = re.compile(r'\s*-\s*')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Bump whenever _clean_*_for_comparison or _normalize_for_comparison change so the
+# materialized title_cleaned/title_normalized/name_normalized columns get recomputed
+_NORMALIZED_COLUMNS_VERSION = "2"
+
+def _convert_json(value: bytes):
+    """sqlite3 converter for columns selected as "name [JSON]"; empty or undecodable values become None"""
+    if not value.strip():
+        return None
+    try:
+        return _json_loads(value)
+    except (ValueError, UnicodeDecodeError) as e:
+        logger.error(f"Error decoding JSON column: {e}")
+        return None
+
+sqlite3.register_converter("JSON", _convert_json)
+
+def _convert_datetime(value: bytes) -> Optional[datetime]:
+    """sqlite3 converter for columns selected as "name [DATETIME]" (CURRENT_TIMESTAMP text);
+    empty or malformed values become None"""
+    try:
+        return datetime.fromisoformat(value.decode())
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+sqlite3.register_converter("DATETIME", _convert_datetime)
+
+# UPSERT (INSERT ... ON CONFLICT DO UPDATE) requires SQLite 3.24+
+_SQLITE_SUPPORTS_UPSERT = sqlite3.sqlite_version_info >= (3, 24, 0)
+
+# Max ids per "IN (?, ?, ...)" statement (SQLite builds before 3.32 allow 999 bound variables)
+_SQL_IN_BATCH_SIZE = 900
+
+# Prepared statements kept per connection by sqlite3 (its default is 128)
+_SQLITE_CACHED_STATEMENTS = 256
+
+# Seconds a database file size read stays valid for the database info display
+_DATABASE_SIZE_CACHE_TTL = 5.0
+
+# Built once so hot insert paths hand sqlite3 the identical string (and hit its statement cache)
+_SQL_INSERT_RECENT_RELEASE = """
+    INSERT OR IGNORE INTO recent_releases
+    (watchlist_artist_id, album_spotify_id, album_name, release_date, album_cover_url, track_count, added_date)
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+_SQL_INSERT_DISCOVERY_POOL = f"""
+    {"INSERT INTO" if _SQLITE_SUPPORTS_UPSERT else "INSERT OR IGNORE INTO"} discovery_pool
+    (spotify_track_id, spotify_album_id, spotify_artist_id, track_name, artist_name,
+     album_name, album_cover_url, duration_ms, popularity, release_date,
+     is_new_release, track_data_json, artist_genres, added_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    {"ON CONFLICT(spotify_track_id) DO NOTHING" if _SQLITE_SUPPORTS_UPSERT else ""}
+"""
+
+# Predefined quality presets - treat as read-only, hand out copies via _copy_quality_profile()
+_QUALITY_PRESETS = {
+    "audiophile": {
+        "version": 1,
+        "preset": "audiophile",
+        "qualities": {
+            "flac": {"enabled": True, "min_mb": 0, "max_mb": 200, "priority": 1},
+            "mp3_320": {"enabled": False, "min_mb": 0, "max_mb": 20, "priority": 2},
+            "mp3_256": {"enabled": False, "min_mb": 0, "max_mb": 15, "priority": 3},
+            "mp3_192": {"enabled": False, "min_mb": 0, "max_mb": 12, "priority": 4}
+        },
+        "fallback_enabled": False
+    },
+    "balanced": {
+        "version": 1,
+        "preset": "balanced",
+        "qualities": {
+            "flac": {"enabled": True, "min_mb": 0, "max_mb": 150, "priority": 1},
+            "mp3_320": {"enabled": True, "min_mb": 0, "max_mb": 20, "priority": 2},
+            "mp3_256": {"enabled": True, "min_mb": 0, "max_mb": 15, "priority": 3},
+            "mp3_192": {"enabled": False, "min_mb": 0, "max_mb": 12, "priority": 4}
+        },
+        "fallback_enabled": True
+    },
+    "space_saver": {
+        "version": 1,
+        "preset": "space_saver",
+        "qualities": {
+            "flac": {"enabled": False, "min_mb": 0, "max_mb": 150, "priority": 4},
+            "mp3_320": {"enabled": True, "min_mb": 0, "max_mb": 15, "priority": 1},
+            "mp3_256": {"enabled": True, "min_mb": 0, "max_mb": 12, "priority": 2},
+            "mp3_192": {"enabled": True, "min_mb": 0, "max_mb": 10, "priority": 3}
+        },
+        "fallback_enabled": True
+    }
+}
+
+def _copy_quality_profile(profile: dict) -> dict:
+    """Copy a preset's two nesting levels so callers can't mutate the shared constant"""
+    copied = dict(profile)
+    copied["qualities"] = {name: dict(settings) for name, settings in profile["qualities"].items()}
+    return copied
+
+@lru_cache(maxsize=None)
+def _build_library_artists_query(search_kind: str, letter_kind: str) -> Tuple[str, str]:
+    """Build the (page, count) SQL for iter_library_artists once per filter shape.
+
+    search_kind is '' (no search), 'like' (LIKE scan) or 'fts' (artists_fts candidates
+    re-checked with the same LIKE). letter_kind is '' (no letter filter), '#' (non A-Z
+    first character) or 'letter'. Parameters bind in a fixed order: FTS phrase, search
+    pattern, letter, server_source, then LIMIT/OFFSET.
+    """
+    where_conditions = []
+
+    if search_kind == "fts":
+        # Trigram matches are a superset of the ASCII case-insensitive LIKE below
+        where_conditions.append("a.rowid IN (SELECT rowid FROM artists_fts WHERE artists_fts MATCH ?)")
+    if search_kind:
+        where_conditions.append("LOWER(name) LIKE LOWER(?)")
+
+    if letter_kind == "#":
+        # Numbers and special characters (two range seeks on idx_artists_server_first_letter)
+        where_conditions.append("(UPPER(SUBSTR(name, 1, 1)) < 'A' OR UPPER(SUBSTR(name, 1, 1)) > 'Z')")
+    elif letter_kind:
+        # Specific letter
+        where_conditions.append("UPPER(SUBSTR(name, 1, 1)) = UPPER(?)")
+
+    # Active server filter. With FTS candidates the unary + keeps the planner driving from the
+    # rowid IN (...) list rather than scanning every artist of the server through its index.
+    where_conditions.append("+a.server_source = ?" if search_kind == "fts" else "a.server_source = ?")
+
+    where_clause = " AND ".join(where_conditions)
+
+    # Page the artists first (idx_artists_server_name serves the filter + ORDER BY),
+    # then count albums/tracks for just that page. The window total is computed over
+    # the filtered set before LIMIT, so it is the same count the pager needs.
+    artists_query = f"""
+        WITH paged AS (
+            SELECT a.id, a.name, a.thumb_url, a.genres, COUNT(*) OVER () as total_count
+            FROM artists a
+            WHERE {where_clause}
+            ORDER BY a.name COLLATE NOCASE, a.id
+            LIMIT ? OFFSET ?
+        )
+        SELECT
+            p.id,
+            p.name,
+            p.thumb_url,
+            p.genres AS "genres [JSON]",
+            (SELECT COUNT(*) FROM albums al WHERE al.artist_id = p.id) as album_count,
+            (SELECT COUNT(*) FROM tracks t JOIN albums al ON t.album_id = al.id
+             WHERE al.artist_id = p.id) as track_count,
+            p.total_count
+        FROM paged p
+        ORDER BY p.name COLLATE NOCASE, p.id
+    """
+    count_query = f"SELECT COUNT(*) FROM artists a WHERE {where_clause}"
+    return artists_query, count_query
+
+# Comma-separated fragments of a legacy genres string, split in one regex pass
+_GENRE_RE = re.compile(r'[^,]+')
+
+# Idle connections kept per database file; busier moments open extra connections that are
+# closed on release instead of blocking callers (nested _get_connection() calls must not deadlock)
+_CONNECTION_POOL_SIZE = min((os.cpu_count() or 1) * 2, 16)
+
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that goes back to its pool instead of being thrown away.
+    Leaving a `with` block (commit/rollback as usual) or calling close() releases it."""
+
+    _pool: Optional["_ConnectionPool"] = None
+    _checked_out = False
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            return super().__exit__(exc_type, exc_value, traceback)
+        finally:
+            self._release()
+
+    def close(self):
+        if self._pool is not None:
+            self._release()
+        else:
+            super().close()
+
+    def _release(self):
+        if self._checked_out:
+            self._checked_out = False
+            self._pool.release(self)
+
+class _ConnectionPool:
+    """Thread-safe pool of configured SQLite connections to one database file"""
+
+    def __init__(self, database_path: str, max_idle: int = _CONNECTION_POOL_SIZE):
+        self.database_path = database_path
+        self._idle: "queue.LifoQueue[_PooledConnection]" = queue.LifoQueue(maxsize=max_idle)
+
+    def _open(self) -> _PooledConnection:
+        # PARSE_COLNAMES only: decltype parsing would turn TIMESTAMP columns into datetimes
+        connection = sqlite3.connect(self.database_path, timeout=30.0, detect_types=sqlite3.PARSE_COLNAMES,
+                                     cached_statements=_SQLITE_CACHED_STATEMENTS, check_same_thread=False,
+                                     factory=_PooledConnection)
+        connection.row_factory = sqlite3.Row
+        # Enable foreign key constraints and WAL mode for better concurrency
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")  # Safe with WAL, avoids an fsync per commit
+        connection.execute("PRAGMA busy_timeout = 30000")  # 30 second timeout
+        # Read-heavy library pages: 64 MiB page cache, memory-mapped reads, in-memory temp b-trees
+        connection.execute("PRAGMA cache_size = -65536")
+        connection.execute("PRAGMA mmap_size = 536870912")
+        connection.execute("PRAGMA temp_store = MEMORY")
+        connection._pool = self
+        return connection
+
+    def acquire(self) -> _PooledConnection:
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._open()
+        connection._checked_out = True
+        return connection
+
+    def release(self, connection: _PooledConnection):
+        try:
+            if connection.in_transaction:
+                # Same outcome as closing a connection with uncommitted changes
+                connection.rollback()
+            self._idle.put_nowait(connection)
+        except (queue.Full, sqlite3.Error):
+            sqlite3.Connection.close(connection)
+
+    def close_all(self):
+        while True:
+            try:
+                sqlite3.Connection.close(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+_connection_pools: Dict[str, _ConnectionPool] = {}  # Resolved database path -> pool
+_connection_pools_lock = threading.Lock()
+
+def _get_connection_pool(key: str) -> _ConnectionPool:
+    """Return the shared connection pool for a resolved database path, creating it on first use"""
+    pool = _connection_pools.get(key)
+    if pool is None:
+        with _connection_pools_lock:
+            pool = _connection_pools.setdefault(key, _ConnectionPool(key))
+    return pool
 
 @dataclass
 class DatabaseArtist:
@@ -123,6 +465,16 @@ class DiscoveryTrack:
     track_data_json: str  # Full Spotify track object for modal
     added_date: datetime
 
+    @cached_property
+    def track_data(self) -> Optional[Dict[str, Any]]:
+        """Parsed track_data_json, decoded on first access only (None if missing or invalid)"""
+        if not self.track_data_json:
+            return None
+        try:
+            return _json_loads(self.track_data_json)
+        except ValueError:
+            return None
+
 @dataclass
 class RecentRelease:
     """Recent album release from watchlist artist"""
@@ -133,155 +485,175 @@ class RecentRelease:
     release_date: str
     album_cover_url: Optional[str]
     track_count: int
-    added_date: datetime
+    added_date: str  # CURRENT_TIMESTAMP text (UTC, "YYYY-MM-DD HH:MM:SS"), ordered in SQL
 
 class MusicDatabase:
     """SQLite database manager for SoulSync music library data"""
     
     def __init__(self, database_path: str = None):
-        import os
         # Use env var if path is None OR if it's the default path
         # This ensures Docker containers use the correct mounted volume location
         if database_path is None or database_path == "database/music_library.db":
             database_path = os.environ.get('DATABASE_PATH', 'database/music_library.db')
         self.database_path = Path(database_path)
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        # Resolved once; the connection pool is shared per resolved path
+        self._pool_key = str(self.database_path.resolve())
+
+        # watchlist_artists column names, read lazily (columns only change during migrations)
+        self._watchlist_columns: Optional[frozenset] = None
+
+        # (monotonic timestamp, size in bytes) of the last database file size read
+        self._size_cache: Optional[Tuple[float, int]] = None
         
         # Initialize database
         self._initialize_database()
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a NEW database connection for each operation (thread-safe)"""
-        connection = sqlite3.connect(str(self.database_path), timeout=30.0)
-        connection.row_factory = sqlite3.Row
-        # Enable foreign key constraints and WAL mode for better concurrency
-        connection.execute("PRAGMA foreign_keys = ON")
-        connection.execute("PRAGMA journal_mode = WAL")
-        connection.execute("PRAGMA busy_timeout = 30000")  # 30 second timeout
-        return connection
+        """Borrow a database connection from the shared pool for one operation (thread-safe).
+        It is returned when its `with` block exits or close() is called."""
+        return _get_connection_pool(self._pool_key).acquire()
     
     def _initialize_database(self):
         """Create database tables if they don't exist"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            # Artists table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS artists (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    thumb_url TEXT,
-                    genres TEXT,  -- JSON array
-                    summary TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+                # Artists table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS artists (
+                        id INTEGER PRIMARY KEY,
+                        name TEXT NOT NULL,
+                        thumb_url TEXT,
+                        genres TEXT,  -- JSON array
+                        summary TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
             
-            # Albums table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS albums (
-                    id INTEGER PRIMARY KEY,
-                    artist_id INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    year INTEGER,
-                    thumb_url TEXT,
-                    genres TEXT,  -- JSON array
-                    track_count INTEGER,
-                    duration INTEGER,  -- milliseconds
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (artist_id) REFERENCES artists (id) ON DELETE CASCADE
-                )
-            """)
+                # Albums table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS albums (
+                        id INTEGER PRIMARY KEY,
+                        artist_id INTEGER NOT NULL,
+                        title TEXT NOT NULL,
+                        year INTEGER,
+                        thumb_url TEXT,
+                        genres TEXT,  -- JSON array
+                        track_count INTEGER,
+                        duration INTEGER,  -- milliseconds
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (artist_id) REFERENCES artists (id) ON DELETE CASCADE
+                    )
+                """)
             
-            # Tracks table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tracks (
-                    id INTEGER PRIMARY KEY,
-                    album_id INTEGER NOT NULL,
-                    artist_id INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    track_number INTEGER,
-                    duration INTEGER,  -- milliseconds
-                    file_path TEXT,
-                    bitrate INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (album_id) REFERENCES albums (id) ON DELETE CASCADE,
-                    FOREIGN KEY (artist_id) REFERENCES artists (id) ON DELETE CASCADE
-                )
-            """)
+                # Tracks table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS tracks (
+                        id INTEGER PRIMARY KEY,
+                        album_id INTEGER NOT NULL,
+                        artist_id INTEGER NOT NULL,
+                        title TEXT NOT NULL,
+                        track_number INTEGER,
+                        duration INTEGER,  -- milliseconds
+                        file_path TEXT,
+                        bitrate INTEGER,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (album_id) REFERENCES albums (id) ON DELETE CASCADE,
+                        FOREIGN KEY (artist_id) REFERENCES artists (id) ON DELETE CASCADE
+                    )
+                """)
             
-            # Metadata table for storing system information like last refresh dates
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS metadata (
-                    key TEXT PRIMARY KEY,
-                    value TEXT,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+                # Metadata table for storing system information like last refresh dates
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS metadata (
+                        key TEXT PRIMARY KEY,
+                        value TEXT,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
             
-            # Wishlist table for storing failed download tracks for retry
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS wishlist_tracks (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    spotify_track_id TEXT UNIQUE NOT NULL,
-                    spotify_data TEXT NOT NULL,  -- JSON of full Spotify track data
-                    failure_reason TEXT,
-                    retry_count INTEGER DEFAULT 0,
-                    last_attempted TIMESTAMP,
-                    date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    source_type TEXT DEFAULT 'unknown',  -- 'playlist', 'album', 'manual'
-                    source_info TEXT  -- JSON of source context (playlist name, album info, etc.)
-                )
-            """)
+                # Wishlist table for storing failed download tracks for retry
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS wishlist_tracks (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        spotify_track_id TEXT UNIQUE NOT NULL,
+                        spotify_data TEXT NOT NULL,  -- JSON of full Spotify track data
+                        failure_reason TEXT,
+                        retry_count INTEGER DEFAULT 0,
+                        last_attempted TIMESTAMP,
+                        date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        source_type TEXT DEFAULT 'unknown',  -- 'playlist', 'album', 'manual'
+                        source_info TEXT  -- JSON of source context (playlist name, album info, etc.)
+                    )
+                """)
             
-            # Watchlist table for storing artists to monitor for new releases
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS watchlist_artists (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    spotify_artist_id TEXT UNIQUE NOT NULL,
-                    artist_name TEXT NOT NULL,
-                    date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_scan_timestamp TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+                # Watchlist table for storing artists to monitor for new releases
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS watchlist_artists (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        spotify_artist_id TEXT UNIQUE NOT NULL,
+                        artist_name TEXT NOT NULL,
+                        date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        last_scan_timestamp TIMESTAMP,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
 
-            # Create indexes for performance
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_albums_artist_id ON albums (artist_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_album_id ON tracks (album_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_artist_id ON tracks (artist_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_wishlist_spotify_id ON wishlist_tracks (spotify_track_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_watchlist_spotify_id ON watchlist_artists (spotify_artist_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_wishlist_date_added ON wishlist_tracks (date_added)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_artists_name ON artists (name)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_albums_title ON albums (title)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_title ON tracks (title)")
+                # Create indexes for performance
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_albums_artist_id ON albums (artist_id)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_album_id ON tracks (album_id)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_artist_id ON tracks (artist_id)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_wishlist_spotify_id ON wishlist_tracks (spotify_track_id)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_watchlist_spotify_id ON watchlist_artists (spotify_artist_id)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_wishlist_date_added ON wishlist_tracks (date_added)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_artists_name ON artists (name)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_albums_title ON albums (title)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_title ON tracks (title)")
             
-            # Add server_source columns for multi-server support (migration)
-            self._add_server_source_columns(cursor)
+                # Add server_source columns for multi-server support (migration)
+                self._add_server_source_columns(cursor)
+
+                # Migrate ID columns to support both integer (Plex) and string (Jellyfin) IDs
+                self._migrate_id_columns_to_text(cursor)
+
+                # Add discovery feature tables (migration)
+                self._add_discovery_tables(cursor)
+
+                # Add image_url column to watchlist_artists (migration)
+                self._add_watchlist_artist_image_column(cursor)
 
-            # Migrate ID columns to support both integer (Plex) and string (Jellyfin) IDs
-            self._migrate_id_columns_to_text(cursor)
+                # Add album type filter columns to watchlist_artists (migration)
+                self._add_watchlist_album_type_filters(cursor)
 
-            # Add discovery feature tables (migration)
-            self._add_discovery_tables(cursor)
+                # Add content type filter columns to watchlist_artists (migration)
+                self._add_watchlist_content_type_filters(cursor)
 
-            # Add image_url column to watchlist_artists (migration)
-            self._add_watchlist_artist_image_column(cursor)
+                # Add lowercase name/artist columns for indexed wishlist duplicate checks (migration)
+                self._add_wishlist_dedup_columns(cursor)
 
-            # Add album type filter columns to watchlist_artists (migration)
-            self._add_watchlist_album_type_filters(cursor)
+                # Add pre-cleaned/normalized title columns used by confidence scoring (migration)
+                self._add_normalized_title_columns(cursor)
 
-            # Add content type filter columns to watchlist_artists (migration)
-            self._add_watchlist_content_type_filters(cursor)
+                # Add trigram full-text index over normalized track titles (migration)
+                self._add_tracks_fts_index(cursor)
 
-            conn.commit()
-            logger.info("Database initialized successfully")
+                # Add composite indexes for the library page queries (migration)
+                self._add_library_indexes(cursor)
+
+                # Add trigram full-text index over artist names for library search (migration)
+                self._add_artists_fts_index(cursor)
+
+                # Rewrite legacy comma-separated genres as JSON arrays (migration)
+                self._normalize_genres_to_json(cursor)
+
+                conn.commit()
+                logger.info("Database initialized successfully")
             
         except Exception as e:
             logger.error(f"Error initializing database: {e}")
@@ -580,6 +952,11 @@ class MusicDatabase:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_listenbrainz_tracks_playlist ON listenbrainz_tracks (playlist_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_listenbrainz_tracks_position ON listenbrainz_tracks (playlist_id, position)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_discovery_recent_albums_artist ON discovery_recent_albums (artist_spotify_id)")
+            # Composite indexes matching the hot-path WHERE/ORDER BY/GROUP BY clauses
+            # (single-column added_date/release_date indexes already serve the DESC scans)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_similar_artists_source_rank ON similar_artists (source_artist_id, similarity_rank)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_similar_artists_group ON similar_artists (similar_artist_spotify_id, similar_artist_name)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_discovery_pool_new_added ON discovery_pool (is_new_release, added_date)")
 
             # Add genres column to discovery_pool if it doesn't exist (migration)
             cursor.execute("PRAGMA table_info(discovery_pool)")
@@ -603,6 +980,7 @@ class MusicDatabase:
 
             if 'image_url' not in columns:
                 cursor.execute("ALTER TABLE watchlist_artists ADD COLUMN image_url TEXT")
+                self._watchlist_columns = None
                 logger.info("Added image_url column to watchlist_artists table")
 
         except Exception as e:
@@ -624,6 +1002,7 @@ class MusicDatabase:
             for column_name, (column_type, default_value) in columns_to_add.items():
                 if column_name not in columns:
                     cursor.execute(f"ALTER TABLE watchlist_artists ADD COLUMN {column_name} {column_type} DEFAULT {default_value}")
+                    self._watchlist_columns = None
                     logger.info(f"Added {column_name} column to watchlist_artists table")
 
         except Exception as e:
@@ -646,76 +1025,351 @@ class MusicDatabase:
             for column_name, (column_type, default_value) in columns_to_add.items():
                 if column_name not in columns:
                     cursor.execute(f"ALTER TABLE watchlist_artists ADD COLUMN {column_name} {column_type} DEFAULT {default_value}")
+                    self._watchlist_columns = None
                     logger.info(f"Added {column_name} column to watchlist_artists table")
 
         except Exception as e:
             logger.error(f"Error adding content type filter columns to watchlist_artists: {e}")
             # Don't raise - this is a migration, database can still function
 
+    def _add_wishlist_dedup_columns(self, cursor):
+        """Add lowercase track/artist name columns to wishlist_tracks so duplicate checks can use an index"""
+        try:
+            cursor.execute("PRAGMA table_info(wishlist_tracks)")
+            columns = [column[1] for column in cursor.fetchall()]
+
+            if 'track_name_lc' not in columns or 'artist_name_lc' not in columns:
+                if 'track_name_lc' not in columns:
+                    cursor.execute("ALTER TABLE wishlist_tracks ADD COLUMN track_name_lc TEXT")
+                if 'artist_name_lc' not in columns:
+                    cursor.execute("ALTER TABLE wishlist_tracks ADD COLUMN artist_name_lc TEXT")
+
+                # Backfill from the stored Spotify JSON. json_extract pulls just the two names out in C;
+                # lowercasing stays in Python so keys match add_to_wishlist (SQLite lower() is ASCII-only).
+                # The first artist may be stored as a plain string or as an object with a name.
+                cursor.execute("""
+                    SELECT id,
+                           json_extract(spotify_data, '$.name') AS track_name,
+                           CASE json_type(spotify_data, '$.artists[0]')
+                               WHEN 'text' THEN json_extract(spotify_data, '$.artists[0]')
+                               ELSE json_extract(spotify_data, '$.artists[0].name')
+                           END AS artist_name
+                    FROM wishlist_tracks
+                    WHERE json_valid(spotify_data)
+                """)
+                backfill = []
+                for row in cursor.fetchall():
+                    try:
+                        track_name_lc = (row['track_name'] or '').lower()
+                        artist_name_lc = (row['artist_name'] or '').lower()
+                    except AttributeError as parse_error:
+                        logger.warning(f"Unexpected wishlist track data for {row['id']} during migration: {parse_error}")
+                        continue
+                    backfill.append((track_name_lc, artist_name_lc, row['id']))
+
+                cursor.executemany(
+                    "UPDATE wishlist_tracks SET track_name_lc = ?, artist_name_lc = ? WHERE id = ?", backfill
+                )
+                logger.info(f"Added lowercase name columns to wishlist_tracks table ({len(backfill)} rows backfilled)")
+
+            try:
+                cursor.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_wishlist_name_artist
+                    ON wishlist_tracks (track_name_lc, artist_name_lc)
+                """)
+                cursor.execute("DROP INDEX IF EXISTS idx_wishlist_name_artist_nonunique")
+            except sqlite3.IntegrityError:
+                # Legacy duplicates exist - fall back to a plain index until remove_wishlist_duplicates() runs
+                logger.warning("Existing wishlist duplicates prevent a unique name/artist index, using a non-unique one")
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_wishlist_name_artist_nonunique
+                    ON wishlist_tracks (track_name_lc, artist_name_lc)
+                """)
+
+        except Exception as e:
+            logger.error(f"Error adding wishlist dedup columns: {e}")
+            # Don't raise - this is a migration, database can still function
+
+    def _add_normalized_title_columns(self, cursor):
+        """Add comparison-ready title/name columns so matching doesn't re-clean every candidate per query"""
+        try:
+            columns_to_add = {
+                'tracks': ['title_cleaned', 'title_normalized'],
+                'albums': ['title_cleaned', 'title_normalized'],
+                'artists': ['name_normalized'],
+            }
+
+            for table, table_columns in columns_to_add.items():
+                cursor.execute(f"PRAGMA table_info({table})")
+                existing_columns = [column[1] for column in cursor.fetchall()]
+                for column_name in table_columns:
+                    if column_name not in existing_columns:
+                        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column_name} TEXT")
+                        logger.info(f"Added {column_name} column to {table} table")
+
+            # (Re)compute the columns whenever the cleaning/normalization rules change
+            cursor.execute("SELECT value FROM metadata WHERE key = 'normalized_columns_version' LIMIT 1")
+            row = cursor.fetchone()
+            if row and row['value'] == _NORMALIZED_COLUMNS_VERSION:
+                return
+
+            logger.info("Backfilling normalized title columns...")
+
+            cursor.execute("SELECT rowid, title FROM tracks")
+            cursor.executemany(
+                "UPDATE tracks SET title_cleaned = ?, title_normalized = ? WHERE rowid = ?",
+                [(self._clean_track_title_for_comparison(r['title'] or ''), self._normalize_for_comparison(r['title']), r['rowid'])
+                 for r in cursor.fetchall()]
+            )
+
+            cursor.execute("SELECT rowid, title FROM albums")
+            cursor.executemany(
+                "UPDATE albums SET title_cleaned = ?, title_normalized = ? WHERE rowid = ?",
+                [(self._clean_album_title_for_comparison(r['title'] or ''), self._normalize_for_comparison(r['title']), r['rowid'])
+                 for r in cursor.fetchall()]
+            )
+
+            cursor.execute("SELECT rowid, name FROM artists")
+            cursor.executemany(
+                "UPDATE artists SET name_normalized = ? WHERE rowid = ?",
+                [(self._normalize_for_comparison(r['name']), r['rowid']) for r in cursor.fetchall()]
+            )
+
+            cursor.execute("""
+                INSERT OR REPLACE INTO metadata (key, value, updated_at)
+                VALUES ('normalized_columns_version', ?, CURRENT_TIMESTAMP)
+            """, (_NORMALIZED_COLUMNS_VERSION,))
+            logger.info("Normalized title columns backfilled")
+
+        except Exception as e:
+            logger.error(f"Error adding normalized title columns: {e}")
+            # Don't raise - this is a migration, confidence scoring falls back to cleaning on the fly
+
+    def _add_tracks_fts_index(self, cursor):
+        """Add an FTS5 trigram index over tracks.title_normalized for fast substring candidate lookup"""
+        self._tracks_fts_available = False
+        try:
+            # The trigram tokenizer ships with SQLite 3.34+
+            if sqlite3.sqlite_version_info < (3, 34, 0):
+                logger.info(f"SQLite {sqlite3.sqlite_version} has no trigram tokenizer, track search uses LIKE scans")
+                return
+
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tracks_fts'")
+            fts_exists = cursor.fetchone() is not None
+
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS tracks_fts
+                USING fts5(title_normalized, tokenize = 'trigram')
+            """)
+
+            # Keep the index in sync with tracks. The BEFORE INSERT trigger covers
+            # INSERT OR REPLACE, whose implicit delete does not fire DELETE triggers.
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS tracks_fts_before_insert BEFORE INSERT ON tracks BEGIN
+                    DELETE FROM tracks_fts WHERE rowid IN (SELECT rowid FROM tracks WHERE id = new.id);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS tracks_fts_after_insert AFTER INSERT ON tracks BEGIN
+                    INSERT OR REPLACE INTO tracks_fts (rowid, title_normalized) VALUES (new.rowid, new.title_normalized);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS tracks_fts_after_delete AFTER DELETE ON tracks BEGIN
+                    DELETE FROM tracks_fts WHERE rowid = old.rowid;
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS tracks_fts_after_update AFTER UPDATE OF title_normalized ON tracks BEGIN
+                    INSERT OR REPLACE INTO tracks_fts (rowid, title_normalized) VALUES (new.rowid, new.title_normalized);
+                END
+            """)
+
+            if not fts_exists:
+                cursor.execute("""
+                    INSERT INTO tracks_fts (rowid, title_normalized)
+                    SELECT rowid, title_normalized FROM tracks
+                """)
+                logger.info("Created tracks_fts trigram index")
+
+            self._tracks_fts_available = True
+
+        except Exception as e:
+            logger.error(f"Error creating tracks_fts index: {e}")
+            # Don't raise - this is a migration, track search falls back to LIKE scans
+
+    def _add_artists_fts_index(self, cursor):
+        """Add an FTS5 trigram index over artists.name for the library page search"""
+        self._artists_fts_available = False
+        try:
+            # The trigram tokenizer ships with SQLite 3.34+
+            if sqlite3.sqlite_version_info < (3, 34, 0):
+                logger.info(f"SQLite {sqlite3.sqlite_version} has no trigram tokenizer, artist search uses LIKE scans")
+                return
+
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'artists_fts'")
+            fts_exists = cursor.fetchone() is not None
+
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS artists_fts
+                USING fts5(name, tokenize = 'trigram')
+            """)
+
+            # Keep the index in sync with artists. The BEFORE INSERT trigger covers
+            # INSERT OR REPLACE, whose implicit delete does not fire DELETE triggers.
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS artists_fts_before_insert BEFORE INSERT ON artists BEGIN
+                    DELETE FROM artists_fts WHERE rowid IN (SELECT rowid FROM artists WHERE id = new.id);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS artists_fts_after_insert AFTER INSERT ON artists BEGIN
+                    INSERT OR REPLACE INTO artists_fts (rowid, name) VALUES (new.rowid, new.name);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS artists_fts_after_delete AFTER DELETE ON artists BEGIN
+                    DELETE FROM artists_fts WHERE rowid = old.rowid;
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS artists_fts_after_update AFTER UPDATE OF name ON artists BEGIN
+                    INSERT OR REPLACE INTO artists_fts (rowid, name) VALUES (new.rowid, new.name);
+                END
+            """)
+
+            if not fts_exists:
+                cursor.execute("""
+                    INSERT INTO artists_fts (rowid, name)
+                    SELECT rowid, name FROM artists
+                """)
+                logger.info("Created artists_fts trigram index")
+
+            self._artists_fts_available = True
+
+        except Exception as e:
+            logger.error(f"Error creating artists_fts index: {e}")
+            # Don't raise - this is a migration, artist search falls back to LIKE scans
+
+    def _add_library_indexes(self, cursor):
+        """Add indexes serving the library artist listing, database info and bulk track lookups"""
+        try:
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_artists_server_name
+                ON artists (server_source, name COLLATE NOCASE)
+            """)
+            # Expression index for the A-Z filter; queries must use the identical UPPER(SUBSTR(...)) form
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_artists_server_first_letter
+                ON artists (server_source, UPPER(SUBSTR(name, 1, 1)))
+            """)
+            # Exact normalized-title probes from check_tracks_exist_bulk
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tracks_server_title_normalized
+                ON tracks (server_source, title_normalized)
+            """)
+            # Let the "last update" lookups seek MAX(updated_at) per server instead of scanning
+            for table in ('artists', 'albums', 'tracks'):
+                cursor.execute(f"""
+                    CREATE INDEX IF NOT EXISTS idx_{table}_server_updated_at
+                    ON {table} (server_source, updated_at DESC)
+                """)
+
+        except Exception as e:
+            logger.error(f"Error creating library indexes: {e}")
+            # Don't raise - this is a migration, database can still function
+
+    def _normalize_genres_to_json(self, cursor):
+        """Convert legacy comma-separated artist/album genres to the JSON array format written on ingest"""
+        try:
+            for table in ('artists', 'albums'):
+                # json_type() raises on malformed JSON, so only ask it about valid values
+                cursor.execute(f"""
+                    SELECT id, genres FROM {table}
+                    WHERE genres IS NOT NULL
+                      AND (CASE WHEN json_valid(genres) THEN json_type(genres) END) IS NOT 'array'
+                """)
+                updates = []
+                for row in cursor.fetchall():
+                    genres = sorted({genre.strip() for genre in _GENRE_RE.findall(str(row['genres'])) if genre.strip()})
+                    updates.append((json.dumps(genres) if genres else None, row['id']))
+
+                if updates:
+                    cursor.executemany(f"UPDATE {table} SET genres = ? WHERE id = ?", updates)
+                    logger.info(f"Converted {len(updates)} {table} genre values to JSON arrays")
+
+        except Exception as e:
+            logger.error(f"Error normalizing genres to JSON: {e}")
+            # Don't raise - this is a migration, database can still function
+
     def close(self):
-        """Close database connection (no-op since we create connections per operation)"""
-        # Each operation creates and closes its own connection, so nothing to do here
+        """Close database connection (no-op since connections are pooled per database file)"""
+        # Idle pooled connections are closed by close_database() at shutdown
         pass
     
     def get_statistics(self) -> Dict[str, int]:
         """Get database statistics for all servers (legacy method)"""
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("SELECT COUNT(DISTINCT name) FROM artists")
-                artist_count = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM albums")
-                album_count = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM tracks")
-                track_count = cursor.fetchone()[0]
-                
-                return {
-                    'artists': artist_count,
-                    'albums': album_count,
-                    'tracks': track_count
-                }
+                return self._get_statistics(conn.cursor())
         except Exception as e:
             logger.error(f"Error getting database statistics: {e}")
             return {'artists': 0, 'albums': 0, 'tracks': 0}
+
+    def _get_statistics(self, cursor: sqlite3.Cursor) -> Dict[str, int]:
+        """Count artists, albums and tracks for all servers using the caller's cursor"""
+        cursor.execute("SELECT COUNT(DISTINCT name) FROM artists")
+        artist_count = cursor.fetchone()[0]
+        
+        cursor.execute("SELECT COUNT(*) FROM albums")
+        album_count = cursor.fetchone()[0]
+        
+        cursor.execute("SELECT COUNT(*) FROM tracks")
+        track_count = cursor.fetchone()[0]
+        
+        return {
+            'artists': artist_count,
+            'albums': album_count,
+            'tracks': track_count
+        }
     
     def get_statistics_for_server(self, server_source: str = None) -> Dict[str, int]:
         """Get database statistics filtered by server source"""
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                if server_source:
-                    # Get counts for specific server (deduplicate by name like general count)
-                    cursor.execute("SELECT COUNT(DISTINCT name) FROM artists WHERE server_source = ?", (server_source,))
-                    artist_count = cursor.fetchone()[0]
-                    
-                    cursor.execute("SELECT COUNT(*) FROM albums WHERE server_source = ?", (server_source,))
-                    album_count = cursor.fetchone()[0]
-                    
-                    cursor.execute("SELECT COUNT(*) FROM tracks WHERE server_source = ?", (server_source,))
-                    track_count = cursor.fetchone()[0]
-                else:
-                    # Get total counts (all servers)
-                    cursor.execute("SELECT COUNT(*) FROM artists")
-                    artist_count = cursor.fetchone()[0]
-                    
-                    cursor.execute("SELECT COUNT(*) FROM albums")
-                    album_count = cursor.fetchone()[0]
-                    
-                    cursor.execute("SELECT COUNT(*) FROM tracks")
-                    track_count = cursor.fetchone()[0]
-                
-                return {
-                    'artists': artist_count,
-                    'albums': album_count,
-                    'tracks': track_count
-                }
+                return self._get_statistics_for_server(conn.cursor(), server_source)
         except Exception as e:
             logger.error(f"Error getting database statistics for {server_source}: {e}")
             return {'artists': 0, 'albums': 0, 'tracks': 0}
+
+    def _get_statistics_for_server(self, cursor: sqlite3.Cursor, server_source: str = None) -> Dict[str, int]:
+        """Count artists, albums and tracks for one server using the caller's cursor"""
+        if server_source:
+            # Get counts for specific server (deduplicate by name like general count)
+            cursor.execute("SELECT COUNT(DISTINCT name) FROM artists WHERE server_source = ?", (server_source,))
+            artist_count = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM albums WHERE server_source = ?", (server_source,))
+            album_count = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM tracks WHERE server_source = ?", (server_source,))
+            track_count = cursor.fetchone()[0]
+        else:
+            # Get total counts (all servers)
+            cursor.execute("SELECT COUNT(*) FROM artists")
+            artist_count = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM albums")
+            album_count = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM tracks")
+            track_count = cursor.fetchone()[0]
+        
+        return {
+            'artists': artist_count,
+            'albums': album_count,
+            'tracks': track_count
+        }
     
     def clear_all_data(self):
         """Clear all data from database (for full refresh) - DEPRECATED: Use clear_server_data instead"""
@@ -845,7 +1499,6 @@ class MusicDatabase:
                 summary = None
                 if full_summary:
                     # Extract only our tracking markers (timestamps and ignore flags)
-                    import re
                     markers = []
                     
                     # Extract timestamp marker
@@ -866,7 +1519,8 @@ class MusicDatabase:
                     genres = [genre.tag if hasattr(genre, 'tag') else str(genre) 
                              for genre in artist_obj.genres]
                 
-                genres_json = json.dumps(genres) if genres else None
+                genres_json = json.dumps(sorted(set(genres))) if genres else None
+                name_normalized = self._normalize_for_comparison(name)
                 
                 # Check if artist exists with this ID and server source
                 cursor.execute("SELECT id FROM artists WHERE id = ? AND server_source = ?", (artist_id, server_source))
@@ -876,16 +1530,16 @@ class MusicDatabase:
                     # Update existing artist
                     cursor.execute("""
                         UPDATE artists
-                        SET name = ?, thumb_url = ?, genres = ?, summary = ?, updated_at = CURRENT_TIMESTAMP
+                        SET name = ?, thumb_url = ?, genres = ?, summary = ?, name_normalized = ?, updated_at = CURRENT_TIMESTAMP
                         WHERE id = ? AND server_source = ?
-                    """, (name, thumb_url, genres_json, summary, artist_id, server_source))
+                    """, (name, thumb_url, genres_json, summary, name_normalized, artist_id, server_source))
                     logger.debug(f"Updated existing {server_source} artist: {name} (ID: {artist_id})")
                 else:
                     # Insert new artist
                     cursor.execute("""
-                        INSERT INTO artists (id, name, thumb_url, genres, summary, server_source)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (artist_id, name, thumb_url, genres_json, summary, server_source))
+                        INSERT INTO artists (id, name, thumb_url, genres, summary, server_source, name_normalized)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, (artist_id, name, thumb_url, genres_json, summary, server_source, name_normalized))
                     logger.debug(f"Inserted new {server_source} artist: {name} (ID: {artist_id})")
 
                 conn.commit()
@@ -948,48 +1602,54 @@ class MusicDatabase:
     def insert_or_update_media_album(self, album_obj, artist_id: str, server_source: str = 'plex') -> bool:
         """Insert or update album from media server album object (Plex or Jellyfin)"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            # Convert album ID to string (handles both Plex integer IDs and Jellyfin GUIDs)
-            album_id = str(album_obj.ratingKey)
-            title = album_obj.title
-            year = getattr(album_obj, 'year', None)
-            thumb_url = getattr(album_obj, 'thumb', None)
+                # Convert album ID to string (handles both Plex integer IDs and Jellyfin GUIDs)
+                album_id = str(album_obj.ratingKey)
+                title = album_obj.title
+                year = getattr(album_obj, 'year', None)
+                thumb_url = getattr(album_obj, 'thumb', None)
             
-            # Get track count and duration (handle different server attributes)
-            track_count = getattr(album_obj, 'leafCount', None) or getattr(album_obj, 'childCount', None)
-            duration = getattr(album_obj, 'duration', None)
+                # Get track count and duration (handle different server attributes)
+                track_count = getattr(album_obj, 'leafCount', None) or getattr(album_obj, 'childCount', None)
+                duration = getattr(album_obj, 'duration', None)
             
-            # Get genres (handle both Plex and Jellyfin formats)
-            genres = []
-            if hasattr(album_obj, 'genres') and album_obj.genres:
-                genres = [genre.tag if hasattr(genre, 'tag') else str(genre) 
-                         for genre in album_obj.genres]
+                # Get genres (handle both Plex and Jellyfin formats)
+                genres = []
+                if hasattr(album_obj, 'genres') and album_obj.genres:
+                    genres = [genre.tag if hasattr(genre, 'tag') else str(genre) 
+                             for genre in album_obj.genres]
             
-            genres_json = json.dumps(genres) if genres else None
+                genres_json = json.dumps(sorted(set(genres))) if genres else None
+                title_cleaned = self._clean_album_title_for_comparison(title or '')
+                title_normalized = self._normalize_for_comparison(title)
             
-            # Check if album exists with this ID and server source
-            cursor.execute("SELECT id FROM albums WHERE id = ? AND server_source = ?", (album_id, server_source))
-            exists = cursor.fetchone()
+                # Check if album exists with this ID and server source
+                cursor.execute("SELECT id FROM albums WHERE id = ? AND server_source = ?", (album_id, server_source))
+                exists = cursor.fetchone()
             
-            if exists:
-                # Update existing album
-                cursor.execute("""
-                    UPDATE albums 
-                    SET artist_id = ?, title = ?, year = ?, thumb_url = ?, genres = ?, 
-                        track_count = ?, duration = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ? AND server_source = ?
-                """, (artist_id, title, year, thumb_url, genres_json, track_count, duration, album_id, server_source))
-            else:
-                # Insert new album
-                cursor.execute("""
-                    INSERT INTO albums (id, artist_id, title, year, thumb_url, genres, track_count, duration, server_source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (album_id, artist_id, title, year, thumb_url, genres_json, track_count, duration, server_source))
+                if exists:
+                    # Update existing album
+                    cursor.execute("""
+                        UPDATE albums 
+                        SET artist_id = ?, title = ?, year = ?, thumb_url = ?, genres = ?, 
+                            track_count = ?, duration = ?, title_cleaned = ?, title_normalized = ?,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE id = ? AND server_source = ?
+                    """, (artist_id, title, year, thumb_url, genres_json, track_count, duration,
+                          title_cleaned, title_normalized, album_id, server_source))
+                else:
+                    # Insert new album
+                    cursor.execute("""
+                        INSERT INTO albums (id, artist_id, title, year, thumb_url, genres, track_count, duration, server_source,
+                                            title_cleaned, title_normalized)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (album_id, artist_id, title, year, thumb_url, genres_json, track_count, duration, server_source,
+                          title_cleaned, title_normalized))
             
-            conn.commit()
-            return True
+                conn.commit()
+                return True
             
         except Exception as e:
             logger.error(f"Error inserting/updating {server_source} album {getattr(album_obj, 'title', 'Unknown')}: {e}")
@@ -998,29 +1658,29 @@ class MusicDatabase:
     def get_albums_by_artist(self, artist_id: int) -> List[DatabaseAlbum]:
         """Get all albums by artist ID"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute("SELECT * FROM albums WHERE artist_id = ? ORDER BY year, title", (artist_id,))
-            rows = cursor.fetchall()
+                cursor.execute("SELECT * FROM albums WHERE artist_id = ? ORDER BY year, title", (artist_id,))
+                rows = cursor.fetchall()
             
-            albums = []
-            for row in rows:
-                genres = json.loads(row['genres']) if row['genres'] else None
-                albums.append(DatabaseAlbum(
-                    id=row['id'],
-                    artist_id=row['artist_id'],
-                    title=row['title'],
-                    year=row['year'],
-                    thumb_url=row['thumb_url'],
-                    genres=genres,
-                    track_count=row['track_count'],
-                    duration=row['duration'],
-                    created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
-                    updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
-                ))
+                albums = []
+                for row in rows:
+                    genres = json.loads(row['genres']) if row['genres'] else None
+                    albums.append(DatabaseAlbum(
+                        id=row['id'],
+                        artist_id=row['artist_id'],
+                        title=row['title'],
+                        year=row['year'],
+                        thumb_url=row['thumb_url'],
+                        genres=genres,
+                        track_count=row['track_count'],
+                        duration=row['duration'],
+                        created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
+                        updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
+                    ))
             
-            return albums
+                return albums
             
         except Exception as e:
             logger.error(f"Error getting albums for artist {artist_id}: {e}")
@@ -1038,38 +1698,47 @@ class MusicDatabase:
         
         while retry_count < max_retries:
             try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
+                with self._get_connection() as conn:
+                    cursor = conn.cursor()
                 
-                # Set shorter timeout to prevent long locks
-                cursor.execute("PRAGMA busy_timeout = 10000")  # 10 second timeout
+                    # Set shorter timeout to prevent long locks
+                    cursor.execute("PRAGMA busy_timeout = 10000")  # 10 second timeout
+                    try:
+                        # Convert track ID to string (handles both Plex integer IDs and Jellyfin GUIDs)
+                        track_id = str(track_obj.ratingKey)
+                        title = track_obj.title
+                        track_number = getattr(track_obj, 'trackNumber', None)
+                        duration = getattr(track_obj, 'duration', None)
                 
-                # Convert track ID to string (handles both Plex integer IDs and Jellyfin GUIDs)
-                track_id = str(track_obj.ratingKey)
-                title = track_obj.title
-                track_number = getattr(track_obj, 'trackNumber', None)
-                duration = getattr(track_obj, 'duration', None)
+                        # Get file path and media info (Plex-specific, Jellyfin may not have these)
+                        file_path = None
+                        bitrate = None
+                        if hasattr(track_obj, 'media') and track_obj.media:
+                            media = track_obj.media[0] if track_obj.media else None
+                            if media:
+                                if hasattr(media, 'parts') and media.parts:
+                                    part = media.parts[0]
+                                    file_path = getattr(part, 'file', None)
+                                bitrate = getattr(media, 'bitrate', None)
                 
-                # Get file path and media info (Plex-specific, Jellyfin may not have these)
-                file_path = None
-                bitrate = None
-                if hasattr(track_obj, 'media') and track_obj.media:
-                    media = track_obj.media[0] if track_obj.media else None
-                    if media:
-                        if hasattr(media, 'parts') and media.parts:
-                            part = media.parts[0]
-                            file_path = getattr(part, 'file', None)
-                        bitrate = getattr(media, 'bitrate', None)
+                        # Pre-compute comparison forms once at ingest instead of per match query
+                        title_cleaned = self._clean_track_title_for_comparison(title or '')
+                        title_normalized = self._normalize_for_comparison(title)
                 
-                # Use INSERT OR REPLACE to handle duplicate IDs gracefully
-                cursor.execute("""
-                    INSERT OR REPLACE INTO tracks 
-                    (id, album_id, artist_id, title, track_number, duration, file_path, bitrate, server_source, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (track_id, album_id, artist_id, title, track_number, duration, file_path, bitrate, server_source))
+                        # Use INSERT OR REPLACE to handle duplicate IDs gracefully
+                        cursor.execute("""
+                            INSERT OR REPLACE INTO tracks 
+                            (id, album_id, artist_id, title, track_number, duration, file_path, bitrate, server_source,
+                             title_cleaned, title_normalized, updated_at)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                        """, (track_id, album_id, artist_id, title, track_number, duration, file_path, bitrate, server_source,
+                              title_cleaned, title_normalized))
                 
-                conn.commit()
-                return True
+                        conn.commit()
+                        return True
+                    finally:
+                        # The connection goes back to the shared pool; restore the pool's timeout
+                        cursor.execute("PRAGMA busy_timeout = 30000")
                 
             except Exception as e:
                 retry_count += 1
@@ -1086,15 +1755,15 @@ class MusicDatabase:
     def track_exists(self, track_id) -> bool:
         """Check if a track exists in the database by ID (supports both int and string IDs)"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            # Convert to string to handle both Plex integers and Jellyfin GUIDs
-            track_id_str = str(track_id)
-            cursor.execute("SELECT 1 FROM tracks WHERE id = ? LIMIT 1", (track_id_str,))
-            result = cursor.fetchone()
+                # Convert to string to handle both Plex integers and Jellyfin GUIDs
+                track_id_str = str(track_id)
+                cursor.execute("SELECT 1 FROM tracks WHERE id = ? LIMIT 1", (track_id_str,))
+                result = cursor.fetchone()
             
-            return result is not None
+                return result is not None
             
         except Exception as e:
             logger.error(f"Error checking if track {track_id} exists: {e}")
@@ -1103,15 +1772,15 @@ class MusicDatabase:
     def track_exists_by_server(self, track_id, server_source: str) -> bool:
         """Check if a track exists in the database by ID and server source"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            # Convert to string to handle both Plex integers and Jellyfin GUIDs
-            track_id_str = str(track_id)
-            cursor.execute("SELECT 1 FROM tracks WHERE id = ? AND server_source = ? LIMIT 1", (track_id_str, server_source))
-            result = cursor.fetchone()
+                # Convert to string to handle both Plex integers and Jellyfin GUIDs
+                track_id_str = str(track_id)
+                cursor.execute("SELECT 1 FROM tracks WHERE id = ? AND server_source = ? LIMIT 1", (track_id_str, server_source))
+                result = cursor.fetchone()
             
-            return result is not None
+                return result is not None
             
         except Exception as e:
             logger.error(f"Error checking if track {track_id} exists for server {server_source}: {e}")
@@ -1120,36 +1789,36 @@ class MusicDatabase:
     def get_track_by_id(self, track_id) -> Optional[DatabaseTrackWithMetadata]:
         """Get a track with artist and album names by ID (supports both int and string IDs)"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            # Convert to string to handle both Plex integers and Jellyfin GUIDs
-            track_id_str = str(track_id)
-            cursor.execute("""
-                SELECT t.id, t.album_id, t.artist_id, t.title, t.track_number, 
-                       t.duration, t.created_at, t.updated_at,
-                       a.name as artist_name, al.title as album_title
-                FROM tracks t
-                JOIN artists a ON t.artist_id = a.id
-                JOIN albums al ON t.album_id = al.id
-                WHERE t.id = ?
-            """, (track_id_str,))
+                # Convert to string to handle both Plex integers and Jellyfin GUIDs
+                track_id_str = str(track_id)
+                cursor.execute("""
+                    SELECT t.id, t.album_id, t.artist_id, t.title, t.track_number, 
+                           t.duration, t.created_at, t.updated_at,
+                           a.name as artist_name, al.title as album_title
+                    FROM tracks t
+                    JOIN artists a ON t.artist_id = a.id
+                    JOIN albums al ON t.album_id = al.id
+                    WHERE t.id = ?
+                """, (track_id_str,))
             
-            row = cursor.fetchone()
-            if row:
-                return DatabaseTrackWithMetadata(
-                    id=row['id'],
-                    album_id=row['album_id'],
-                    artist_id=row['artist_id'],
-                    title=row['title'],
-                    artist_name=row['artist_name'],
-                    album_title=row['album_title'],
-                    track_number=row['track_number'],
-                    duration=row['duration'],
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at']
-                )
-            return None
+                row = cursor.fetchone()
+                if row:
+                    return DatabaseTrackWithMetadata(
+                        id=row['id'],
+                        album_id=row['album_id'],
+                        artist_id=row['artist_id'],
+                        title=row['title'],
+                        artist_name=row['artist_name'],
+                        album_title=row['album_title'],
+                        track_number=row['track_number'],
+                        duration=row['duration'],
+                        created_at=row['created_at'],
+                        updated_at=row['updated_at']
+                    )
+                return None
             
         except Exception as e:
             logger.error(f"Error getting track {track_id}: {e}")
@@ -1158,28 +1827,28 @@ class MusicDatabase:
     def get_tracks_by_album(self, album_id: int) -> List[DatabaseTrack]:
         """Get all tracks by album ID"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute("SELECT * FROM tracks WHERE album_id = ? ORDER BY track_number, title", (album_id,))
-            rows = cursor.fetchall()
+                cursor.execute("SELECT * FROM tracks WHERE album_id = ? ORDER BY track_number, title", (album_id,))
+                rows = cursor.fetchall()
             
-            tracks = []
-            for row in rows:
-                tracks.append(DatabaseTrack(
-                    id=row['id'],
-                    album_id=row['album_id'],
-                    artist_id=row['artist_id'],
-                    title=row['title'],
-                    track_number=row['track_number'],
-                    duration=row['duration'],
-                    file_path=row['file_path'],
-                    bitrate=row['bitrate'],
-                    created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
-                    updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
-                ))
+                tracks = []
+                for row in rows:
+                    tracks.append(DatabaseTrack(
+                        id=row['id'],
+                        album_id=row['album_id'],
+                        artist_id=row['artist_id'],
+                        title=row['title'],
+                        track_number=row['track_number'],
+                        duration=row['duration'],
+                        file_path=row['file_path'],
+                        bitrate=row['bitrate'],
+                        created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
+                        updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
+                    ))
             
-            return tracks
+                return tracks
             
         except Exception as e:
             logger.error(f"Error getting tracks for album {album_id}: {e}")
@@ -1188,32 +1857,32 @@ class MusicDatabase:
     def search_artists(self, query: str, limit: int = 50) -> List[DatabaseArtist]:
         """Search artists by name"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT * FROM artists 
-                WHERE name LIKE ? 
-                ORDER BY name 
-                LIMIT ?
-            """, (f"%{query}%", limit))
-            
-            rows = cursor.fetchall()
-            
-            artists = []
-            for row in rows:
-                genres = json.loads(row['genres']) if row['genres'] else None
-                artists.append(DatabaseArtist(
-                    id=row['id'],
-                    name=row['name'],
-                    thumb_url=row['thumb_url'],
-                    genres=genres,
-                    summary=row['summary'],
-                    created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
-                    updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
-                ))
+                cursor.execute("""
+                    SELECT * FROM artists 
+                    WHERE name LIKE ? 
+                    ORDER BY name 
+                    LIMIT ?
+                """, (f"%{query}%", limit))
+            
+                rows = cursor.fetchall()
+            
+                artists = []
+                for row in rows:
+                    genres = json.loads(row['genres']) if row['genres'] else None
+                    artists.append(DatabaseArtist(
+                        id=row['id'],
+                        name=row['name'],
+                        thumb_url=row['thumb_url'],
+                        genres=genres,
+                        summary=row['summary'],
+                        created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
+                        updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
+                    ))
             
-            return artists
+                return artists
             
         except Exception as e:
             logger.error(f"Error searching artists with query '{query}': {e}")
@@ -1225,40 +1894,80 @@ class MusicDatabase:
             if not title and not artist:
                 return []
             
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # STRATEGY 1: Try basic SQL LIKE search first (fastest)
-            basic_results = self._search_tracks_basic(cursor, title, artist, limit, server_source)
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            if basic_results:
-                logger.debug(f"🔍 Basic search found {len(basic_results)} results")
-                return basic_results
+                # STRATEGY 0: Trigram index lookup on the normalized title (avoids a full table scan)
+                fts_results = self._search_tracks_fts(cursor, title, artist, limit, server_source)
+
+                if fts_results:
+                    logger.debug(f"🔍 Trigram index search found {len(fts_results)} results")
+                    return fts_results
+
+                # STRATEGY 1: Try basic SQL LIKE search
+                basic_results = self._search_tracks_basic(cursor, title, artist, limit, server_source)
             
-            # STRATEGY 2: If basic search fails and we have Unicode support, try normalized search
-            try:
-                from unidecode import unidecode
-                unicode_support = True
-            except ImportError:
-                unicode_support = False
+                if basic_results:
+                    logger.debug(f"🔍 Basic search found {len(basic_results)} results")
+                    return basic_results
             
-            if unicode_support:
-                normalized_results = self._search_tracks_unicode_fallback(cursor, title, artist, limit, server_source)
-                if normalized_results:
-                    logger.debug(f"🔍 Unicode fallback search found {len(normalized_results)} results")
-                    return normalized_results
+                # STRATEGY 2: If basic search fails and we have Unicode support, try normalized search
+                if unidecode is not None:
+                    normalized_results = self._search_tracks_unicode_fallback(cursor, title, artist, limit, server_source)
+                    if normalized_results:
+                        logger.debug(f"🔍 Unicode fallback search found {len(normalized_results)} results")
+                        return normalized_results
             
-            # STRATEGY 3: Last resort - broader fuzzy search with Python filtering
-            fuzzy_results = self._search_tracks_fuzzy_fallback(cursor, title, artist, limit)
-            if fuzzy_results:
-                logger.debug(f"🔍 Fuzzy fallback search found {len(fuzzy_results)} results")
+                # STRATEGY 3: Last resort - broader fuzzy search with Python filtering
+                fuzzy_results = self._search_tracks_fuzzy_fallback(cursor, title, artist, limit)
+                if fuzzy_results:
+                    logger.debug(f"🔍 Fuzzy fallback search found {len(fuzzy_results)} results")
             
-            return fuzzy_results
+                return fuzzy_results
             
         except Exception as e:
             logger.error(f"Error searching tracks with title='{title}', artist='{artist}': {e}")
             return []
     
+    def _search_tracks_fts(self, cursor, title: str, artist: str, limit: int, server_source: str = None) -> List[DatabaseTrack]:
+        """Shortlist tracks through the tracks_fts trigram index, ranked by relevance"""
+        if not getattr(self, '_tracks_fts_available', False):
+            return []
+
+        title_norm = self._normalize_for_comparison(title)
+        # Trigram queries need at least three characters to use the index
+        if len(title_norm) < 3:
+            return []
+
+        # Quote as an FTS5 phrase so punctuation in titles isn't parsed as query syntax
+        where_conditions = ["tracks_fts MATCH ?"]
+        params = ['"' + title_norm.replace('"', '""') + '"']
+
+        if artist:
+            where_conditions.append("artists.name LIKE ?")
+            params.append(f"%{artist}%")
+
+        if server_source:
+            where_conditions.append("tracks.server_source = ?")
+            params.append(server_source)
+
+        where_clause = " AND ".join(where_conditions)
+        params.append(limit)
+
+        cursor.execute(f"""
+            SELECT tracks.*, artists.name as artist_name, artists.name_normalized as artist_name_normalized,
+                   albums.title as album_title
+            FROM tracks_fts
+            JOIN tracks ON tracks.rowid = tracks_fts.rowid
+            JOIN artists ON tracks.artist_id = artists.id
+            JOIN albums ON tracks.album_id = albums.id
+            WHERE {where_clause}
+            ORDER BY tracks_fts.rank
+            LIMIT ?
+        """, params)
+
+        return self._rows_to_tracks(cursor.fetchall())
+
     def _search_tracks_basic(self, cursor, title: str, artist: str, limit: int, server_source: str = None) -> List[DatabaseTrack]:
         """Basic SQL LIKE search - fastest method"""
         where_conditions = []
@@ -1284,7 +1993,8 @@ class MusicDatabase:
         params.append(limit)
         
         cursor.execute(f"""
-            SELECT tracks.*, artists.name as artist_name, albums.title as album_title
+            SELECT tracks.*, artists.name as artist_name, artists.name_normalized as artist_name_normalized,
+                   albums.title as album_title
             FROM tracks
             JOIN artists ON tracks.artist_id = artists.id
             JOIN albums ON tracks.album_id = albums.id
@@ -1297,8 +2007,6 @@ class MusicDatabase:
     
     def _search_tracks_unicode_fallback(self, cursor, title: str, artist: str, limit: int, server_source: str = None) -> List[DatabaseTrack]:
         """Unicode-aware fallback search - tries normalized versions"""
-        from unidecode import unidecode
-        
         # Normalize search terms
         if _matching_engine:
             title_norm = _matching_engine.normalize_string(title) if title else ""
@@ -1331,7 +2039,8 @@ class MusicDatabase:
         params.append(limit * 2)  # Get more results for filtering
         
         cursor.execute(f"""
-            SELECT tracks.*, artists.name as artist_name, albums.title as album_title
+            SELECT tracks.*, artists.name as artist_name, artists.name_normalized as artist_name_normalized,
+                   albums.title as album_title
             FROM tracks
             JOIN artists ON tracks.artist_id = artists.id
             JOIN albums ON tracks.album_id = albums.id
@@ -1395,7 +2104,8 @@ class MusicDatabase:
         params.append(limit * 3)  # Get more results for scoring
         
         cursor.execute(f"""
-            SELECT tracks.*, artists.name as artist_name, albums.title as album_title
+            SELECT tracks.*, artists.name as artist_name, artists.name_normalized as artist_name_normalized,
+                   albums.title as album_title
             FROM tracks
             JOIN artists ON tracks.artist_id = artists.id
             JOIN albums ON tracks.album_id = albums.id
@@ -1446,69 +2156,76 @@ class MusicDatabase:
             # Add artist and album info for compatibility with Plex responses
             track.artist_name = row['artist_name']
             track.album_title = row['album_title']
+            # Materialized comparison forms (see _add_normalized_title_columns)
+            track.title_cleaned = row['title_cleaned']
+            track.title_normalized = row['title_normalized']
+            track.artist_name_normalized = row['artist_name_normalized']
             tracks.append(track)
         return tracks
     
     def search_albums(self, title: str = "", artist: str = "", limit: int = 50, server_source: Optional[str] = None) -> List[DatabaseAlbum]:
         """Search albums by title and/or artist name with fuzzy matching"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            # Build dynamic query based on provided parameters  
-            where_conditions = []
-            params = []
+                # Build dynamic query based on provided parameters  
+                where_conditions = []
+                params = []
             
-            if title:
-                where_conditions.append("albums.title LIKE ?")
-                params.append(f"%{title}%")
+                if title:
+                    where_conditions.append("albums.title LIKE ?")
+                    params.append(f"%{title}%")
             
-            if artist:
-                where_conditions.append("artists.name LIKE ?")
-                params.append(f"%{artist}%")
+                if artist:
+                    where_conditions.append("artists.name LIKE ?")
+                    params.append(f"%{artist}%")
             
-            if server_source:
-                where_conditions.append("albums.server_source = ?")
-                params.append(server_source)
+                if server_source:
+                    where_conditions.append("albums.server_source = ?")
+                    params.append(server_source)
             
-            if not where_conditions:
-                # If no search criteria, return empty list
-                return []
+                if not where_conditions:
+                    # If no search criteria, return empty list
+                    return []
             
-            where_clause = " AND ".join(where_conditions)
-            params.append(limit)
+                where_clause = " AND ".join(where_conditions)
+                params.append(limit)
             
-            cursor.execute(f"""
-                SELECT albums.*, artists.name as artist_name
-                FROM albums
-                JOIN artists ON albums.artist_id = artists.id
-                WHERE {where_clause}
-                ORDER BY albums.title, artists.name
-                LIMIT ?
-            """, params)
-            
-            rows = cursor.fetchall()
-            
-            albums = []
-            for row in rows:
-                genres = json.loads(row['genres']) if row['genres'] else None
-                album = DatabaseAlbum(
-                    id=row['id'],
-                    artist_id=row['artist_id'],
-                    title=row['title'],
-                    year=row['year'],
-                    thumb_url=row['thumb_url'],
-                    genres=genres,
-                    track_count=row['track_count'],
-                    duration=row['duration'],
-                    created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
-                    updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
-                )
-                # Add artist info for compatibility with Plex responses
-                album.artist_name = row['artist_name']
-                albums.append(album)
+                cursor.execute(f"""
+                    SELECT albums.*, artists.name as artist_name
+                    FROM albums
+                    JOIN artists ON albums.artist_id = artists.id
+                    WHERE {where_clause}
+                    ORDER BY albums.title, artists.name
+                    LIMIT ?
+                """, params)
+            
+                rows = cursor.fetchall()
+            
+                albums = []
+                for row in rows:
+                    genres = json.loads(row['genres']) if row['genres'] else None
+                    album = DatabaseAlbum(
+                        id=row['id'],
+                        artist_id=row['artist_id'],
+                        title=row['title'],
+                        year=row['year'],
+                        thumb_url=row['thumb_url'],
+                        genres=genres,
+                        track_count=row['track_count'],
+                        duration=row['duration'],
+                        created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
+                        updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
+                    )
+                    # Add artist info for compatibility with Plex responses
+                    album.artist_name = row['artist_name']
+                    # Materialized comparison forms (see _add_normalized_title_columns)
+                    album.title_cleaned = row['title_cleaned']
+                    album.title_normalized = row['title_normalized']
+                    albums.append(album)
             
-            return albums
+                return albums
             
         except Exception as e:
             logger.error(f"Error searching albums with title='{title}', artist='{artist}': {e}")
@@ -1551,30 +2268,38 @@ class MusicDatabase:
             # Generate title variations for better matching (similar to album approach)
             title_variations = self._generate_track_title_variations(title)
             
-            logger.debug(f"🔍 Enhanced track matching for '{title}' by '{artist}': trying {len(title_variations)} variations")
-            for i, var in enumerate(title_variations):
-                logger.debug(f"  {i+1}. '{var}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🔍 Enhanced track matching for '{title}' by '{artist}': trying {len(title_variations)} variations")
+                for i, var in enumerate(title_variations):
+                    logger.debug(f"  {i+1}. '{var}'")
             
             best_match = None
             best_confidence = 0.0
+            # Confidence depends only on the original title/artist, so each track is scored once
+            # even when several title/artist variations return it
+            scored_ids = set()
+            artist_variations = self._get_artist_variations(artist)
             
             # Try each title variation
             for title_variation in title_variations:
                 # Search for potential matches with this variation
                 potential_matches = []
-                artist_variations = self._get_artist_variations(artist)
                 for artist_variation in artist_variations:
-                    potential_matches.extend(self.search_tracks(title=title_variation, artist=artist_variation, limit=20, server_source=server_source))
+                    for track in self.search_tracks(title=title_variation, artist=artist_variation, limit=20, server_source=server_source):
+                        if track.id not in scored_ids:
+                            scored_ids.add(track.id)
+                            potential_matches.append(track)
                 
                 if not potential_matches:
                     continue
                 
-                logger.debug(f"🎵 Found {len(potential_matches)} tracks for variation '{title_variation}'")
+                logger.debug(f"🎵 Found {len(potential_matches)} new tracks for variation '{title_variation}'")
                 
-                # Score each potential match
-                for track in potential_matches:
-                    confidence = self._calculate_track_confidence(title, artist, track)
-                    logger.debug(f"  🎯 '{track.title}' confidence: {confidence:.3f}")
+                # Score all potential matches in one batch
+                confidences = self.score_track_candidates(title, artist, potential_matches)
+                for track, confidence in zip(potential_matches, confidences):
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"  🎯 '{track.title}' confidence: {confidence:.3f}")
                     
                     if confidence > best_confidence:
                         best_confidence = confidence
@@ -1592,6 +2317,67 @@ class MusicDatabase:
             logger.error(f"Error checking track existence for '{title}' by '{artist}': {e}")
             return None, 0.0
     
+    def check_tracks_exist_bulk(self, keys: List[Tuple[str, str]], confidence_threshold: float = 0.8,
+                                server_source: str = None) -> Dict[Tuple[str, str], Tuple[DatabaseTrack, float]]:
+        """
+        Look up many (title, artist) pairs in one query by exact normalized title and artist name.
+        Candidates are scored like check_track_exists; returns {key: (track, confidence)} for keys whose
+        best candidate meets the threshold. Keys without an entry should go through check_track_exists.
+        """
+        if not keys:
+            return {}
+
+        try:
+            probes = [[self._normalize_for_comparison(title), self._normalize_for_comparison(artist)]
+                      for title, artist in keys]
+
+            where_conditions = ["artists.name_normalized = probe.artist_norm"]
+            params = [_json_dumps(probes)]
+            if server_source:
+                where_conditions.append("tracks.server_source = ?")
+                params.append(server_source)
+
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                # The probe list is bound as one JSON array and unpacked with json_each, so the whole
+                # playlist is a single statement; CROSS JOIN keeps the probes as the outer loop so each
+                # one seeks idx_tracks_server_title_normalized
+                cursor.execute(f"""
+                    WITH probe AS (
+                        SELECT key AS probe_index,
+                               json_extract(value, '$[0]') AS title_norm,
+                               json_extract(value, '$[1]') AS artist_norm
+                        FROM json_each(?)
+                    )
+                    SELECT probe.probe_index, tracks.*, artists.name as artist_name,
+                           artists.name_normalized as artist_name_normalized, albums.title as album_title
+                    FROM probe
+                    CROSS JOIN tracks ON tracks.title_normalized = probe.title_norm
+                    JOIN artists ON tracks.artist_id = artists.id
+                    JOIN albums ON tracks.album_id = albums.id
+                    WHERE {" AND ".join(where_conditions)}
+                """, params)
+                rows = cursor.fetchall()
+
+            candidates: Dict[int, List[DatabaseTrack]] = {}
+            for row, track in zip(rows, self._rows_to_tracks(rows)):
+                candidates.setdefault(row['probe_index'], []).append(track)
+
+            matches = {}
+            for probe_index, tracks in candidates.items():
+                title, artist = keys[probe_index]
+                confidences = self.score_track_candidates(title, artist, tracks)
+                best_confidence = max(confidences)
+                if best_confidence >= confidence_threshold:
+                    matches[keys[probe_index]] = (tracks[confidences.index(best_confidence)], best_confidence)
+
+            logger.debug(f"Bulk track lookup matched {len(matches)}/{len(keys)} tracks")
+            return matches
+
+        except Exception as e:
+            logger.error(f"Error checking {len(keys)} tracks in bulk: {e}")
+            return {}
+
     def check_album_exists(self, title: str, artist: str, confidence_threshold: float = 0.8) -> Tuple[Optional[DatabaseAlbum], float]:
         """
         Check if an album exists in the database with fuzzy matching and confidence scoring.
@@ -1649,27 +2435,11 @@ class MusicDatabase:
             return _matching_engine.similarity_score(s1, s2)
         
         # Simple Levenshtein distance implementation
-        len1, len2 = len(s1), len(s2)
-        if len1 < len2:
-            s1, s2 = s2, s1
-            len1, len2 = len2, len1
-        
-        if len2 == 0:
-            return 0.0
-        
-        # Create matrix
-        previous_row = list(range(len2 + 1))
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        
-        max_len = max(len1, len2)
-        distance = previous_row[-1]
+        max_len = max(len(s1), len(s2))
+        if _Levenshtein is not None:
+            distance = _Levenshtein.distance(s1, s2)
+        else:
+            distance = _levenshtein_distance(s1, s2)
         similarity = (max_len - distance) / max_len
         
         return max(0.0, similarity)
@@ -1680,35 +2450,35 @@ class MusicDatabase:
         Returns (owned_tracks, expected_tracks, is_complete)
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            # Get actual track count in our database
-            cursor.execute("SELECT COUNT(*) FROM tracks WHERE album_id = ?", (album_id,))
-            owned_tracks = cursor.fetchone()[0]
+                # Get actual track count in our database
+                cursor.execute("SELECT COUNT(*) FROM tracks WHERE album_id = ?", (album_id,))
+                owned_tracks = cursor.fetchone()[0]
             
-            # Get expected track count from album table
-            cursor.execute("SELECT track_count FROM albums WHERE id = ?", (album_id,))
-            result = cursor.fetchone()
+                # Get expected track count from album table
+                cursor.execute("SELECT track_count FROM albums WHERE id = ?", (album_id,))
+                result = cursor.fetchone()
             
-            if not result:
-                return 0, 0, False
+                if not result:
+                    return 0, 0, False
             
-            stored_track_count = result[0]
+                stored_track_count = result[0]
             
-            # Use provided expected count if available, otherwise use stored count
-            expected_tracks = expected_track_count if expected_track_count is not None else stored_track_count
+                # Use provided expected count if available, otherwise use stored count
+                expected_tracks = expected_track_count if expected_track_count is not None else stored_track_count
             
-            # Determine completeness with refined thresholds
-            if expected_tracks and expected_tracks > 0:
-                completion_ratio = owned_tracks / expected_tracks
-                # Complete: 90%+, Nearly Complete: 80-89%, Partial: <80%
-                is_complete = completion_ratio >= 0.9 and owned_tracks > 0
-            else:
-                # Fallback: if we have any tracks, consider it owned
-                is_complete = owned_tracks > 0
+                # Determine completeness with refined thresholds
+                if expected_tracks and expected_tracks > 0:
+                    completion_ratio = owned_tracks / expected_tracks
+                    # Complete: 90%+, Nearly Complete: 80-89%, Partial: <80%
+                    is_complete = completion_ratio >= 0.9 and owned_tracks > 0
+                else:
+                    # Fallback: if we have any tracks, consider it owned
+                    is_complete = owned_tracks > 0
             
-            return owned_tracks, expected_tracks or 0, is_complete
+                return owned_tracks, expected_tracks or 0, is_complete
             
         except Exception as e:
             logger.error(f"Error checking album completeness for album_id {album_id}: {e}")
@@ -1745,9 +2515,10 @@ class MusicDatabase:
             # Generate album title variations for edition matching
             title_variations = self._generate_album_title_variations(title)
             
-            logger.debug(f"🔍 Edition matching for '{title}' by '{artist}': trying {len(title_variations)} variations")
-            for i, var in enumerate(title_variations):
-                logger.debug(f"  {i+1}. '{var}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🔍 Edition matching for '{title}' by '{artist}': trying {len(title_variations)} variations")
+                for i, var in enumerate(title_variations):
+                    logger.debug(f"  {i+1}. '{var}'")
             
             best_match = None
             best_confidence = 0.0
@@ -1774,7 +2545,8 @@ class MusicDatabase:
                 # Score each potential match with Smart Edition Matching
                 for album in albums:
                     confidence = self._calculate_album_confidence(title, artist, album, expected_track_count)
-                    logger.debug(f"  🎯 '{album.title}' confidence: {confidence:.3f}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"  🎯 '{album.title}' confidence: {confidence:.3f}")
                     
                     if confidence > best_confidence:
                         best_confidence = confidence
@@ -1913,24 +2685,35 @@ class MusicDatabase:
         """Calculate confidence score for album match with Smart Edition Matching"""
         try:
             # Simple confidence based on string similarity
-            title_similarity = self._string_similarity(search_title.lower(), db_album.title.lower())
             artist_similarity = self._string_similarity(search_artist.lower(), db_album.artist_name.lower())
 
+            # Artist too dissimilar: the penalized score plus the maximum edition bonus stays
+            # below 0.35, so skip the title comparisons entirely
+            if artist_similarity < _MIN_ARTIST_SIMILARITY:
+                return artist_similarity * 0.15
+
+            title_similarity = self._string_similarity(search_title.lower(), db_album.title.lower())
+
             # Also try with cleaned versions (removing edition markers)
             clean_search_title = self._clean_album_title_for_comparison(search_title)
-            clean_db_title = self._clean_album_title_for_comparison(db_album.title)
+            clean_db_title = getattr(db_album, 'title_cleaned', None)
+            if clean_db_title is None:
+                clean_db_title = self._clean_album_title_for_comparison(db_album.title)
             clean_title_similarity = self._string_similarity(clean_search_title, clean_db_title)
 
             # Also try with normalized versions (handling diacritics) - fixes #101
             normalized_search_title = self._normalize_for_comparison(search_title)
-            normalized_db_title = self._normalize_for_comparison(db_album.title)
+            normalized_db_title = getattr(db_album, 'title_normalized', None)
+            if normalized_db_title is None:
+                normalized_db_title = self._normalize_for_comparison(db_album.title)
             normalized_title_similarity = self._string_similarity(normalized_search_title, normalized_db_title)
 
             # Use the best title similarity
             best_title_similarity = max(title_similarity, clean_title_similarity, normalized_title_similarity)
 
             # Log when normalized matching helps (only if it's the best score and better than others)
-            if normalized_title_similarity == best_title_similarity and normalized_title_similarity > max(title_similarity, clean_title_similarity):
+            if (logger.isEnabledFor(logging.DEBUG) and normalized_title_similarity == best_title_similarity
+                    and normalized_title_similarity > max(title_similarity, clean_title_similarity)):
                 logger.debug(f"  🌍 Diacritic normalization improved match: '{search_title}' -> '{db_album.title}' (normalized: {normalized_title_similarity:.3f} vs raw: {title_similarity:.3f})")
             
             # Weight: 50% title, 50% artist (equal weight to prevent false positives)
@@ -1948,12 +2731,14 @@ class MusicDatabase:
                     # Found same/better edition (e.g., Deluxe when searching for Standard)
                     edition_bonus = min(0.15, (db_album.track_count - expected_track_count) / expected_track_count * 0.1)
                     confidence += edition_bonus
-                    logger.debug(f"  📀 Edition upgrade bonus: +{edition_bonus:.3f} ({db_album.track_count} >= {expected_track_count} tracks)")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"  📀 Edition upgrade bonus: +{edition_bonus:.3f} ({db_album.track_count} >= {expected_track_count} tracks)")
                 elif db_album.track_count < expected_track_count * 0.8:
                     # Found significantly smaller edition, apply penalty
                     edition_penalty = 0.1
                     confidence -= edition_penalty
-                    logger.debug(f"  📀 Edition downgrade penalty: -{edition_penalty:.3f} ({db_album.track_count} << {expected_track_count} tracks)")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"  📀 Edition downgrade penalty: -{edition_penalty:.3f} ({db_album.track_count} << {expected_track_count} tracks)")
             
             return min(confidence, 1.0)  # Cap at 1.0
             
@@ -2018,76 +2803,115 @@ class MusicDatabase:
                 if cleaned_proper not in variations:
                     variations.append(cleaned_proper)
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_variations = []
+        # Remove duplicates while preserving order (dicts keep insertion order)
+        unique_variations = {}
         for var in variations:
-            var_key = var.lower().strip()
-            if var_key not in seen and var.strip():
-                seen.add(var_key)
-                unique_variations.append(var.strip())
-        
-        return unique_variations
-    
+            var_clean = var.strip()
+            if var_clean:
+                unique_variations.setdefault(var_clean.lower(), var_clean)
+
+        return list(unique_variations.values())
+
     def _normalize_for_comparison(self, text: str) -> str:
         """Normalize text for comparison with Unicode accent handling"""
         if not text:
             return ""
         
-        # Try to use unidecode for accent normalization, fallback to basic if not available
-        try:
-            from unidecode import unidecode
+        # Fast path: plain ASCII has nothing to transliterate (isascii() is a flag check)
+        if text.isascii():
+            return text.lower().strip()
+
+        if unidecode is not None:
             # Convert accents: é→e, ñ→n, ü→u, etc.
             normalized = unidecode(text)
-        except ImportError:
-            # Fallback: basic normalization without accent handling
-            normalized = text
-            logger.warning("unidecode not available, accent matching may be limited")
+        else:
+            # Fallback: strip combining accents only, keeping characters that have no ASCII decomposition
+            normalized = ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
         
         # Convert to lowercase and strip
         return normalized.lower().strip()
     
     def _calculate_track_confidence(self, search_title: str, search_artist: str, db_track: DatabaseTrack) -> float:
         """Calculate confidence score for track match with enhanced cleaning and Unicode normalization"""
+        return self.score_track_candidates(search_title, search_artist, [db_track])[0]
+
+    def score_track_candidates(self, search_title: str, search_artist: str, db_tracks: List[DatabaseTrack]) -> List[float]:
+        """
+        Score a batch of candidate tracks against one search title/artist.
+        Search-side normalization and cleaning run once per batch, and artist similarity is
+        computed once per distinct database artist. Returns confidences in db_tracks order.
+        """
         try:
             # Unicode-aware normalization for accent matching (é→e, ñ→n, etc.)
             search_title_norm = self._normalize_for_comparison(search_title)
             search_artist_norm = self._normalize_for_comparison(search_artist)
-            db_title_norm = self._normalize_for_comparison(db_track.title)
-            db_artist_norm = self._normalize_for_comparison(db_track.artist_name)
-            
-            # Debug logging for Unicode normalization
-            if search_title != search_title_norm or search_artist != search_artist_norm or \
-               db_track.title != db_title_norm or db_track.artist_name != db_artist_norm:
-                logger.debug(f"🔤 Unicode normalization:")
-                logger.debug(f"   Search: '{search_title}' → '{search_title_norm}' | '{search_artist}' → '{search_artist_norm}'")
-                logger.debug(f"   Database: '{db_track.title}' → '{db_title_norm}' | '{db_track.artist_name}' → '{db_artist_norm}'")
-            
-            # Direct similarity with Unicode normalization
-            title_similarity = self._string_similarity(search_title_norm, db_title_norm)
-            artist_similarity = self._string_similarity(search_artist_norm, db_artist_norm)
-            
-            # Also try with cleaned versions (removing parentheses, brackets, etc.)
-            clean_search_title = self._clean_track_title_for_comparison(search_title)
-            clean_db_title = self._clean_track_title_for_comparison(db_track.title)
-            clean_title_similarity = self._string_similarity(clean_search_title, clean_db_title)
-            
-            # Use the best title similarity (direct or cleaned)
-            best_title_similarity = max(title_similarity, clean_title_similarity)
-            
-            # Weight: 50% title, 50% artist (equal weight to prevent false positives)
-            # Also require minimum artist similarity to prevent matching wrong artists
-            confidence = (best_title_similarity * 0.5) + (artist_similarity * 0.5)
-            
-            # Apply artist similarity penalty: if artist match is too low, drastically reduce confidence
-            if artist_similarity < 0.6:  # Less than 60% artist match
-                confidence *= 0.3  # Reduce confidence by 70%
-            
-            return confidence
-            
+            clean_search_title = None  # Only needed once a candidate passes the artist check
         except Exception as e:
             logger.error(f"Error calculating track confidence: {e}")
-            return 0.0
+            return [0.0] * len(db_tracks)
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        artist_similarities = {}
+        confidences = []
+
+        for db_track in db_tracks:
+            try:
+                # DB-side forms are materialized at ingest; fall back for rows that predate the columns
+                db_title_norm = getattr(db_track, 'title_normalized', None)
+                if db_title_norm is None:
+                    db_title_norm = self._normalize_for_comparison(db_track.title)
+                db_artist_norm = getattr(db_track, 'artist_name_normalized', None)
+                if db_artist_norm is None:
+                    db_artist_norm = self._normalize_for_comparison(db_track.artist_name)
+
+                # Debug logging for Unicode normalization
+                if debug_enabled and (
+                        search_title != search_title_norm or search_artist != search_artist_norm or
+                        db_track.title != db_title_norm or db_track.artist_name != db_artist_norm):
+                    logger.debug(f"🔤 Unicode normalization:")
+                    logger.debug(f"   Search: '{search_title}' → '{search_title_norm}' | '{search_artist}' → '{search_artist_norm}'")
+                    logger.debug(f"   Database: '{db_track.title}' → '{db_title_norm}' | '{db_track.artist_name}' → '{db_artist_norm}'")
+
+                # Direct similarity with Unicode normalization
+                artist_similarity = artist_similarities.get(db_artist_norm)
+                if artist_similarity is None:
+                    artist_similarity = self._string_similarity(search_artist_norm, db_artist_norm)
+                    artist_similarities[db_artist_norm] = artist_similarity
+
+                # Artist too dissimilar: even a perfect title tops out at (0.5 + 0.2 * 0.5) * 0.3 = 0.18,
+                # far below any match threshold, so skip the title comparisons entirely
+                if artist_similarity < _MIN_ARTIST_SIMILARITY:
+                    confidences.append(artist_similarity * 0.15)
+                    continue
+
+                title_similarity = self._string_similarity(search_title_norm, db_title_norm)
+
+                # Also try with cleaned versions (removing parentheses, brackets, etc.)
+                if clean_search_title is None:
+                    clean_search_title = self._clean_track_title_for_comparison(search_title)
+                clean_db_title = getattr(db_track, 'title_cleaned', None)
+                if clean_db_title is None:
+                    clean_db_title = self._clean_track_title_for_comparison(db_track.title)
+                clean_title_similarity = self._string_similarity(clean_search_title, clean_db_title)
+
+                # Use the best title similarity (direct or cleaned)
+                best_title_similarity = max(title_similarity, clean_title_similarity)
+
+                # Weight: 50% title, 50% artist (equal weight to prevent false positives)
+                # Also require minimum artist similarity to prevent matching wrong artists
+                confidence = (best_title_similarity * 0.5) + (artist_similarity * 0.5)
+
+                # Apply artist similarity penalty: if artist match is too low, drastically reduce confidence
+                if artist_similarity < 0.6:  # Less than 60% artist match
+                    confidence *= 0.3  # Reduce confidence by 70%
+
+                confidences.append(confidence)
+
+            except Exception as e:
+                logger.error(f"Error calculating track confidence: {e}")
+                confidences.append(0.0)
+
+        return confidences
     
     def _clean_track_title_for_comparison(self, title: str) -> str:
         """Clean track title for comparison by normalizing brackets/dashes and removing noise"""
@@ -2095,48 +2919,14 @@ class MusicDatabase:
 
         # STEP 1: Normalize bracket/dash styles for consistent matching
         # Convert all bracket styles to spaces for better matching
-        cleaned = re.sub(r'\s*[\[\(]\s*', ' ', cleaned)  # Convert opening brackets/parens to space
-        cleaned = re.sub(r'\s*[\]\)]\s*', ' ', cleaned)  # Convert closing brackets/parens to space
-        cleaned = re.sub(r'\s*-\s*', ' ', cleaned)       # Convert dashes to spaces too
+        cleaned = _TITLE_OPEN_BRACKET_RE.sub(' ', cleaned)   # Convert opening brackets/parens to space
+        cleaned = _TITLE_CLOSE_BRACKET_RE.sub(' ', cleaned)  # Convert closing brackets/parens to space
+        cleaned = _TITLE_DASH_RE.sub(' ', cleaned)           # Convert dashes to spaces too
 
         # STEP 2: Remove metadata noise for better matching
         # IMPORTANT: Only remove markers that describe the SAME recording with different metadata
         # DO NOT remove markers that indicate DIFFERENT versions (live, remix, acoustic, etc.)
         # Those are handled by the matching engine's version detection system
-        patterns_to_remove = [
-            # Basic markers (content/parental ratings)
-            r'\s*explicit\s*',      # Remove explicit markers
-            r'\s*clean\s*',         # Remove clean markers
-
-            # Featuring/collaboration (metadata, not different version)
-            r'\s*feat\..*',         # Remove featuring
-            r'\s*featuring.*',      # Remove featuring
-            r'\s*ft\..*',           # Remove ft.
-            r'\s*with\s+.*',        # Remove "with Artist"
-
-            # Edit versions (same recording, different edit for format)
-            r'\s*radio\s+edit.*',   # Remove "radio edit" - same song, radio format
-            r'\s*single\s+edit.*',  # Remove "single edit" - same song, single format
-            r'\s*album\s+edit.*',   # Remove "album edit" - same song, album format
-            r'\s*edit\s*$',         # Remove trailing "edit"
-
-            # Remasters (same recording, different mastering)
-            r'\s*\d{4}\s*remaster.*',  # Remove "2015 remaster"
-            r'\s*remaster.*',       # Remove "remaster/remastered"
-            r'\s*remastered.*',     # Remove "remastered"
-
-            # Version clarifications (metadata, not different recordings)
-            r'\s*original\s+version.*',  # Remove "original version" - clarification
-            r'\s*album\s+version.*',     # Remove "album version" - clarification
-            r'\s*single\s+version.*',    # Remove "single version" - clarification
-            r'\s*version\s*$',           # Remove trailing "version"
-
-            # Soundtrack/source info (metadata about source)
-            r'\s*from\s+.*soundtrack.*', # Remove "from ... soundtrack"
-            r'\s*from\s+".*".*',         # Remove "from 'Movie Title'"
-            r'\s*soundtrack.*',          # Remove "soundtrack"
-        ]
-
         # NOTE: We do NOT remove these - they indicate DIFFERENT recordings:
         # - live, live at, live from, unplugged (different performance)
         # - remix, mix (different mix)
@@ -2146,11 +2936,12 @@ class MusicDatabase:
         # - extended (different length/content)
         # These are handled by matching_engine.similarity_score() which applies penalties
 
-        for pattern in patterns_to_remove:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE).strip()
+        # The patterns themselves live in _TRACK_TITLE_NOISE_RES (precompiled at import)
+        for pattern in _TRACK_TITLE_NOISE_RES:
+            cleaned = pattern.sub('', cleaned).strip()
 
         # STEP 3: Clean up extra spaces
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
 
         return cleaned
     
@@ -2184,43 +2975,38 @@ class MusicDatabase:
         Returns dict with counts of complete, partial, and missing albums.
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Get all albums by this artist with track counts
-            cursor.execute("""
-                SELECT albums.id, albums.track_count, COUNT(tracks.id) as actual_tracks
-                FROM albums
-                JOIN artists ON albums.artist_id = artists.id
-                LEFT JOIN tracks ON albums.id = tracks.album_id
-                WHERE artists.name LIKE ?
-                GROUP BY albums.id, albums.track_count
-            """, (f"%{artist_name}%",))
-            
-            results = cursor.fetchall()
-            stats = {
-                'complete': 0,          # >=90% of tracks
-                'nearly_complete': 0,   # 80-89% of tracks
-                'partial': 0,           # 1-79% of tracks  
-                'missing': 0,           # 0% of tracks
-                'total': len(results)
-            }
-            
-            for row in results:
-                expected_tracks = row['track_count'] or 1  # Avoid division by zero
-                actual_tracks = row['actual_tracks']
-                completion_ratio = actual_tracks / expected_tracks
-                
-                if actual_tracks == 0:
-                    stats['missing'] += 1
-                elif completion_ratio >= 0.9:
-                    stats['complete'] += 1
-                elif completion_ratio >= 0.8:
-                    stats['nearly_complete'] += 1
-                else:
-                    stats['partial'] += 1
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
             
-            return stats
+                # Bucket every album by this artist in a single aggregate pass:
+                # complete >=90%, nearly_complete 80-89%, partial 1-79%, missing 0%
+                cursor.execute("""
+                    SELECT
+                        COUNT(*) AS total,
+                        SUM(CASE WHEN actual_tracks = 0 THEN 1 ELSE 0 END) AS missing,
+                        SUM(CASE WHEN actual_tracks > 0 AND ratio >= 0.9 THEN 1 ELSE 0 END) AS complete,
+                        SUM(CASE WHEN actual_tracks > 0 AND ratio >= 0.8 AND ratio < 0.9 THEN 1 ELSE 0 END) AS nearly_complete,
+                        SUM(CASE WHEN actual_tracks > 0 AND ratio < 0.8 THEN 1 ELSE 0 END) AS partial
+                    FROM (
+                        SELECT COUNT(tracks.id) AS actual_tracks,
+                               -- Treat missing/zero expected counts as 1 to avoid division by zero
+                               1.0 * COUNT(tracks.id) / COALESCE(NULLIF(albums.track_count, 0), 1) AS ratio
+                        FROM albums
+                        JOIN artists ON albums.artist_id = artists.id
+                        LEFT JOIN tracks ON albums.id = tracks.album_id
+                        WHERE artists.name LIKE ?
+                        GROUP BY albums.id, albums.track_count
+                    )
+                """, (f"%{artist_name}%",))
+
+                row = cursor.fetchone()
+                return {
+                    'complete': row['complete'] or 0,
+                    'nearly_complete': row['nearly_complete'] or 0,
+                    'partial': row['partial'] or 0,
+                    'missing': row['missing'] or 0,
+                    'total': row['total'] or 0
+                }
             
         except Exception as e:
             logger.error(f"Error getting album completion stats for artist '{artist_name}': {e}")
@@ -2231,10 +3017,18 @@ class MusicDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO metadata (key, value, updated_at) 
-                    VALUES (?, ?, CURRENT_TIMESTAMP)
-                """, (key, value))
+                if _SQLITE_SUPPORTS_UPSERT:
+                    # Update in place instead of the delete + re-insert done by INSERT OR REPLACE
+                    cursor.execute("""
+                        INSERT INTO metadata (key, value, updated_at)
+                        VALUES (?, ?, CURRENT_TIMESTAMP)
+                        ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+                    """, (key, value))
+                else:
+                    cursor.execute("""
+                        INSERT OR REPLACE INTO metadata (key, value, updated_at)
+                        VALUES (?, ?, CURRENT_TIMESTAMP)
+                    """, (key, value))
                 conn.commit()
         except Exception as e:
             logger.error(f"Error setting metadata {key}: {e}")
@@ -2253,7 +3047,6 @@ class MusicDatabase:
     
     def record_full_refresh_completion(self):
         """Record when a full refresh was completed"""
-        from datetime import datetime
         self.set_metadata('last_full_refresh', datetime.now().isoformat())
     
     def get_last_full_refresh(self) -> Optional[str]:
@@ -2272,8 +3065,6 @@ class MusicDatabase:
 
     def get_quality_profile(self) -> dict:
         """Get the quality profile configuration, returns default if not set"""
-        import json
-
         profile_json = self.get_preference('quality_profile')
 
         if profile_json:
@@ -2283,42 +3074,10 @@ class MusicDatabase:
                 logger.error("Failed to parse quality profile JSON, returning default")
 
         # Return smart defaults (balanced preset)
-        return {
-            "version": 1,
-            "preset": "balanced",
-            "qualities": {
-                "flac": {
-                    "enabled": True,
-                    "min_mb": 0,
-                    "max_mb": 150,
-                    "priority": 1
-                },
-                "mp3_320": {
-                    "enabled": True,
-                    "min_mb": 0,
-                    "max_mb": 20,
-                    "priority": 2
-                },
-                "mp3_256": {
-                    "enabled": True,
-                    "min_mb": 0,
-                    "max_mb": 15,
-                    "priority": 3
-                },
-                "mp3_192": {
-                    "enabled": False,
-                    "min_mb": 0,
-                    "max_mb": 12,
-                    "priority": 4
-                }
-            },
-            "fallback_enabled": True
-        }
+        return _copy_quality_profile(_QUALITY_PRESETS["balanced"])
 
     def set_quality_profile(self, profile: dict) -> bool:
         """Save quality profile configuration"""
-        import json
-
         try:
             profile_json = json.dumps(profile)
             self.set_preference('quality_profile', profile_json)
@@ -2330,186 +3089,94 @@ class MusicDatabase:
 
     def get_quality_preset(self, preset_name: str) -> dict:
         """Get a predefined quality preset"""
-        presets = {
-            "audiophile": {
-                "version": 1,
-                "preset": "audiophile",
-                "qualities": {
-                    "flac": {
-                        "enabled": True,
-                        "min_mb": 0,
-                        "max_mb": 200,
-                        "priority": 1
-                    },
-                    "mp3_320": {
-                        "enabled": False,
-                        "min_mb": 0,
-                        "max_mb": 20,
-                        "priority": 2
-                    },
-                    "mp3_256": {
-                        "enabled": False,
-                        "min_mb": 0,
-                        "max_mb": 15,
-                        "priority": 3
-                    },
-                    "mp3_192": {
-                        "enabled": False,
-                        "min_mb": 0,
-                        "max_mb": 12,
-                        "priority": 4
-                    }
-                },
-                "fallback_enabled": False
-            },
-            "balanced": {
-                "version": 1,
-                "preset": "balanced",
-                "qualities": {
-                    "flac": {
-                        "enabled": True,
-                        "min_mb": 0,
-                        "max_mb": 150,
-                        "priority": 1
-                    },
-                    "mp3_320": {
-                        "enabled": True,
-                        "min_mb": 0,
-                        "max_mb": 20,
-                        "priority": 2
-                    },
-                    "mp3_256": {
-                        "enabled": True,
-                        "min_mb": 0,
-                        "max_mb": 15,
-                        "priority": 3
-                    },
-                    "mp3_192": {
-                        "enabled": False,
-                        "min_mb": 0,
-                        "max_mb": 12,
-                        "priority": 4
-                    }
-                },
-                "fallback_enabled": True
-            },
-            "space_saver": {
-                "version": 1,
-                "preset": "space_saver",
-                "qualities": {
-                    "flac": {
-                        "enabled": False,
-                        "min_mb": 0,
-                        "max_mb": 150,
-                        "priority": 4
-                    },
-                    "mp3_320": {
-                        "enabled": True,
-                        "min_mb": 0,
-                        "max_mb": 15,
-                        "priority": 1
-                    },
-                    "mp3_256": {
-                        "enabled": True,
-                        "min_mb": 0,
-                        "max_mb": 12,
-                        "priority": 2
-                    },
-                    "mp3_192": {
-                        "enabled": True,
-                        "min_mb": 0,
-                        "max_mb": 10,
-                        "priority": 3
-                    }
-                },
-                "fallback_enabled": True
-            }
-        }
-
-        return presets.get(preset_name, presets["balanced"])
+        return _copy_quality_profile(_QUALITY_PRESETS.get(preset_name, _QUALITY_PRESETS["balanced"]))
 
     # Wishlist management methods
     
     def add_to_wishlist(self, spotify_track_data: Dict[str, Any], failure_reason: str = "Download failed",
                        source_type: str = "unknown", source_info: Dict[str, Any] = None) -> bool:
         """Add a failed track to the wishlist for retry"""
+        return self.add_tracks_to_wishlist([spotify_track_data], failure_reason, source_type, source_info) > 0
+
+    def add_tracks_to_wishlist(self, spotify_tracks_data: List[Dict[str, Any]], failure_reason: str = "Download failed",
+                               source_type: str = "unknown", source_info: Dict[str, Any] = None) -> int:
+        """Add several failed tracks to the wishlist in one transaction.
+        Tracks that are invalid or already wishlisted are skipped individually.
+        Returns the number of tracks added."""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+                source_json = _json_dumps(source_info or {})
+                added_count = 0
 
-                # Use Spotify track ID as unique identifier
-                track_id = spotify_track_data.get('id')
-                if not track_id:
-                    logger.error("Cannot add track to wishlist: missing Spotify track ID")
-                    return False
-
-                track_name = spotify_track_data.get('name', 'Unknown Track')
-                artists = spotify_track_data.get('artists', [])
-                if artists:
-                    first_artist = artists[0]
-                    if isinstance(first_artist, str):
-                        artist_name = first_artist
-                    elif isinstance(first_artist, dict):
-                        artist_name = first_artist.get('name', 'Unknown Artist')
-                    else:
-                        artist_name = 'Unknown Artist'
-                else:
-                    artist_name = 'Unknown Artist'
-
-                # Check for duplicates by track name + artist (not just Spotify ID)
-                # This prevents adding the same track multiple times with different IDs or edge cases
-                cursor.execute("""
-                    SELECT id, spotify_track_id, spotify_data FROM wishlist_tracks
-                """)
-
-                existing_tracks = cursor.fetchall()
-
-                # Check if any existing track has matching name AND artist
-                for existing in existing_tracks:
+                for spotify_track_data in spotify_tracks_data:
                     try:
-                        existing_data = json.loads(existing['spotify_data'])
-                        existing_name = existing_data.get('name', '')
-                        existing_artists = existing_data.get('artists', [])
-                        if existing_artists:
-                            existing_first = existing_artists[0]
-                            if isinstance(existing_first, str):
-                                existing_artist = existing_first
-                            elif isinstance(existing_first, dict):
-                                existing_artist = existing_first.get('name', '')
-                            else:
-                                existing_artist = ''
-                        else:
-                            existing_artist = ''
-
-                        # Case-insensitive comparison of track name and primary artist
-                        if (existing_name.lower() == track_name.lower() and
-                            existing_artist.lower() == artist_name.lower()):
+                        # Use Spotify track ID as unique identifier
+                        track_id = spotify_track_data.get('id')
+                        if not track_id:
+                            logger.error("Cannot add track to wishlist: missing Spotify track ID")
+                            continue
+
+                        track_name = spotify_track_data.get('name', 'Unknown Track')
+                        artist_name = self._wishlist_primary_artist(spotify_track_data) or 'Unknown Artist'
+                        track_name_lc, artist_name_lc = self._wishlist_dedup_key(spotify_track_data)
+
+                        # Check for duplicates by track name + artist (not just Spotify ID)
+                        # This prevents adding the same track multiple times with different IDs or edge cases
+                        # (rows inserted earlier in this batch are visible on the same connection)
+                        cursor.execute("""
+                            SELECT id FROM wishlist_tracks
+                            WHERE track_name_lc = ? AND artist_name_lc = ?
+                            LIMIT 1
+                        """, (track_name_lc, artist_name_lc))
+                        existing = cursor.fetchone()
+                        if existing:
                             logger.info(f"Skipping duplicate wishlist entry: '{track_name}' by {artist_name} (already exists as ID: {existing['id']})")
-                            return False  # Already exists, don't add duplicate
-                    except Exception as parse_error:
-                        logger.warning(f"Error parsing existing wishlist track data: {parse_error}")
-                        continue
+                            continue  # Already exists, don't add duplicate
 
-                # Convert data to JSON strings
-                spotify_json = json.dumps(spotify_track_data)
-                source_json = json.dumps(source_info or {})
+                        # Convert data to JSON string
+                        spotify_json = _json_dumps(spotify_track_data)
 
-                # No duplicate found, insert the track
-                cursor.execute("""
-                    INSERT OR REPLACE INTO wishlist_tracks
-                    (spotify_track_id, spotify_data, failure_reason, source_type, source_info, date_added)
-                    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (track_id, spotify_json, failure_reason, source_type, source_json))
+                        # No duplicate found, insert the track
+                        cursor.execute("""
+                            INSERT OR REPLACE INTO wishlist_tracks
+                            (spotify_track_id, spotify_data, failure_reason, source_type, source_info, date_added,
+                             track_name_lc, artist_name_lc)
+                            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
+                        """, (track_id, spotify_json, failure_reason, source_type, source_json,
+                              track_name_lc, artist_name_lc))
+                        added_count += 1
 
-                conn.commit()
+                        logger.info(f"Added track to wishlist: '{track_name}' by {artist_name}")
 
-                logger.info(f"Added track to wishlist: '{track_name}' by {artist_name}")
-                return True
+                    except (TypeError, ValueError, AttributeError) as e:
+                        # Malformed track data only skips that track
+                        logger.error(f"Error adding track to wishlist: {e}")
+
+                conn.commit()
+                return added_count
 
         except Exception as e:
-            logger.error(f"Error adding track to wishlist: {e}")
-            return False
+            logger.error(f"Error adding tracks to wishlist: {e}")
+            return 0
     
+    @staticmethod
+    def _wishlist_primary_artist(spotify_track_data: Dict[str, Any]) -> str:
+        """Return the first artist name from Spotify track data (artists may be strings or dicts)"""
+        artists = spotify_track_data.get('artists', [])
+        if artists:
+            first_artist = artists[0]
+            if isinstance(first_artist, str):
+                return first_artist
+            if isinstance(first_artist, dict):
+                return first_artist.get('name', '')
+        return ''
+
+    def _wishlist_dedup_key(self, spotify_track_data: Dict[str, Any]) -> Tuple[str, str]:
+        """Lowercased (track name, primary artist) pair used to detect wishlist duplicates"""
+        track_name = spotify_track_data.get('name', '') or ''
+        return track_name.lower(), self._wishlist_primary_artist(spotify_track_data).lower()
+
     def remove_from_wishlist(self, spotify_track_id: str) -> bool:
         """Remove a track from the wishlist (typically after successful download)"""
         try:
@@ -2532,83 +3199,102 @@ class MusicDatabase:
     def get_wishlist_tracks(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get all tracks in the wishlist, ordered by date added (oldest first for retry priority)"""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = """
-                    SELECT id, spotify_track_id, spotify_data, failure_reason, retry_count, 
-                           last_attempted, date_added, source_type, source_info
-                    FROM wishlist_tracks 
-                    ORDER BY date_added
-                """
-                
-                if limit:
-                    query += f" LIMIT {limit}"
-                
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                
-                wishlist_tracks = []
-                for row in rows:
-                    try:
-                        spotify_data = json.loads(row['spotify_data'])
-                        source_info = json.loads(row['source_info']) if row['source_info'] else {}
-                        
-                        wishlist_tracks.append({
-                            'id': row['id'],
-                            'spotify_track_id': row['spotify_track_id'],
-                            'spotify_data': spotify_data,
-                            'failure_reason': row['failure_reason'],
-                            'retry_count': row['retry_count'],
-                            'last_attempted': row['last_attempted'],
-                            'date_added': row['date_added'],
-                            'source_type': row['source_type'],
-                            'source_info': source_info
-                        })
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Error parsing wishlist track data: {e}")
-                        continue
-                
-                return wishlist_tracks
-                
+            return list(self.iter_wishlist_tracks(limit=limit))
         except Exception as e:
             logger.error(f"Error getting wishlist tracks: {e}")
             return []
+
+    def iter_wishlist_tracks(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield wishlist tracks oldest first, fetching rows from SQLite in pages.
+        The connection stays open until the generator is exhausted or closed."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = 256
+
+            # "[JSON]" column aliases are decoded by the registered sqlite3 converter
+            query = """
+                SELECT id, spotify_track_id, spotify_data AS "spotify_data [JSON]", failure_reason, retry_count,
+                       last_attempted, date_added, source_type, source_info AS "source_info [JSON]"
+                FROM wishlist_tracks 
+                ORDER BY date_added
+            """
+            params = ()
+
+            if limit:
+                query += " LIMIT ?"
+                params = (int(limit),)
+
+            cursor.execute(query, params)
+
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+
+                for row in rows:
+                    spotify_data = row['spotify_data']
+                    if spotify_data is None:
+                        logger.error(f"Error parsing wishlist track data for {row['spotify_track_id']}, skipping")
+                        continue
+
+                    yield {
+                        'id': row['id'],
+                        'spotify_track_id': row['spotify_track_id'],
+                        'spotify_data': spotify_data,
+                        'failure_reason': row['failure_reason'],
+                        'retry_count': row['retry_count'],
+                        'last_attempted': row['last_attempted'],
+                        'date_added': row['date_added'],
+                        'source_type': row['source_type'],
+                        'source_info': row['source_info'] or {}
+                    }
     
     def update_wishlist_retry(self, spotify_track_id: str, success: bool, error_message: str = None) -> bool:
         """Update retry count and status for a wishlist track"""
+        return self.update_wishlist_retries([(spotify_track_id, success, error_message)]) > 0
+
+    def update_wishlist_retries(self, results: List[Tuple[str, bool, Optional[str]]]) -> int:
+        """Apply several (spotify_track_id, success, error_message) download results in one transaction.
+        Successful tracks are removed from the wishlist, failed ones get their retry count bumped.
+        Returns the number of wishlist rows affected."""
+        success_ids = [spotify_track_id for spotify_track_id, success, _ in results if success]
+        failure_rows = [(error_message, spotify_track_id) for spotify_track_id, success, error_message in results if not success]
+
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                
-                if success:
-                    # Remove from wishlist on success
-                    cursor.execute("DELETE FROM wishlist_tracks WHERE spotify_track_id = ?", (spotify_track_id,))
-                else:
-                    # Increment retry count and update failure reason
-                    cursor.execute("""
+                affected_count = 0
+
+                # Remove from wishlist on success
+                for start in range(0, len(success_ids), _SQL_IN_BATCH_SIZE):
+                    batch = success_ids[start:start + _SQL_IN_BATCH_SIZE]
+                    placeholders = ','.join('?' * len(batch))
+                    cursor.execute(f"DELETE FROM wishlist_tracks WHERE spotify_track_id IN ({placeholders})", batch)
+                    affected_count += cursor.rowcount
+
+                # Increment retry count and update failure reason
+                if failure_rows:
+                    cursor.executemany("""
                         UPDATE wishlist_tracks 
                         SET retry_count = retry_count + 1, 
                             last_attempted = CURRENT_TIMESTAMP,
                             failure_reason = COALESCE(?, failure_reason)
                         WHERE spotify_track_id = ?
-                    """, (error_message, spotify_track_id))
+                    """, failure_rows)
+                    affected_count += cursor.rowcount
                 
                 conn.commit()
-                return cursor.rowcount > 0
+                return affected_count
                 
         except Exception as e:
             logger.error(f"Error updating wishlist retry status: {e}")
-            return False
+            return 0
     
     def get_wishlist_count(self) -> int:
         """Get the total number of tracks in the wishlist"""
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM wishlist_tracks")
-                result = cursor.fetchone()
-                return result[0] if result else 0
+                return conn.execute("SELECT COUNT(*) FROM wishlist_tracks").fetchone()[0]
         except Exception as e:
             logger.error(f"Error getting wishlist count: {e}")
             return 0
@@ -2618,6 +3304,7 @@ class MusicDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+                # Unqualified DELETE on a trigger-free table uses SQLite's truncate optimization
                 cursor.execute("DELETE FROM wishlist_tracks")
                 conn.commit()
                 logger.info(f"Cleared {cursor.rowcount} tracks from wishlist")
@@ -2634,44 +3321,23 @@ class MusicDatabase:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
 
-                # Get all wishlist tracks
+                # Keep the oldest row of each (track name, artist) group and delete the rest in one pass,
+                # using the lowercase columns maintained by add_to_wishlist
                 cursor.execute("""
-                    SELECT id, spotify_track_id, spotify_data, date_added
-                    FROM wishlist_tracks
-                    ORDER BY date_added ASC
+                    DELETE FROM wishlist_tracks
+                    WHERE id IN (
+                        SELECT id FROM (
+                            SELECT id, ROW_NUMBER() OVER (
+                                PARTITION BY track_name_lc, artist_name_lc
+                                ORDER BY date_added ASC, id ASC
+                            ) AS row_num
+                            FROM wishlist_tracks
+                            WHERE track_name_lc IS NOT NULL
+                        )
+                        WHERE row_num > 1
+                    )
                 """)
-                all_tracks = cursor.fetchall()
-
-                # Track seen tracks and duplicates to remove
-                seen_tracks = {}  # Key: (track_name, artist_name), Value: track_id to keep
-                duplicates_to_remove = []
-
-                for track in all_tracks:
-                    try:
-                        track_data = json.loads(track['spotify_data'])
-                        track_name = track_data.get('name', '').lower()
-                        artists = track_data.get('artists', [])
-                        artist_name = artists[0].get('name', '').lower() if artists else 'unknown'
-
-                        key = (track_name, artist_name)
-
-                        if key in seen_tracks:
-                            # Duplicate found - mark for removal
-                            duplicates_to_remove.append(track['id'])
-                            logger.info(f"Found duplicate: '{track_name}' by {artist_name} (ID: {track['id']}, keeping ID: {seen_tracks[key]})")
-                        else:
-                            # First occurrence - keep this one
-                            seen_tracks[key] = track['id']
-
-                    except Exception as parse_error:
-                        logger.warning(f"Error parsing wishlist track {track['id']}: {parse_error}")
-                        continue
-
-                # Remove all duplicates
-                removed_count = 0
-                for duplicate_id in duplicates_to_remove:
-                    cursor.execute("DELETE FROM wishlist_tracks WHERE id = ?", (duplicate_id,))
-                    removed_count += 1
+                removed_count = cursor.rowcount
 
                 conn.commit()
                 logger.info(f"Removed {removed_count} duplicate tracks from wishlist")
@@ -2733,15 +3399,44 @@ class MusicDatabase:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("SELECT 1 FROM watchlist_artists WHERE spotify_artist_id = ? LIMIT 1", (spotify_artist_id,))
-                result = cursor.fetchone()
+                cursor.execute("SELECT EXISTS(SELECT 1 FROM watchlist_artists WHERE spotify_artist_id = ?)", (spotify_artist_id,))
                 
-                return result is not None
+                return bool(cursor.fetchone()[0])
                 
         except Exception as e:
             logger.error(f"Error checking if artist is in watchlist (Spotify ID: {spotify_artist_id}): {e}")
             return False
 
+    def are_artists_in_watchlist(self, spotify_artist_ids: List[str]) -> set:
+        """Return the subset of the given Spotify artist IDs that are in the watchlist"""
+        watched_ids = set()
+        unique_ids = list(dict.fromkeys(spotify_artist_ids))
+        if not unique_ids:
+            return watched_ids
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+
+                for start in range(0, len(unique_ids), _SQL_IN_BATCH_SIZE):
+                    batch = unique_ids[start:start + _SQL_IN_BATCH_SIZE]
+                    placeholders = ','.join('?' * len(batch))
+                    cursor.execute(f"SELECT spotify_artist_id FROM watchlist_artists WHERE spotify_artist_id IN ({placeholders})", batch)
+                    watched_ids.update(row[0] for row in cursor.fetchall())
+
+                return watched_ids
+
+        except Exception as e:
+            logger.error(f"Error checking watchlist status for {len(unique_ids)} artists: {e}")
+            return set()
+
+    def _get_watchlist_columns(self, conn: sqlite3.Connection) -> frozenset:
+        """Return the watchlist_artists column names, cached after the first lookup"""
+        if self._watchlist_columns is None:
+            cursor = conn.execute("PRAGMA table_info(watchlist_artists)")
+            self._watchlist_columns = frozenset(column[1] for column in cursor.fetchall())
+        return self._watchlist_columns
+
     def get_watchlist_artists(self) -> List[WatchlistArtist]:
         """Get all artists in the watchlist"""
         try:
@@ -2749,12 +3444,14 @@ class MusicDatabase:
                 cursor = conn.cursor()
 
                 # Check which columns exist (for migration compatibility)
-                cursor.execute("PRAGMA table_info(watchlist_artists)")
-                existing_columns = {column[1] for column in cursor.fetchall()}
-
-                # Build SELECT query based on existing columns
-                base_columns = ['id', 'spotify_artist_id', 'artist_name', 'date_added',
-                               'last_scan_timestamp', 'created_at', 'updated_at']
+                existing_columns = self._get_watchlist_columns(conn)
+
+                # Build SELECT query based on existing columns; timestamps are parsed by the DATETIME converter
+                base_columns = ['id', 'spotify_artist_id', 'artist_name',
+                               'date_added AS "date_added [DATETIME]"',
+                               'last_scan_timestamp AS "last_scan_timestamp [DATETIME]"',
+                               'created_at AS "created_at [DATETIME]"',
+                               'updated_at AS "updated_at [DATETIME]"']
                 optional_columns = ['image_url', 'include_albums', 'include_eps', 'include_singles',
                                    'include_live', 'include_remixes', 'include_acoustic', 'include_compilations']
 
@@ -2768,34 +3465,35 @@ class MusicDatabase:
 
                 rows = cursor.fetchall()
 
+                # Column presence is the same for every row - resolve it once
+                has_image_url = 'image_url' in existing_columns
+                has_include_albums = 'include_albums' in existing_columns
+                has_include_eps = 'include_eps' in existing_columns
+                has_include_singles = 'include_singles' in existing_columns
+                has_include_live = 'include_live' in existing_columns
+                has_include_remixes = 'include_remixes' in existing_columns
+                has_include_acoustic = 'include_acoustic' in existing_columns
+                has_include_compilations = 'include_compilations' in existing_columns
+
                 watchlist_artists = []
                 for row in rows:
                     # Safely get optional columns with defaults (sqlite3.Row uses dict-style access)
-                    image_url = row['image_url'] if 'image_url' in existing_columns else None
-                    include_albums = bool(row['include_albums']) if 'include_albums' in existing_columns else True
-                    include_eps = bool(row['include_eps']) if 'include_eps' in existing_columns else True
-                    include_singles = bool(row['include_singles']) if 'include_singles' in existing_columns else True
-                    include_live = bool(row['include_live']) if 'include_live' in existing_columns else False
-                    include_remixes = bool(row['include_remixes']) if 'include_remixes' in existing_columns else False
-                    include_acoustic = bool(row['include_acoustic']) if 'include_acoustic' in existing_columns else False
-                    include_compilations = bool(row['include_compilations']) if 'include_compilations' in existing_columns else False
-
                     watchlist_artists.append(WatchlistArtist(
                         id=row['id'],
                         spotify_artist_id=row['spotify_artist_id'],
                         artist_name=row['artist_name'],
-                        date_added=datetime.fromisoformat(row['date_added']),
-                        last_scan_timestamp=datetime.fromisoformat(row['last_scan_timestamp']) if row['last_scan_timestamp'] else None,
-                        created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
-                        updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None,
-                        image_url=image_url,
-                        include_albums=include_albums,
-                        include_eps=include_eps,
-                        include_singles=include_singles,
-                        include_live=include_live,
-                        include_remixes=include_remixes,
-                        include_acoustic=include_acoustic,
-                        include_compilations=include_compilations
+                        date_added=row['date_added'],
+                        last_scan_timestamp=row['last_scan_timestamp'],
+                        created_at=row['created_at'],
+                        updated_at=row['updated_at'],
+                        image_url=row['image_url'] if has_image_url else None,
+                        include_albums=bool(row['include_albums']) if has_include_albums else True,
+                        include_eps=bool(row['include_eps']) if has_include_eps else True,
+                        include_singles=bool(row['include_singles']) if has_include_singles else True,
+                        include_live=bool(row['include_live']) if has_include_live else False,
+                        include_remixes=bool(row['include_remixes']) if has_include_remixes else False,
+                        include_acoustic=bool(row['include_acoustic']) if has_include_acoustic else False,
+                        include_compilations=bool(row['include_compilations']) if has_include_compilations else False
                     ))
 
                 return watchlist_artists
@@ -2808,12 +3506,7 @@ class MusicDatabase:
         """Get the number of artists in the watchlist"""
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("SELECT COUNT(*) as count FROM watchlist_artists")
-                result = cursor.fetchone()
-                
-                return result['count'] if result else 0
+                return conn.execute("SELECT COUNT(*) FROM watchlist_artists").fetchone()[0]
                 
         except Exception as e:
             logger.error(f"Error getting watchlist count: {e}")
@@ -2826,10 +3519,7 @@ class MusicDatabase:
                 cursor = conn.cursor()
 
                 # Check if image_url column exists (for migration compatibility)
-                cursor.execute("PRAGMA table_info(watchlist_artists)")
-                existing_columns = {column[1] for column in cursor.fetchall()}
-
-                if 'image_url' not in existing_columns:
+                if 'image_url' not in self._get_watchlist_columns(conn):
                     logger.warning("image_url column does not exist in watchlist_artists table. Skipping update. Please restart the app to apply migrations.")
                     return False
 
@@ -2880,7 +3570,9 @@ class MusicDatabase:
                 cursor = conn.cursor()
 
                 cursor.execute("""
-                    SELECT * FROM similar_artists
+                    SELECT id, source_artist_id, similar_artist_spotify_id, similar_artist_name,
+                           similarity_rank, occurrence_count, last_updated
+                    FROM similar_artists
                     WHERE source_artist_id = ?
                     ORDER BY similarity_rank ASC
                 """, (source_artist_id,))
@@ -2909,23 +3601,15 @@ class MusicDatabase:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
 
+                # Any row newer than the cutoff means the cache is fresh; last_updated is
+                # written with CURRENT_TIMESTAMP, so compare against datetime('now') (both UTC)
                 cursor.execute("""
-                    SELECT COUNT(*) as count, MAX(last_updated) as last_updated
-                    FROM similar_artists
-                    WHERE source_artist_id = ?
-                """, (source_artist_id,))
-
-                row = cursor.fetchone()
+                    SELECT 1 FROM similar_artists
+                    WHERE source_artist_id = ? AND last_updated > datetime('now', ?)
+                    LIMIT 1
+                """, (source_artist_id, f'-{days_threshold} days'))
 
-                if not row or row['count'] == 0:
-                    # No similar artists cached
-                    return False
-
-                # Check if data is fresh
-                last_updated = datetime.fromisoformat(row['last_updated'])
-                days_since_update = (datetime.now() - last_updated).total_seconds() / 86400  # seconds to days
-
-                return days_since_update < days_threshold
+                return cursor.fetchone() is not None
 
         except Exception as e:
             logger.error(f"Error checking similar artists freshness: {e}")
@@ -2967,50 +3651,67 @@ class MusicDatabase:
             logger.error(f"Error getting top similar artists: {e}")
             return []
 
+    @staticmethod
+    def _discovery_pool_row(track_data: Dict[str, Any]) -> Tuple:
+        """Build the discovery_pool INSERT parameters for one track"""
+        artist_genres = track_data.get('artist_genres')
+        return (
+            track_data['spotify_track_id'],
+            track_data['spotify_album_id'],
+            track_data['spotify_artist_id'],
+            track_data['track_name'],
+            track_data['artist_name'],
+            track_data['album_name'],
+            track_data.get('album_cover_url'),
+            track_data['duration_ms'],
+            track_data.get('popularity', 0),
+            track_data['release_date'],
+            track_data.get('is_new_release', False),
+            _json_dumps(track_data['track_data_json']),
+            _json_dumps(artist_genres) if artist_genres else None
+        )
+
+    def _insert_discovery_pool_rows(self, cursor: sqlite3.Cursor, rows: List[Tuple]) -> int:
+        """Insert discovery_pool rows, skipping tracks already in the pool. Returns the number inserted."""
+        cursor.executemany(_SQL_INSERT_DISCOVERY_POOL, rows)
+        return cursor.rowcount
+
     def add_to_discovery_pool(self, track_data: Dict[str, Any]) -> bool:
-        """Add a track to the discovery pool"""
+        """Add a track to the discovery pool (tracks already in the pool are left untouched)"""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+                self._insert_discovery_pool_rows(cursor, [self._discovery_pool_row(track_data)])
+                conn.commit()
+                return True
 
-                # Check if track already exists
-                cursor.execute("SELECT COUNT(*) as count FROM discovery_pool WHERE spotify_track_id = ?",
-                              (track_data['spotify_track_id'],))
-                if cursor.fetchone()['count'] > 0:
-                    return True  # Already in pool
+        except Exception as e:
+            logger.error(f"Error adding to discovery pool: {e}")
+            return False
 
-                # Get artist genres if available
-                artist_genres = track_data.get('artist_genres')
-                artist_genres_json = json.dumps(artist_genres) if artist_genres else None
+    def add_many_to_discovery_pool(self, tracks: List[Dict[str, Any]]) -> int:
+        """Add several tracks to the discovery pool in one transaction.
+        Returns the number of tracks newly added."""
+        try:
+            rows = []
+            for track_data in tracks:
+                try:
+                    rows.append(self._discovery_pool_row(track_data))
+                except (KeyError, TypeError) as e:
+                    logger.warning(f"Skipping malformed discovery pool track: {e}")
 
-                cursor.execute("""
-                    INSERT INTO discovery_pool
-                    (spotify_track_id, spotify_album_id, spotify_artist_id, track_name, artist_name,
-                     album_name, album_cover_url, duration_ms, popularity, release_date,
-                     is_new_release, track_data_json, artist_genres, added_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (
-                    track_data['spotify_track_id'],
-                    track_data['spotify_album_id'],
-                    track_data['spotify_artist_id'],
-                    track_data['track_name'],
-                    track_data['artist_name'],
-                    track_data['album_name'],
-                    track_data.get('album_cover_url'),
-                    track_data['duration_ms'],
-                    track_data.get('popularity', 0),
-                    track_data['release_date'],
-                    track_data.get('is_new_release', False),
-                    json.dumps(track_data['track_data_json']),
-                    artist_genres_json
-                ))
+            if not rows:
+                return 0
 
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                added_count = self._insert_discovery_pool_rows(cursor, rows)
                 conn.commit()
-                return True
+                return added_count
 
         except Exception as e:
-            logger.error(f"Error adding to discovery pool: {e}")
-            return False
+            logger.error(f"Error adding tracks to discovery pool: {e}")
+            return 0
 
     def rotate_discovery_pool(self, max_tracks: int = 2000, remove_count: int = 500):
         """Remove oldest tracks from discovery pool if it exceeds max_tracks"""
@@ -3018,43 +3719,47 @@ class MusicDatabase:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
 
-                # Check current count
-                cursor.execute("SELECT COUNT(*) as count FROM discovery_pool")
-                current_count = cursor.fetchone()['count']
-
-                if current_count > max_tracks:
-                    # Remove oldest tracks
-                    cursor.execute("""
-                        DELETE FROM discovery_pool
-                        WHERE id IN (
-                            SELECT id FROM discovery_pool
-                            ORDER BY added_date ASC
-                            LIMIT ?
-                        )
-                    """, (remove_count,))
+                # Count and delete in one statement - a no-op while the pool is within max_tracks
+                cursor.execute("""
+                    DELETE FROM discovery_pool
+                    WHERE id IN (
+                        SELECT id FROM discovery_pool
+                        WHERE (SELECT COUNT(*) FROM discovery_pool) > ?
+                        ORDER BY added_date ASC
+                        LIMIT ?
+                    )
+                """, (max_tracks, remove_count))
 
+                if cursor.rowcount > 0:
                     conn.commit()
-                    logger.info(f"Removed {remove_count} oldest tracks from discovery pool")
+                    logger.info(f"Removed {cursor.rowcount} oldest tracks from discovery pool")
 
         except Exception as e:
             logger.error(f"Error rotating discovery pool: {e}")
 
-    def get_discovery_pool_tracks(self, limit: int = 100, new_releases_only: bool = False) -> List[DiscoveryTrack]:
-        """Get tracks from discovery pool"""
+    def get_discovery_pool_tracks(self, limit: int = 100, new_releases_only: bool = False,
+                                  include_track_data: bool = True) -> List[DiscoveryTrack]:
+        """Get tracks from discovery pool.
+        Pass include_track_data=False to skip loading the full Spotify JSON (track_data_json will be None)."""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
 
+                track_data_column = "track_data_json" if include_track_data else "NULL AS track_data_json"
+                columns = f"""id, spotify_track_id, spotify_album_id, spotify_artist_id, track_name, artist_name,
+                           album_name, album_cover_url, duration_ms, popularity, release_date, is_new_release,
+                           {track_data_column}, added_date"""
+
                 if new_releases_only:
-                    cursor.execute("""
-                        SELECT * FROM discovery_pool
+                    cursor.execute(f"""
+                        SELECT {columns} FROM discovery_pool
                         WHERE is_new_release = 1
                         ORDER BY added_date DESC
                         LIMIT ?
                     """, (limit,))
                 else:
-                    cursor.execute("""
-                        SELECT * FROM discovery_pool
+                    cursor.execute(f"""
+                        SELECT {columns} FROM discovery_pool
                         ORDER BY added_date DESC
                         LIMIT ?
                     """, (limit,))
@@ -3083,30 +3788,45 @@ class MusicDatabase:
 
     def cache_discovery_recent_album(self, album_data: Dict[str, Any]) -> bool:
         """Cache a recent album for the discover page (from watchlist or similar artists)"""
+        return self.cache_discovery_recent_albums([album_data]) == 1
+
+    def cache_discovery_recent_albums(self, albums: List[Dict[str, Any]]) -> int:
+        """Cache several recent albums for the discover page in one transaction.
+        Returns the number of albums cached."""
         try:
+            rows = []
+            for album_data in albums:
+                try:
+                    rows.append((
+                        album_data['album_spotify_id'],
+                        album_data['album_name'],
+                        album_data['artist_name'],
+                        album_data['artist_spotify_id'],
+                        album_data.get('album_cover_url'),
+                        album_data['release_date'],
+                        album_data.get('album_type', 'album')
+                    ))
+                except (KeyError, TypeError) as e:
+                    logger.warning(f"Skipping malformed discovery recent album: {e}")
+
+            if not rows:
+                return 0
+
             with self._get_connection() as conn:
                 cursor = conn.cursor()
 
-                cursor.execute("""
+                cursor.executemany("""
                     INSERT OR REPLACE INTO discovery_recent_albums
                     (album_spotify_id, album_name, artist_name, artist_spotify_id, album_cover_url, release_date, album_type, cached_date)
                     VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (
-                    album_data['album_spotify_id'],
-                    album_data['album_name'],
-                    album_data['artist_name'],
-                    album_data['artist_spotify_id'],
-                    album_data.get('album_cover_url'),
-                    album_data['release_date'],
-                    album_data.get('album_type', 'album')
-                ))
+                """, rows)
 
                 conn.commit()
-                return True
+                return cursor.rowcount
 
         except Exception as e:
-            logger.error(f"Error caching discovery recent album: {e}")
-            return False
+            logger.error(f"Error caching discovery recent albums: {e}")
+            return 0
 
     def get_discovery_recent_albums(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get cached recent albums for discover page"""
@@ -3140,8 +3860,10 @@ class MusicDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+                # Unqualified DELETE on a trigger-free table uses SQLite's truncate optimization
                 cursor.execute("DELETE FROM discovery_recent_albums")
                 conn.commit()
+                logger.debug(f"Cleared {cursor.rowcount} cached recent albums")
                 return True
         except Exception as e:
             logger.error(f"Error clearing discovery recent albums: {e}")
@@ -3149,35 +3871,36 @@ class MusicDatabase:
 
     def save_curated_playlist(self, playlist_type: str, track_ids: List[str]) -> bool:
         """Save a curated playlist selection (stays same until next discovery pool update)"""
+        return self.save_curated_playlists({playlist_type: track_ids})
+
+    def save_curated_playlists(self, playlists: Dict[str, List[str]]) -> bool:
+        """Save several curated playlist selections (playlist_type -> track IDs) in one transaction"""
         try:
-            import json
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
+                cursor.executemany("""
                     INSERT OR REPLACE INTO discovery_curated_playlists
                     (playlist_type, track_ids_json, curated_date)
                     VALUES (?, ?, CURRENT_TIMESTAMP)
-                """, (playlist_type, json.dumps(track_ids)))
+                """, [(playlist_type, _json_dumps(track_ids)) for playlist_type, track_ids in playlists.items()])
                 conn.commit()
                 return True
         except Exception as e:
-            logger.error(f"Error saving curated playlist {playlist_type}: {e}")
+            logger.error(f"Error saving curated playlists {list(playlists)}: {e}")
             return False
 
     def get_curated_playlist(self, playlist_type: str) -> Optional[List[str]]:
         """Get saved curated playlist track IDs"""
         try:
-            import json
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+                # Decoded by the JSON column converter while the row is fetched
                 cursor.execute("""
-                    SELECT track_ids_json FROM discovery_curated_playlists
+                    SELECT track_ids_json AS "track_ids [JSON]" FROM discovery_curated_playlists
                     WHERE playlist_type = ?
                 """, (playlist_type,))
                 row = cursor.fetchone()
-                if row:
-                    return json.loads(row['track_ids_json'])
-                return None
+                return row['track_ids'] if row else None
         except Exception as e:
             logger.error(f"Error getting curated playlist {playlist_type}: {e}")
             return None
@@ -3187,21 +3910,15 @@ class MusicDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+                # last_populated_timestamp is a local-time isoformat() string; datetime() normalizes it
+                # so SQLite can compare against the local-time cutoff. No row means never populated.
                 cursor.execute("""
-                    SELECT last_populated_timestamp
+                    SELECT 1
                     FROM discovery_pool_metadata
-                    WHERE id = 1
-                """)
-                row = cursor.fetchone()
+                    WHERE id = 1 AND datetime(last_populated_timestamp) > datetime('now', 'localtime', ?)
+                """, (f'-{hours_threshold} hours',))
 
-                if not row:
-                    # Never populated before
-                    return True
-
-                last_populated = datetime.fromisoformat(row['last_populated_timestamp'])
-                hours_since_update = (datetime.now() - last_populated).total_seconds() / 3600
-
-                return hours_since_update >= hours_threshold
+                return cursor.fetchone() is None
 
         except Exception as e:
             logger.error(f"Error checking discovery pool timestamp: {e}")
@@ -3229,11 +3946,13 @@ class MusicDatabase:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
 
-                # Delete tracks older than threshold
+                # Delete tracks older than threshold. added_date is CURRENT_TIMESTAMP text (UTC), so the
+                # cutoff is bound in the same format and compared directly on idx_discovery_pool_added_date
+                cutoff = (datetime.now(timezone.utc) - timedelta(days=days_threshold)).strftime('%Y-%m-%d %H:%M:%S')
                 cursor.execute("""
                     DELETE FROM discovery_pool
-                    WHERE added_date < datetime('now', '-' || ? || ' days')
-                """, (days_threshold,))
+                    WHERE added_date < ?
+                """, (cutoff,))
 
                 deleted_count = cursor.rowcount
                 conn.commit()
@@ -3249,94 +3968,108 @@ class MusicDatabase:
 
     def add_recent_release(self, watchlist_artist_id: int, album_data: Dict[str, Any]) -> bool:
         """Add a recent release to the recent_releases table"""
+        return self.add_recent_releases(watchlist_artist_id, [album_data]) is not None
+
+    def add_recent_releases(self, watchlist_artist_id: int, albums: List[Dict[str, Any]]) -> Optional[int]:
+        """Add several recent releases for one watchlist artist in a single transaction.
+        Returns the number of new rows (releases already stored are ignored), or None on error."""
         try:
+            rows = [(
+                watchlist_artist_id,
+                album_data['album_spotify_id'],
+                album_data['album_name'],
+                album_data['release_date'],
+                album_data.get('album_cover_url'),
+                album_data.get('track_count', 0)
+            ) for album_data in albums]
+
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-
-                cursor.execute("""
-                    INSERT OR IGNORE INTO recent_releases
-                    (watchlist_artist_id, album_spotify_id, album_name, release_date, album_cover_url, track_count, added_date)
-                    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (
-                    watchlist_artist_id,
-                    album_data['album_spotify_id'],
-                    album_data['album_name'],
-                    album_data['release_date'],
-                    album_data.get('album_cover_url'),
-                    album_data.get('track_count', 0)
-                ))
-
+                cursor.executemany(_SQL_INSERT_RECENT_RELEASE, rows)
                 conn.commit()
-                return True
+                return cursor.rowcount
 
         except Exception as e:
-            logger.error(f"Error adding recent release: {e}")
-            return False
+            logger.error(f"Error adding recent releases: {e}")
+            return None
 
     def get_recent_releases(self, limit: int = 50) -> List[RecentRelease]:
         """Get recent releases from watchlist artists"""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+                # Plain tuples in RecentRelease field order, unpacked positionally
+                cursor.row_factory = None
 
                 cursor.execute("""
-                    SELECT * FROM recent_releases
+                    SELECT id, watchlist_artist_id, album_spotify_id, album_name, release_date,
+                           album_cover_url, track_count, added_date
+                    FROM recent_releases
                     ORDER BY release_date DESC, added_date DESC
                     LIMIT ?
                 """, (limit,))
 
-                rows = cursor.fetchall()
-                return [RecentRelease(
-                    id=row['id'],
-                    watchlist_artist_id=row['watchlist_artist_id'],
-                    album_spotify_id=row['album_spotify_id'],
-                    album_name=row['album_name'],
-                    release_date=row['release_date'],
-                    album_cover_url=row['album_cover_url'],
-                    track_count=row['track_count'],
-                    added_date=datetime.fromisoformat(row['added_date'])
-                ) for row in rows]
+                return [RecentRelease(*row) for row in cursor]
 
         except Exception as e:
             logger.error(f"Error getting recent releases: {e}")
             return []
 
+    def _get_database_size(self) -> int:
+        """Database file size in bytes, re-read from disk at most every _DATABASE_SIZE_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if self._size_cache is not None and now - self._size_cache[0] < _DATABASE_SIZE_CACHE_TTL:
+            return self._size_cache[1]
+
+        try:
+            size = self.database_path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        self._size_cache = (now, size)
+        return size
+
+    def _query_database_info(self, cursor: sqlite3.Cursor, server_source: str = None,
+                             distinct_artists: bool = True) -> sqlite3.Row:
+        """Counts, last update and last full refresh in one statement (one snapshot, one round trip).
+        distinct_artists counts artists by name like the statistics methods do."""
+        where = "WHERE server_source = ?" if server_source else ""
+        artist_count = "COUNT(DISTINCT name)" if distinct_artists else "COUNT(*)"
+        # One MAX() per table so each is answered from idx_<table>_server_updated_at;
+        # the outer MAX() skips tables without rows
+        cursor.execute(f"""
+            SELECT
+                (SELECT {artist_count} FROM artists {where}) AS artists,
+                (SELECT COUNT(*) FROM albums {where}) AS albums,
+                (SELECT COUNT(*) FROM tracks {where}) AS tracks,
+                (SELECT MAX(updated_at) FROM (
+                    SELECT (SELECT MAX(updated_at) FROM artists {where}) AS updated_at
+                    UNION ALL
+                    SELECT (SELECT MAX(updated_at) FROM albums {where})
+                    UNION ALL
+                    SELECT (SELECT MAX(updated_at) FROM tracks {where})
+                )) AS last_update,
+                (SELECT value FROM metadata WHERE key = 'last_full_refresh') AS last_full_refresh
+        """, (server_source,) * 6 if server_source else ())
+        return cursor.fetchone()
+
     def get_database_info(self) -> Dict[str, Any]:
         """Get comprehensive database information for all servers (legacy method)"""
         try:
-            stats = self.get_statistics()
+            with self._get_connection() as conn:
+                info = self._query_database_info(conn.cursor())
             
             # Get database file size
-            db_size = self.database_path.stat().st_size if self.database_path.exists() else 0
+            db_size = self._get_database_size()
             db_size_mb = db_size / (1024 * 1024)
             
-            # Get last update time (most recent updated_at timestamp)
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT MAX(updated_at) as last_update 
-                FROM (
-                    SELECT updated_at FROM artists
-                    UNION ALL
-                    SELECT updated_at FROM albums
-                    UNION ALL
-                    SELECT updated_at FROM tracks
-                )
-            """)
-            
-            result = cursor.fetchone()
-            last_update = result['last_update'] if result and result['last_update'] else None
-            
-            # Get last full refresh
-            last_full_refresh = self.get_last_full_refresh()
-            
             return {
-                **stats,
+                'artists': info['artists'],
+                'albums': info['albums'],
+                'tracks': info['tracks'],
                 'database_size_mb': round(db_size_mb, 2),
                 'database_path': str(self.database_path),
-                'last_update': last_update,
-                'last_full_refresh': last_full_refresh
+                'last_update': info['last_update'],
+                'last_full_refresh': info['last_full_refresh']
             }
             
         except Exception as e:
@@ -3361,39 +4094,22 @@ class MusicDatabase:
             if server_source is None:
                 server_source = config_manager.get_active_media_server()
             
-            stats = self.get_statistics_for_server(server_source)
+            with self._get_connection() as conn:
+                # Counts and last update for this server; last full refresh is a global setting
+                info = self._query_database_info(conn.cursor(), server_source, distinct_artists=bool(server_source))
             
             # Get database file size (always total, not server-specific)
-            db_size = self.database_path.stat().st_size if self.database_path.exists() else 0
+            db_size = self._get_database_size()
             db_size_mb = db_size / (1024 * 1024)
             
-            # Get last update time for this server
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT MAX(updated_at) as last_update 
-                FROM (
-                    SELECT updated_at FROM artists WHERE server_source = ?
-                    UNION ALL
-                    SELECT updated_at FROM albums WHERE server_source = ?
-                    UNION ALL
-                    SELECT updated_at FROM tracks WHERE server_source = ?
-                )
-            """, (server_source, server_source, server_source))
-            
-            result = cursor.fetchone()
-            last_update = result['last_update'] if result and result['last_update'] else None
-            
-            # Get last full refresh (global setting, not server-specific)
-            last_full_refresh = self.get_last_full_refresh()
-            
             return {
-                **stats,
+                'artists': info['artists'],
+                'albums': info['albums'],
+                'tracks': info['tracks'],
                 'database_size_mb': round(db_size_mb, 2),
                 'database_path': str(self.database_path),
-                'last_update': last_update,
-                'last_full_refresh': last_full_refresh,
+                'last_update': info['last_update'],
+                'last_full_refresh': info['last_full_refresh'],
                 'server_source': server_source
             }
             
@@ -3410,146 +4126,102 @@ class MusicDatabase:
                 'server_source': server_source
             }
 
-    def get_library_artists(self, search_query: str = "", letter: str = "", page: int = 1, limit: int = 50) -> Dict[str, Any]:
-        """
-        Get artists for the library page with search, filtering, and pagination
-
-        Args:
-            search_query: Search term to filter artists by name
-            letter: Filter by first letter (a-z, #, or "" for all)
-            page: Page number (1-based)
-            limit: Number of results per page
-
-        Returns:
-            Dict containing artists list, pagination info, and total count
-        """
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Build WHERE clause
-                where_conditions = []
-                params = []
+    def _library_artists_query(self, search_query: str, letter: str) -> Tuple[str, str, List[Any]]:
+        """Pick the cached (page, count) query shape for a library filter and build its bind parameters.
+        The page query additionally takes LIMIT and OFFSET."""
+        # Bind parameters in the fixed order the cached query shape expects
+        params = []
 
-                if search_query:
-                    where_conditions.append("LOWER(name) LIKE LOWER(?)")
-                    params.append(f"%{search_query}%")
-
-                if letter and letter != "all":
-                    if letter == "#":
-                        # Numbers and special characters
-                        where_conditions.append("SUBSTR(UPPER(name), 1, 1) NOT GLOB '[A-Z]'")
-                    else:
-                        # Specific letter
-                        where_conditions.append("UPPER(SUBSTR(name, 1, 1)) = UPPER(?)")
-                        params.append(letter)
-
-                # Get active server for filtering
-                from config.settings import config_manager
-                active_server = config_manager.get_active_media_server()
-
-                # Add active server filter to where conditions
-                where_conditions.append("a.server_source = ?")
-                params.append(active_server)
-
-                where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-
-                # Get total count (matching dashboard method)
-                count_query = f"""
-                    SELECT COUNT(*) as total_count
-                    FROM artists a
-                    WHERE {where_clause}
-                """
-                cursor.execute(count_query, params)
-                total_count = cursor.fetchone()['total_count']
+        search_kind = ""
+        if search_query:
+            # Trigram queries need at least three characters, and LIKE wildcards in the
+            # search text have no FTS equivalent
+            if (getattr(self, '_artists_fts_available', False) and len(search_query) >= 3
+                    and '%' not in search_query and '_' not in search_query):
+                search_kind = "fts"
+                # Quote as an FTS5 phrase so punctuation in names isn't parsed as query syntax
+                params.append('"' + search_query.replace('"', '""') + '"')
+            else:
+                search_kind = "like"
+            params.append(f"%{search_query}%")
 
-                # Get artists with pagination
-                offset = (page - 1) * limit
+        letter_kind = ""
+        if letter and letter != "all":
+            if letter == "#":
+                letter_kind = "#"
+            else:
+                letter_kind = "letter"
+                params.append(letter)
+
+        # Get active server for filtering
+        from config.settings import config_manager
+        active_server = config_manager.get_active_media_server()
+        params.append(active_server)
+
+        artists_query, count_query = _build_library_artists_query(search_kind, letter_kind)
+        return artists_query, count_query, params
+
+    @staticmethod
+    def _library_artist_dict(row: tuple) -> Dict[str, Any]:
+        """Library page entry from a (id, name, thumb_url, genres, album_count, track_count, total) row"""
+        artist_id, name, thumb_url, genres, album_count, track_count, _ = row
+        # Genres are stored as sorted, de-duplicated JSON arrays and decoded by the JSON converter
+        return {
+            'id': artist_id,
+            'name': name,
+            'image_url': thumb_url or None,
+            'genres': genres or [],
+            'album_count': album_count or 0,
+            'track_count': track_count or 0
+        }
 
-                artists_query = f"""
-                    SELECT
-                        a.id,
-                        a.name,
-                        a.thumb_url,
-                        a.genres,
-                        COUNT(DISTINCT al.id) as album_count,
-                        COUNT(DISTINCT t.id) as track_count
-                    FROM artists a
-                    LEFT JOIN albums al ON a.id = al.artist_id
-                    LEFT JOIN tracks t ON al.id = t.album_id
-                    WHERE {where_clause}
-                    GROUP BY a.id, a.name, a.thumb_url, a.genres
-                    ORDER BY a.name COLLATE NOCASE
-                    LIMIT ? OFFSET ?
-                """
-                # No need for complex query params now
-                query_params = params + [limit, offset]
-
-                cursor.execute(artists_query, query_params)
-                rows = cursor.fetchall()
+    @staticmethod
+    def _library_pagination(total_count: int, page: int, limit: int) -> Dict[str, Any]:
+        """Pagination block for the library page"""
+        total_pages = (total_count + limit - 1) // limit
+        return {
+            'page': page,
+            'limit': limit,
+            'total_count': total_count,
+            'total_pages': total_pages,
+            'has_prev': page > 1,
+            'has_next': page < total_pages
+        }
 
-                # Convert to artist objects
-                artists = []
-                for row in rows:
-                    # Parse genres from GROUP_CONCAT result
-                    genres_str = row['genres'] or ''
-                    genres = []
-                    if genres_str:
-                        # Split by comma and clean up duplicates
-                        genre_set = set()
-                        for genre in genres_str.split(','):
-                            if genre and genre.strip():
-                                genre_set.update(g.strip() for g in genre.split(',') if g.strip())
-                        genres = list(genre_set)
-
-                    artist = DatabaseArtist(
-                        id=row['id'],
-                        name=row['name'],
-                        thumb_url=row['thumb_url'] if row['thumb_url'] else None,
-                        genres=genres
-                    )
+    def iter_library_artists(self, search_query: str = "", letter: str = "", page: int = 1, limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """
+        Stream one library page, fetching rows from SQLite in batches
 
-                    # Add stats
-                    artist_data = {
-                        'id': artist.id,
-                        'name': artist.name,
-                        'image_url': artist.thumb_url,
-                        'genres': artist.genres,
-                        'album_count': row['album_count'] or 0,
-                        'track_count': row['track_count'] or 0
-                    }
-                    artists.append(artist_data)
+        The first item yielded is the pagination block, taken from the page query's
+        window total so it always agrees with the artists that follow; every later
+        item is an artist dict. Query errors are raised, not swallowed. The pooled
+        connection stays open until the generator is exhausted or closed.
+        """
+        artists_query, count_query, params = self._library_artists_query(search_query, letter)
+        offset = (page - 1) * limit
 
-                # Calculate pagination info
-                total_pages = (total_count + limit - 1) // limit
-                has_prev = page > 1
-                has_next = page < total_pages
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            # Plain tuples unpacked positionally instead of sqlite3.Row lookups by name
+            cursor.row_factory = None
+            cursor.arraysize = 50
+            cursor.execute(artists_query, params + [limit, offset])
+            rows = cursor.fetchmany()
+
+            if rows:
+                total_count = rows[0][-1]
+            elif offset > 0:
+                # Page past the end - the window total isn't available, so count separately
+                total_count = conn.execute(count_query, params).fetchone()[0]
+            else:
+                total_count = 0
 
-                return {
-                    'artists': artists,
-                    'pagination': {
-                        'page': page,
-                        'limit': limit,
-                        'total_count': total_count,
-                        'total_pages': total_pages,
-                        'has_prev': has_prev,
-                        'has_next': has_next
-                    }
-                }
+            yield self._library_pagination(total_count, page, limit)
 
-        except Exception as e:
-            logger.error(f"Error getting library artists: {e}")
-            return {
-                'artists': [],
-                'pagination': {
-                    'page': 1,
-                    'limit': limit,
-                    'total_count': 0,
-                    'total_pages': 0,
-                    'has_prev': False,
-                    'has_next': False
-                }
-            }
+            while rows:
+                for row in rows:
+                    yield self._library_artist_dict(row)
+                rows = cursor.fetchmany()
 
     def get_artist_discography(self, artist_id) -> Dict[str, Any]:
         """
@@ -3569,7 +4241,7 @@ class MusicDatabase:
                 # Get artist information
                 cursor.execute("""
                     SELECT
-                        id, name, thumb_url, genres, server_source
+                        id, name, thumb_url, genres AS "genres [JSON]", server_source
                     FROM artists
                     WHERE id = ?
                 """, (artist_id,))
@@ -3582,28 +4254,16 @@ class MusicDatabase:
                         'error': f'Artist with ID {artist_id} not found'
                     }
 
-                # Parse genres
-                genres_str = artist_row['genres'] or ''
-                genres = []
-                if genres_str:
-                    # Try to parse as JSON first (new format)
-                    try:
-                        import json
-                        parsed_genres = json.loads(genres_str)
-                        if isinstance(parsed_genres, list):
-                            genres = parsed_genres
-                        else:
-                            genres = [str(parsed_genres)]
-                    except (json.JSONDecodeError, ValueError):
-                        # Fall back to comma-separated format (old format)
-                        genre_set = set()
-                        for genre in genres_str.split(','):
-                            if genre and genre.strip():
-                                genre_set.add(genre.strip())
-                        genres = list(genre_set)
+                # Genres are JSON arrays (legacy comma-separated values are converted at startup)
+                genres = artist_row['genres'] or []
 
                 # Get artist's albums with track counts and completion
-                # Include albums from ALL artists with the same name (fixes duplicate artist issue)
+                # Include albums from ALL artists with the same name (fixes duplicate artist issue);
+                # name/server_source are bound directly instead of re-resolved through subqueries.
+                # Releases are categorized here based on actual track count and title patterns:
+                # only treat as single if explicitly labeled as single AND has few tracks (actual
+                # owned tracks, falling back to expected track count, then to 0); EPs by title or
+                # 4-7 tracks; default to album, especially if track count is unknown.
                 cursor.execute("""
                     SELECT
                         a.id,
@@ -3611,45 +4271,37 @@ class MusicDatabase:
                         a.year,
                         a.track_count,
                         a.thumb_url,
-                        COUNT(t.id) as owned_tracks
+                        COUNT(t.id) as owned_tracks,
+                        CASE
+                            WHEN instr(lower(a.title), 'single') > 0
+                                 AND COALESCE(NULLIF(COUNT(t.id), 0), NULLIF(a.track_count, 0), 0) <= 3
+                                THEN 'singles'
+                            WHEN instr(lower(a.title), 'ep') > 0
+                                 OR instr(lower(a.title), 'extended play') > 0
+                                 OR COALESCE(NULLIF(COUNT(t.id), 0), NULLIF(a.track_count, 0), 0) BETWEEN 4 AND 7
+                                THEN 'eps'
+                            ELSE 'albums'
+                        END as release_kind
                     FROM albums a
+                    JOIN artists ar ON a.artist_id = ar.id
                     LEFT JOIN tracks t ON a.id = t.album_id
-                    WHERE a.artist_id IN (
-                        SELECT id FROM artists
-                        WHERE name = (SELECT name FROM artists WHERE id = ?)
-                        AND server_source = (SELECT server_source FROM artists WHERE id = ?)
-                    )
+                    WHERE ar.name = ? AND ar.server_source = ?
                     GROUP BY a.id, a.title, a.year, a.track_count, a.thumb_url
                     ORDER BY a.year DESC, a.title
-                """, (artist_id, artist_id))
+                """, (artist_row['name'], artist_row['server_source']))
 
                 album_rows = cursor.fetchall()
 
-                # Process albums and categorize by type
-                albums = []
-                eps = []
-                singles = []
-
-                # Get total stats for the artist (including all artists with same name)
-                cursor.execute("""
-                    SELECT
-                        COUNT(DISTINCT a.id) as album_count,
-                        COUNT(DISTINCT t.id) as track_count
-                    FROM albums a
-                    LEFT JOIN tracks t ON a.id = t.album_id
-                    WHERE a.artist_id IN (
-                        SELECT id FROM artists
-                        WHERE name = (SELECT name FROM artists WHERE id = ?)
-                        AND server_source = (SELECT server_source FROM artists WHERE id = ?)
-                    )
-                """, (artist_id, artist_id))
+                # Releases bucketed by the release_kind computed in SQL
+                owned_releases = {'albums': [], 'eps': [], 'singles': []}
 
-                stats_row = cursor.fetchone()
-                album_count = stats_row['album_count'] if stats_row else 0
-                track_count = stats_row['track_count'] if stats_row else 0
+                # Total stats for the artist (including all artists with same name) - one row per
+                # album and each track belongs to a single album, so these match the DISTINCT counts
+                album_count = len(album_rows)
+                track_count = sum(album_row['owned_tracks'] for album_row in album_rows)
 
                 for album_row in album_rows:
-                    # Calculate completion percentage
+                    # Calculate completion percentage (Python round() keeps the existing half-to-even results)
                     expected_tracks = album_row['track_count'] or 1
                     owned_tracks = album_row['owned_tracks'] or 0
                     completion_percentage = min(100, round((owned_tracks / expected_tracks) * 100))
@@ -3664,29 +4316,7 @@ class MusicDatabase:
                         'owned_tracks': owned_tracks,
                         'track_completion': completion_percentage
                     }
-
-                    # Categorize based on actual track count and title patterns
-                    # Use actual owned tracks, fallback to expected track count, then to 0
-                    actual_track_count = owned_tracks or album_row['track_count'] or 0
-                    title_lower = album_row['title'].lower()
-
-                    # Check for single indicators in title
-                    single_indicators = ['single', ' - single', '(single)']
-                    is_single_by_title = any(indicator in title_lower for indicator in single_indicators)
-
-                    # Check for EP indicators in title
-                    ep_indicators = ['ep', ' - ep', '(ep)', 'extended play']
-                    is_ep_by_title = any(indicator in title_lower for indicator in ep_indicators)
-
-                    # Categorization logic - be more conservative about singles
-                    # Only treat as single if explicitly labeled as single AND has few tracks
-                    if is_single_by_title and actual_track_count <= 3:
-                        singles.append(album_data)
-                    elif is_ep_by_title or (4 <= actual_track_count <= 7):
-                        eps.append(album_data)
-                    else:
-                        # Default to album for most releases, especially if track count is unknown
-                        albums.append(album_data)
+                    owned_releases[album_row['release_kind']].append(album_data)
 
                 # Fix image URLs if needed
                 artist_image_url = artist_row['thumb_url']
@@ -3705,11 +4335,7 @@ class MusicDatabase:
                         'album_count': album_count,
                         'track_count': track_count
                     },
-                    'owned_releases': {
-                        'albums': albums,
-                        'eps': eps,
-                        'singles': singles
-                    }
+                    'owned_releases': owned_releases
                 }
 
         except Exception as e:
@@ -3720,7 +4346,14 @@ class MusicDatabase:
             }
 
 # Thread-safe singleton pattern for database access
-_database_instances: Dict[int, MusicDatabase] = {}  # Thread ID -> Database instance
+class _ThreadDatabase(threading.local):
+    """Per-thread slot for the thread's MusicDatabase instance"""
+    db: Optional[MusicDatabase] = None
+
+_thread_database = _ThreadDatabase()
+# Every live instance, so close_database() can reach other threads' instances at shutdown.
+# The lock is only taken when a thread creates its instance, not on every lookup.
+_database_instances: "weakref.WeakSet[MusicDatabase]" = weakref.WeakSet()
 _database_lock = threading.Lock()
 
 def get_database(database_path: str = None) -> MusicDatabase:
@@ -3730,29 +4363,32 @@ def get_database(database_path: str = None) -> MusicDatabase:
         database_path: Path to database file. If None or default path, uses DATABASE_PATH env var
                       or defaults to "database/music_library.db". Custom paths are used as-is.
     """
-    import os
     # Use env var if path is None OR if it's the default path
     # This ensures Docker containers use the correct mounted volume location
     if database_path is None or database_path == "database/music_library.db":
         database_path = os.environ.get('DATABASE_PATH', 'database/music_library.db')
 
-    thread_id = threading.get_ident()
-
-    with _database_lock:
-        if thread_id not in _database_instances:
-            _database_instances[thread_id] = MusicDatabase(database_path)
-        return _database_instances[thread_id]
+    db = _thread_database.db
+    if db is None:
+        db = MusicDatabase(database_path)
+        _thread_database.db = db
+        with _database_lock:
+            _database_instances.add(db)
+    return db
 
 def close_database():
     """Close database instances (safe to call from any thread)"""
-    global _database_instances
-    
     with _database_lock:
         # Close all database instances
-        for thread_id, db_instance in list(_database_instances.items()):
+        for db_instance in list(_database_instances):
             try:
                 db_instance.close()
             except Exception as e:
                 # Ignore threading errors during shutdown
                 pass
-        _database_instances.clear()
\ No newline at end of file
+        _database_instances.clear()
+
+    with _connection_pools_lock:
+        for pool in _connection_pools.values():
+            pool.close_all()
+        _connection_pools.clear()
\ No newline at end of file
@@ -1,17 +1,33 @@
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
+import time
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from dataclasses import dataclass
 from datetime import datetime
 from utils.logging_config import get_logger
+from config.settings import config_manager
+from database.music_database import MusicDatabase
 from core.spotify_client import SpotifyClient, Playlist as SpotifyPlaylist, Track as SpotifyTrack
 from core.plex_client import PlexClient, PlexTrackInfo
 from core.jellyfin_client import JellyfinClient
 from core.navidrome_client import NavidromeClient
 from core.soulseek_client import SoulseekClient
 from core.matching_engine import MusicMatchingEngine, MatchResult
+from core.wishlist_service import get_wishlist_service
 
 logger = get_logger("sync_service")
 
+# Seconds a media server library snapshot (search_tracks("")) is reused by previews and track lookups
+_MEDIA_TRACKS_CACHE_TTL = 300.0
+
+# Tracks requested per page when listing the media server library
+_MEDIA_TRACKS_PAGE_SIZE = 500
+
+# Rows shown by get_sync_preview
+_PREVIEW_TRACK_COUNT = 10
+
+# Library tracks get_sync_preview matches against
+_PREVIEW_LIBRARY_LIMIT = 1000
+
 @dataclass
 class SyncResult:
     playlist_name: str
@@ -52,26 +68,37 @@ class PlaylistSyncService:
         self.progress_callbacks = {}  # Playlist-specific progress callbacks
         self.syncing_playlists = set()  # Track multiple syncing playlists
         self._cancelled = False
+        self._last_progress_ts: Dict[str, float] = {}  # Last progress callback time per playlist
+        self._active_media_resolved = None  # (config_manager.generation, (media_client, server_type))
+        self._media_tracks_cache: Dict[Tuple[str, int], Tuple[float, List]] = {}  # (server_type, limit) -> (fetched at, tracks)
+        self._media_track_index_cache: Dict[Tuple[str, int], Tuple[List, Tuple]] = {}  # (server_type, limit) -> (tracks, matching index)
+        self._download_tasks: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}  # In-flight search_and_download_best per query
+        self._download_waiters: Dict[asyncio.Future, int] = {}  # Callers still awaiting each in-flight search
         self.matching_engine = MusicMatchingEngine()
     
     def _get_active_media_client(self):
         """Get the active media client based on config settings"""
+        # Reuse the last resolution until the settings change
+        generation = config_manager.generation
+        if self._active_media_resolved is not None and self._active_media_resolved[0] == generation:
+            return self._active_media_resolved[1]
         try:
-            from config.settings import config_manager
             active_server = config_manager.get_active_media_server()
 
             if active_server == "jellyfin":
                 if not self.jellyfin_client:
                     logger.error("Jellyfin client not provided to sync service")
                     return None, "jellyfin"
-                return self.jellyfin_client, "jellyfin"
+                resolved = self.jellyfin_client, "jellyfin"
             elif active_server == "navidrome":
                 if not self.navidrome_client:
                     logger.error("Navidrome client not provided to sync service")
                     return None, "navidrome"
-                return self.navidrome_client, "navidrome"
+                resolved = self.navidrome_client, "navidrome"
             else:  # Default to Plex
-                return self.plex_client, "plex"
+                resolved = self.plex_client, "plex"
+            self._active_media_resolved = (generation, resolved)
+            return resolved
         except Exception as e:
             logger.error(f"Error determining active media server: {e}")
             return self.plex_client, "plex"  # Fallback to Plex
@@ -102,10 +129,15 @@ class PlaylistSyncService:
         self.is_syncing = False
     
     def _update_progress(self, playlist_name: str, step: str, track: str, progress: float, total_steps: int, current_step: int, 
-                        total_tracks: int = 0, matched_tracks: int = 0, failed_tracks: int = 0):
+                        total_tracks: int = 0, matched_tracks: int = 0, failed_tracks: int = 0, force: bool = False):
         # Send progress update to the specific playlist's callback
         callback = self.progress_callbacks.get(playlist_name)
         if callback:
+            # Per-track updates are limited to one every 50ms; milestones (force) and completion always go through
+            now = time.monotonic()
+            if not force and progress < 100 and now - self._last_progress_ts.get(playlist_name, 0) < 0.05:
+                return
+            self._last_progress_ts[playlist_name] = now
             callback(SyncProgress(
                 current_step=step,
                 current_track=track,
@@ -144,7 +176,7 @@ class PlaylistSyncService:
                 return self._create_error_result(playlist.name, ["Sync cancelled"])
             
             # Skip fetching playlist since we already have it
-            self._update_progress(playlist.name, "Preparing playlist sync", "", 10, 5, 1)
+            self._update_progress(playlist.name, "Preparing playlist sync", "", 10, 5, 1, force=True)
             
             if not playlist.tracks:
                 errors.append(f"Playlist '{playlist.name}' has no tracks")
@@ -154,46 +186,77 @@ class PlaylistSyncService:
                 return self._create_error_result(playlist.name, ["Sync cancelled"])
             
             total_tracks = len(playlist.tracks)
+            # Resolve the active media server once; everything below in this sync reuses it
             media_client, server_type = self._get_active_media_client()
-
-            media_client, server_type = self._get_active_media_client()
-            self._update_progress(playlist.name, f"Matching tracks against {server_type.title()} library", "", 20, 5, 2, total_tracks=total_tracks)
-            
-            # Use the same robust matching approach as "Download Missing Tracks"
-            match_results = []
-            for i, track in enumerate(playlist.tracks):
-                if self._cancelled:
-                    return self._create_error_result(playlist.name, ["Sync cancelled"])
-                
-                # Update progress for each track
-                progress_percent = 20 + (40 * (i + 1) / total_tracks)  # 20-60% for matching
-                # Extract artist name from both string and dict formats
-                if track.artists:
-                    first_artist = track.artists[0]
-                    artist_name = first_artist if isinstance(first_artist, str) else (first_artist.get('name', 'Unknown') if isinstance(first_artist, dict) else str(first_artist))
-                    current_track_name = f"{artist_name} - {track.name}"
-                else:
-                    current_track_name = track.name
-                self._update_progress(playlist.name, "Matching tracks", current_track_name, progress_percent, 5, 2, 
-                                    total_tracks=total_tracks,
-                                    matched_tracks=len([r for r in match_results if r.is_match]),
-                                    failed_tracks=len([r for r in match_results if not r.is_match]))
-                
-                # Use the robust search approach
-                plex_match, confidence = await self._find_track_in_media_server(track)
-                
-                match_result = MatchResult(
-                    spotify_track=track,
-                    plex_track=plex_match,
-                    confidence=confidence,
-                    match_type="robust_search" if plex_match else "no_match"
-                )
-                match_results.append(match_result)
+            self._update_progress(playlist.name, f"Matching tracks against {server_type.title()} library", "", 20, 5, 2, total_tracks=total_tracks, force=True)
+
+            # One database instance serves every lookup in this sync (its connections are pooled and thread-safe)
+            db = MusicDatabase()
+
+            # Probe the server connection once up front rather than before every track's lookup
+            # (a disconnected Plex client retries its connection on every is_connected() call)
+            match_client = media_client if media_client and await asyncio.to_thread(media_client.is_connected) else None
+
+            # In-memory index of exact title/artist hits for every artist of every track, built with one
+            # database query; the per-track search consults it before falling back to a fuzzy lookup
+            exact_matches = await asyncio.to_thread(
+                self._find_tracks_in_database_bulk, db, playlist.tracks, match_client, server_type)
+
+            # Use the same robust matching approach as "Download Missing Tracks", matching several
+            # tracks at once so their database/server lookups overlap
+            match_semaphore = asyncio.Semaphore(max(1, int(config_manager.get('sync.match_concurrency', 8))))
+
+            async def match_track(index: int, track: SpotifyTrack):
+                async with match_semaphore:
+                    if self._cancelled:
+                        return index, None, 0.0
+
+                    # Use the robust search approach
+                    plex_match, confidence = await self._find_track_in_media_server(
+                        track, match_client, server_type, db, exact_matches)
+                    return index, plex_match, confidence
+
+            # Results are stored by playlist position so the synced playlist keeps its order
+            match_results = [None] * total_tracks
+            matched_count = 0
+            failed_count = 0
+            match_tasks = [asyncio.ensure_future(match_track(i, track)) for i, track in enumerate(playlist.tracks)]
+            try:
+                for completed, next_result in enumerate(asyncio.as_completed(match_tasks), 1):
+                    i, plex_match, confidence = await next_result
+                    if self._cancelled:
+                        return self._create_error_result(playlist.name, ["Sync cancelled"])
+                    
+                    track = playlist.tracks[i]
+                    match_result = MatchResult(
+                        spotify_track=track,
+                        plex_track=plex_match,
+                        confidence=confidence,
+                        match_type="robust_search" if plex_match else "no_match"
+                    )
+                    match_results[i] = match_result
+                    matched_count += int(match_result.is_match)
+                    failed_count += int(not match_result.is_match)
+                    
+                    # Update progress as each track finishes
+                    progress_percent = 20 + (40 * completed / total_tracks)  # 20-60% for matching
+                    current_track_name = f"{track.artists[0]} - {track.name}" if track.artists else track.name
+                    self._update_progress(playlist.name, "Matching tracks", current_track_name, progress_percent, 5, 2, 
+                                        total_tracks=total_tracks,
+                                        matched_tracks=matched_count,
+                                        failed_tracks=failed_count)
+            finally:
+                # Stop outstanding lookups if we bail out early (cancellation or error)
+                for task in match_tasks:
+                    task.cancel()
             
-            matched_tracks = [r for r in match_results if r.is_match]
-            unmatched_tracks = [r for r in match_results if not r.is_match]
+            # One pass split; matched_count/failed_count from the loop already hold their lengths
+            matched_tracks = []
+            unmatched_tracks = []
+            for match_result in match_results:
+                (matched_tracks if match_result.is_match else unmatched_tracks).append(match_result)
             
-            logger.info(f"Found {len(matched_tracks)} matches out of {len(playlist.tracks)} tracks")
+            logger.info(f"Found {matched_count} matches out of {total_tracks} tracks")
             
             
             if self._cancelled:
@@ -202,8 +265,8 @@ class PlaylistSyncService:
             # Update progress with match results
             self._update_progress(playlist.name, "Matching completed", "", 60, 5, 3, 
                                 total_tracks=total_tracks, 
-                                matched_tracks=len(matched_tracks), 
-                                failed_tracks=len(unmatched_tracks))
+                                matched_tracks=matched_count, 
+                                failed_tracks=failed_count, force=True)
             
             downloaded_tracks = 0
             if download_missing and unmatched_tracks:
@@ -211,18 +274,24 @@ class PlaylistSyncService:
                     return self._create_error_result(playlist.name, ["Sync cancelled"])
                 self._update_progress(playlist.name, "Downloading missing tracks", "", 70, 5, 4, 
                                     total_tracks=total_tracks,
-                                    matched_tracks=len(matched_tracks),
-                                    failed_tracks=len(unmatched_tracks))
-                downloaded_tracks = await self._download_missing_tracks(unmatched_tracks)
+                                    matched_tracks=matched_count,
+                                    failed_tracks=failed_count, force=True)
+                def on_download_done(match_result: MatchResult, started: bool, finished_count: int) -> None:
+                    self._update_progress(playlist.name, "Downloading missing tracks", match_result.spotify_track.name,
+                                          70 + 10 * finished_count / len(unmatched_tracks), 5, 4,
+                                          total_tracks=total_tracks,
+                                          matched_tracks=matched_count,
+                                          failed_tracks=failed_count)
+
+                downloaded_tracks = await self._download_missing_tracks(unmatched_tracks, on_download_done)
             
             if self._cancelled:
                 return self._create_error_result(playlist.name, ["Sync cancelled"])
             
-            media_client, server_type = self._get_active_media_client()
             self._update_progress(playlist.name, f"Creating/updating {server_type.title()} playlist", "", 80, 5, 4,
                                 total_tracks=total_tracks,
-                                matched_tracks=len(matched_tracks),
-                                failed_tracks=len(unmatched_tracks))
+                                matched_tracks=matched_count,
+                                failed_tracks=failed_count, force=True)
             
             # Get the actual media server track objects
             media_tracks = [r.plex_track for r in matched_tracks if r.plex_track] # plex_track is a generic name here
@@ -243,72 +312,66 @@ class PlaylistSyncService:
             plex_tracks = valid_tracks # Keep variable name for compatibility with the rest of the function
             
             # Use active media server for playlist sync
-            media_client, server_type = self._get_active_media_client()
             if not media_client:
                 logger.error(f"No active media client available for playlist sync")
                 sync_success = False
             else:
                 logger.info(f"Syncing playlist '{playlist.name}' to {server_type.upper()} server")
                 # THE FIX: Ensure we are passing the correct, native track objects to the client
-                sync_success = media_client.update_playlist(playlist.name, valid_tracks)
+                # Playlist APIs are blocking HTTP calls; keep the event loop free while they run
+                sync_success = await asyncio.to_thread(media_client.update_playlist, playlist.name, valid_tracks)
             
             synced_tracks = len(plex_tracks) if sync_success else 0
-            failed_tracks = len(playlist.tracks) - synced_tracks - downloaded_tracks
+            failed_tracks = total_tracks - synced_tracks - downloaded_tracks
             
             self._update_progress(playlist.name, "Sync completed", "", 100, 5, 5,
                                 total_tracks=total_tracks,
-                                matched_tracks=len(matched_tracks),
-                                failed_tracks=failed_tracks)
+                                matched_tracks=matched_count,
+                                failed_tracks=failed_tracks, force=True)
 
             # Auto-add unmatched tracks to wishlist
             wishlist_added_count = 0
             if unmatched_tracks:
                 try:
-                    from core.wishlist_service import get_wishlist_service
                     wishlist_service = get_wishlist_service()
 
-                    logger.info(f"Auto-adding {len(unmatched_tracks)} unmatched tracks to wishlist")
+                    logger.info(f"Auto-adding {failed_count} unmatched tracks to wishlist")
 
+                    original_tracks_map = getattr(self, '_original_tracks_map', None) or {}
+                    spotify_tracks_data = []
                     for match_result in unmatched_tracks:
                         spotify_track = match_result.spotify_track
 
-                        # Check if we have original track data with full album objects
-                        original_track_data = None
-                        if hasattr(self, '_original_tracks_map') and self._original_tracks_map:
-                            original_track_data = self._original_tracks_map.get(spotify_track.id)
-
                         # Use original data if available (preserves album images), otherwise convert
-                        if original_track_data:
-                            spotify_track_data = original_track_data
-                        else:
+                        spotify_track_data = original_tracks_map.get(spotify_track.id)
+                        if not spotify_track_data:
                             spotify_track_data = {
                                 'id': spotify_track.id,
                                 'name': spotify_track.name,
-                                'artists': [{'name': a} if isinstance(a, str) else a for a in spotify_track.artists],
+                                'artists': [{'name': a} for a in spotify_track.artists],
                                 'album': {'name': spotify_track.album},
                                 'duration_ms': spotify_track.duration_ms,
-                                'popularity': getattr(spotify_track, 'popularity', 0),
-                                'preview_url': getattr(spotify_track, 'preview_url', None),
-                                'external_urls': getattr(spotify_track, 'external_urls', {})
+                                'popularity': spotify_track.popularity,
+                                'preview_url': spotify_track.preview_url,
+                                'external_urls': spotify_track.external_urls
                             }
-
-                        # Add to wishlist with source context
-                        success = wishlist_service.add_spotify_track_to_wishlist(
-                            spotify_track_data=spotify_track_data,
-                            failure_reason='Missing from media server after sync',
-                            source_type='playlist',
-                            source_context={
-                                'playlist_name': playlist.name,
-                                'playlist_id': playlist.id,
-                                'sync_type': 'automatic_sync',
-                                'timestamp': datetime.now().isoformat()
-                            }
-                        )
-
-                        if success:
-                            wishlist_added_count += 1
-
-                    logger.info(f"Successfully added {wishlist_added_count}/{len(unmatched_tracks)} tracks to wishlist")
+                        spotify_tracks_data.append(spotify_track_data)
+
+                    # Add them all with source context in one database transaction
+                    wishlist_added_count = await asyncio.to_thread(
+                        wishlist_service.add_spotify_tracks_to_wishlist,
+                        spotify_tracks_data=spotify_tracks_data,
+                        failure_reason='Missing from media server after sync',
+                        source_type='playlist',
+                        source_context={
+                            'playlist_name': playlist.name,
+                            'playlist_id': playlist.id,
+                            'sync_type': 'automatic_sync',
+                            'timestamp': datetime.now().isoformat()
+                        }
+                    )
+
+                    logger.info(f"Successfully added {wishlist_added_count}/{failed_count} tracks to wishlist")
 
                 except Exception as e:
                     logger.warning(f"Failed to auto-add tracks to wishlist: {e}")
@@ -316,8 +379,8 @@ class PlaylistSyncService:
 
             result = SyncResult(
                 playlist_name=playlist.name,
-                total_tracks=len(playlist.tracks),
-                matched_tracks=len(matched_tracks),
+                total_tracks=total_tracks,
+                matched_tracks=matched_count,
                 synced_tracks=synced_tracks,
                 downloaded_tracks=downloaded_tracks,
                 failed_tracks=failed_tracks,
@@ -338,88 +401,65 @@ class PlaylistSyncService:
             # Remove this playlist from syncing set and clear its callback
             self.syncing_playlists.discard(playlist.name)
             self.clear_progress_callback(playlist.name)
+            self._last_progress_ts.pop(playlist.name, None)
+            # The sync may have downloaded new tracks; the next preview should see them
+            self._media_tracks_cache.clear()
+            self._media_track_index_cache.clear()
             self._cancelled = False
     
-    async def _find_track_in_media_server(self, spotify_track: SpotifyTrack) -> Tuple[Optional[PlexTrackInfo], float]:
-        """Find a track using the same improved database matching as Download Missing Tracks modal"""
+    async def _find_track_in_media_server(self, spotify_track: SpotifyTrack, media_client=None, server_type: Optional[str] = None,
+                                          db: Optional[MusicDatabase] = None,
+                                          exact_matches: Optional[Dict[Tuple[str, str], Tuple[Any, float]]] = None) -> Tuple[Optional[PlexTrackInfo], float]:
+        """Find a track using the same improved database matching as Download Missing Tracks modal.
+        media_client, server_type and db are reused from the caller when it already resolved them (a caller
+        passing server_type has already checked the connection and passes media_client=None if it is down);
+        exact_matches maps (title, artist) to a prefetched database match, checked before the fuzzy lookup."""
         try:
             # Check active media server connection
-            media_client, server_type = self._get_active_media_client()
-            if not media_client or not media_client.is_connected():
+            if server_type is None:
+                media_client, server_type = self._get_active_media_client()
+                if media_client and not media_client.is_connected():
+                    media_client = None
+            if not media_client:
                 logger.warning(f"{server_type.upper()} client not connected")
                 return None, 0.0
             
             # Use the SAME improved database matching as PlaylistTrackAnalysisWorker
-            from database.music_database import MusicDatabase
+            if db is None:
+                db = MusicDatabase()
             
             original_title = spotify_track.name
             
             # Try each artist (same as modal logic)
-            for artist in spotify_track.artists:
+            for artist_name in spotify_track.artists:
                 if self._cancelled:
                     return None, 0.0
-
-                # Extract artist name from both string and dict formats
-                if isinstance(artist, str):
-                    artist_name = artist
-                elif isinstance(artist, dict) and 'name' in artist:
-                    artist_name = artist['name']
-                else:
-                    artist_name = str(artist)
                 
                 # Use the improved database check_track_exists method with server awareness
                 try:
-                    from config.settings import config_manager
-                    active_server = config_manager.get_active_media_server()
-                    db = MusicDatabase()
-                    db_track, confidence = db.check_track_exists(original_title, artist_name, confidence_threshold=0.7, server_source=active_server)
+                    exact_match = exact_matches.get((original_title, artist_name)) if exact_matches else None
+                    if exact_match:
+                        db_track, confidence = exact_match
+                    else:
+                        # Run the lookup in a worker thread so concurrent matches overlap
+                        db_track, confidence = await asyncio.to_thread(
+                            db.check_track_exists, original_title, artist_name,
+                            confidence_threshold=0.7, server_source=server_type
+                        )
                     
                     if db_track and confidence >= 0.7:
                         logger.debug(f"✔️ Database match found for '{original_title}' by '{artist_name}': '{db_track.title}' with confidence {confidence:.2f}")
                         
                         # Fetch the actual track object from active media server using the database track ID
-                        try:
-                            if server_type == "jellyfin":
-                                # For Jellyfin, create a track object from database info (Jellyfin doesn't have fetchItem)
-                                class JellyfinTrackFromDB:
-                                    def __init__(self, db_track):
-                                        self.ratingKey = db_track.id
-                                        self.title = db_track.title
-                                        self.id = db_track.id
-                                
-                                actual_track = JellyfinTrackFromDB(db_track)
-                                logger.debug(f"✔️ Created Jellyfin track object for '{db_track.title}' (ID: {actual_track.ratingKey})")
-                                return actual_track, confidence
-                            elif server_type == "navidrome":
-                                # For Navidrome, create a track object from database info (similar to Jellyfin)
-                                class NavidromeTrackFromDB:
-                                    def __init__(self, db_track):
-                                        self.ratingKey = db_track.id
-                                        self.title = db_track.title
-                                        self.id = db_track.id
-
-                                actual_track = NavidromeTrackFromDB(db_track)
-                                logger.debug(f"✔️ Created Navidrome track object for '{db_track.title}' (ID: {actual_track.ratingKey})")
-                                return actual_track, confidence
-                            else:
-                                # For Plex, use the original fetchItem approach
-                                # Validate that the track ID is numeric (Plex requirement)
-                                try:
-                                    track_id = int(db_track.id)
-                                    actual_plex_track = media_client.server.fetchItem(track_id)
-                                    if actual_plex_track and hasattr(actual_plex_track, 'ratingKey'):
-                                        logger.debug(f"✔️ Successfully fetched actual Plex track for '{db_track.title}' (ratingKey: {actual_plex_track.ratingKey})")
-                                        return actual_plex_track, confidence
-                                    else:
-                                        logger.warning(f"❌ Fetched Plex track for '{db_track.title}' lacks ratingKey attribute")
-                                except ValueError:
-                                    logger.warning(f"❌ Invalid Plex track ID format for '{db_track.title}' (ID: {db_track.id}) - skipping this track")
-                                    continue
-                                
-                        except Exception as fetch_error:
-                            logger.error(f"❌ Failed to fetch actual {server_type} track for '{db_track.title}' (ID: {db_track.id}): {fetch_error}")
-                            # Continue to try other artists rather than fail completely
-                            continue
+                        if server_type == "plex":
+                            # Plex resolves the track with a blocking fetchItem request
+                            actual_track = await asyncio.to_thread(self._media_track_from_db, db_track, media_client, server_type)
+                        else:
+                            actual_track = self._media_track_from_db(db_track, media_client, server_type)
+                        if actual_track is not None:
+                            return actual_track, confidence
+                        # Continue to try other artists rather than fail completely
+                        continue
                         
                 except Exception as db_error:
                     logger.error(f"Error checking track existence for '{original_title}' by '{artist_name}': {db_error}")
@@ -432,6 +472,68 @@ class PlaylistSyncService:
             logger.error(f"Error searching for track '{spotify_track.name}': {e}")
             return None, 0.0
     
+    def _media_track_from_db(self, db_track, media_client, server_type: str):
+        """Turn a database track into the object the active media server's playlist API expects (None if unavailable)"""
+        try:
+            if server_type == "jellyfin":
+                # For Jellyfin, create a track object from database info (Jellyfin doesn't have fetchItem)
+                class JellyfinTrackFromDB:
+                    def __init__(self, db_track):
+                        self.ratingKey = db_track.id
+                        self.title = db_track.title
+                        self.id = db_track.id
+                
+                actual_track = JellyfinTrackFromDB(db_track)
+                logger.debug(f"✔️ Created Jellyfin track object for '{db_track.title}' (ID: {actual_track.ratingKey})")
+                return actual_track
+            elif server_type == "navidrome":
+                # For Navidrome, create a track object from database info (similar to Jellyfin)
+                class NavidromeTrackFromDB:
+                    def __init__(self, db_track):
+                        self.ratingKey = db_track.id
+                        self.title = db_track.title
+                        self.id = db_track.id
+
+                actual_track = NavidromeTrackFromDB(db_track)
+                logger.debug(f"✔️ Created Navidrome track object for '{db_track.title}' (ID: {actual_track.ratingKey})")
+                return actual_track
+            else:
+                # For Plex, use the original fetchItem approach
+                # Validate that the track ID is numeric (Plex requirement)
+                try:
+                    track_id = int(db_track.id)
+                    actual_plex_track = media_client.server.fetchItem(track_id)
+                    if actual_plex_track and hasattr(actual_plex_track, 'ratingKey'):
+                        logger.debug(f"✔️ Successfully fetched actual Plex track for '{db_track.title}' (ratingKey: {actual_plex_track.ratingKey})")
+                        return actual_plex_track
+                    else:
+                        logger.warning(f"❌ Fetched Plex track for '{db_track.title}' lacks ratingKey attribute")
+                except ValueError:
+                    logger.warning(f"❌ Invalid Plex track ID format for '{db_track.title}' (ID: {db_track.id}) - skipping this track")
+                
+        except Exception as fetch_error:
+            logger.error(f"❌ Failed to fetch actual {server_type} track for '{db_track.title}' (ID: {db_track.id}): {fetch_error}")
+        
+        return None
+    
+    def _find_tracks_in_database_bulk(self, db: MusicDatabase, tracks: List[SpotifyTrack],
+                                      media_client, server_type: str) -> Dict[Tuple[str, str], Tuple[Any, float]]:
+        """Exact title/artist database matches for every artist of many tracks in one query, keyed by (title, artist).
+        media_client is None when the media server is not connected."""
+        try:
+            if not media_client:
+                return {}
+            
+            keys = {(track.name, artist_name) for track in tracks for artist_name in track.artists}
+            
+            matches = db.check_tracks_exist_bulk(list(keys), confidence_threshold=0.7, server_source=server_type)
+            logger.info(f"Bulk database lookup matched {len(matches)}/{len(keys)} title/artist pairs")
+            return matches
+            
+        except Exception as e:
+            logger.error(f"Error during bulk database track lookup: {e}")
+            return {}
+    
     async def sync_multiple_playlists(self, playlist_names: List[str], download_missing: bool = False) -> List[SyncResult]:
         results = []
         
@@ -464,8 +566,8 @@ class PlaylistSyncService:
                 logger.error(f"No active media client available")
                 return []
 
-            if hasattr(media_client, 'search_tracks'):
-                return media_client.search_tracks("", limit=10000)
+            if hasattr(media_client, 'iter_tracks') or hasattr(media_client, 'search_tracks'):
+                return self._cached_media_tracks(media_client, server_type, 10000)
             else:
                 logger.warning(f"{server_type.title()} client doesn't support track search")
                 return []
@@ -473,29 +575,125 @@ class PlaylistSyncService:
             logger.error(f"Error fetching {server_type} tracks: {e}")
             return []
     
-    async def _download_missing_tracks(self, unmatched_tracks: List[MatchResult]) -> int:
+    def _cached_media_tracks(self, media_client, server_type: str, limit: int) -> List:
+        """Library snapshot of up to limit tracks, reused for _MEDIA_TRACKS_CACHE_TTL seconds"""
+        key = (server_type, limit)
+        cached = self._media_tracks_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _MEDIA_TRACKS_CACHE_TTL:
+            return cached[1]
+
+        if hasattr(media_client, 'iter_tracks'):
+            # Page through the library so only one raw page is held at a time, stopping once limit is reached;
+            # a failed page raises out of iter_tracks, so a truncated library is never cached
+            tracks = []
+            for page in media_client.iter_tracks(page_size=min(limit, _MEDIA_TRACKS_PAGE_SIZE)):
+                tracks.extend(page[:limit - len(tracks)])
+                if len(tracks) >= limit:
+                    break
+        else:
+            tracks = media_client.search_tracks("", limit=limit)
+        if tracks:  # Don't pin an empty result from a failed fetch
+            self._media_tracks_cache[key] = (now, tracks)
+        return tracks
+
+    def _cached_media_track_index(self, media_client, server_type: str, limit: int) -> Tuple[List, Tuple]:
+        """Cached library snapshot plus its matching_engine.build_track_index, rebuilt only when the snapshot changes"""
+        tracks = self._cached_media_tracks(media_client, server_type, limit)
+        key = (server_type, limit)
+        cached = self._media_track_index_cache.get(key)
+        if cached is not None and cached[0] is tracks:
+            return tracks, cached[1]
+
+        track_index = self.matching_engine.build_track_index(tracks)
+        if tracks:
+            self._media_track_index_cache[key] = (tracks, track_index)
+        return tracks, track_index
+
+    async def _download_missing_tracks(self, unmatched_tracks: List[MatchResult],
+                                       on_track_done: Optional[Callable[[MatchResult, bool, int], None]] = None) -> int:
+        """Download unmatched tracks a few at a time; on_track_done(match_result, started, finished_count) fires as each one finishes"""
+        # Run several searches at once; the Soulseek client's own search rate limiter still spaces them out
+        max_in_flight = max(1, int(config_manager.get('sync.download_concurrency', 5)))
+
+        async def download_track(match_result: MatchResult) -> bool:
+            if self._cancelled:
+                return False
+
+            # Query building is regex-heavy string work; keep it off the event loop while other searches are in flight
+            query = await asyncio.to_thread(self.matching_engine.generate_download_query, match_result.spotify_track)
+            logger.info(f"Attempting to download: {query}")
+            
+            download_id = await self._search_and_download_best(query)
+            
+            if download_id:
+                logger.info(f"Download started for: {match_result.spotify_track.name}")
+                return True
+            logger.warning(f"No download sources found for: {match_result.spotify_track.name}")
+            return False
+
+        # Keep at most max_in_flight downloads running and handle each result as soon as it lands
+        queued = iter(unmatched_tracks)
+        in_flight: Dict[asyncio.Task, MatchResult] = {}
         downloaded_count = 0
-        
-        for match_result in unmatched_tracks:
-            try:
-                query = self.matching_engine.generate_download_query(match_result.spotify_track)
-                logger.info(f"Attempting to download: {query}")
-                
-                download_id = await self.soulseek_client.search_and_download_best(query)
-                
-                if download_id:
-                    downloaded_count += 1
-                    logger.info(f"Download started for: {match_result.spotify_track.name}")
-                else:
-                    logger.warning(f"No download sources found for: {match_result.spotify_track.name}")
-                
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error downloading track: {e}")
+        finished_count = 0
+
+        def start_next() -> None:
+            match_result = next(queued, None)
+            if match_result is not None:
+                in_flight[asyncio.ensure_future(download_track(match_result))] = match_result
+
+        try:
+            for _ in range(max_in_flight):
+                start_next()
+
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    match_result = in_flight.pop(task)
+                    finished_count += 1
+                    started = False
+                    if task.cancelled():
+                        logger.warning(f"Download cancelled for: {match_result.spotify_track.name}")
+                    elif task.exception() is not None:
+                        logger.error(f"Error downloading track: {task.exception()}")
+                    elif task.result():
+                        started = True
+                        downloaded_count += 1
+                    if on_track_done:
+                        on_track_done(match_result, started, finished_count)
+                    start_next()
+        finally:
+            # Stop outstanding downloads if we bail out early (cancellation or a failing callback)
+            for task in in_flight:
+                task.cancel()
         
         return downloaded_count
     
+    async def _search_and_download_best(self, query: str) -> Optional[str]:
+        """soulseek_client.search_and_download_best, shared by concurrent callers asking for the same query"""
+        # Playlists syncing at the same time often want the same track; join the search already running
+        # instead of spending another rate-limited search and queueing a duplicate download
+        key = (asyncio.get_running_loop(), query.strip().lower())
+        task = self._download_tasks.get(key)
+        if task is not None:
+            logger.info(f"Joining in-progress search for: {query}")
+        else:
+            task = asyncio.ensure_future(self.soulseek_client.search_and_download_best(query))
+            self._download_tasks[key] = task
+            task.add_done_callback(lambda _: self._download_tasks.pop(key, None))
+        # Shielded so one caller being cancelled doesn't cancel the search for the others
+        self._download_waiters[task] = self._download_waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._download_waiters[task] -= 1
+            if not self._download_waiters[task]:
+                del self._download_waiters[task]
+                # Every caller gave up (e.g. their syncs were cancelled); don't leave the search running detached
+                if not task.done():
+                    task.cancel()
+
     def _create_error_result(self, playlist_name: str, errors: List[str]) -> SyncResult:
         return SyncResult(
             playlist_name=playlist_name,
@@ -516,14 +714,17 @@ class PlaylistSyncService:
                 return {"error": f"Playlist '{playlist_name}' not found"}
 
             media_client, server_type = self._get_active_media_client()
-            if not media_client or not hasattr(media_client, 'search_tracks'):
+            if not media_client or not (hasattr(media_client, 'iter_tracks') or hasattr(media_client, 'search_tracks')):
                 return {"error": f"Active media server ({server_type}) doesn't support track search"}
 
-            media_tracks = media_client.search_tracks("", limit=1000)
+            media_tracks, track_index = self._cached_media_track_index(media_client, server_type, _PREVIEW_LIBRARY_LIMIT)
 
+            # Only the previewed rows get fuzzy matching; the rest of the playlist is counted from exact artist/title hits
             match_results = self.matching_engine.match_playlist_tracks(
                 spotify_playlist.tracks,
-                media_tracks
+                media_tracks,
+                track_index,
+                fuzzy_limit=_PREVIEW_TRACK_COUNT
             )
 
             stats = self.matching_engine.get_match_statistics(match_results)
@@ -538,14 +739,16 @@ class PlaylistSyncService:
                 "tracks_preview": []
             }
 
-            for result in match_results[:10]:
-                track_info = {
+            match_key = f"{server_type}_match"
+            preview["tracks_preview"] = [
+                {
                     "spotify_track": f"{result.spotify_track.name} - {result.spotify_track.artists[0]}",
-                    f"{server_type}_match": getattr(result, 'plex_track', None).title if getattr(result, 'plex_track', None) else None,
+                    match_key: result.plex_track.title if result.plex_track else None,
                     "confidence": result.confidence,
                     "status": "available" if result.is_match else "needs_download"
                 }
-                preview["tracks_preview"].append(track_info)
+                for result in match_results[:_PREVIEW_TRACK_COUNT]
+            ]
 
             return preview
 
@@ -553,17 +756,24 @@ class PlaylistSyncService:
             logger.error(f"Error generating sync preview: {e}")
             return {"error": str(e)}
     
-    def get_library_comparison(self) -> Dict[str, Any]:
+    async def get_library_comparison(self) -> Dict[str, Any]:
         try:
-            spotify_playlists = self.spotify_client.get_user_playlists()
-            spotify_track_count = sum(len(p.tracks) for p in spotify_playlists)
-
             media_client, server_type = self._get_active_media_client()
             if not media_client:
                 return {"error": f"No active media client available"}
 
-            media_playlists = media_client.get_all_playlists() if hasattr(media_client, 'get_all_playlists') else []
-            media_stats = media_client.get_library_stats() if hasattr(media_client, 'get_library_stats') else {}
+            async def no_result(default):
+                return default
+
+            # The three fetches are independent network calls; run them side by side
+            spotify_playlists, media_playlists, media_stats = await asyncio.gather(
+                # Playlist metadata carries each playlist's track total; the tracks themselves aren't needed here
+                asyncio.to_thread(self.spotify_client.get_user_playlists_metadata_only),
+                asyncio.to_thread(media_client.get_all_playlists) if hasattr(media_client, 'get_all_playlists') else no_result([]),
+                asyncio.to_thread(media_client.get_library_stats) if hasattr(media_client, 'get_library_stats') else no_result({})
+            )
+            spotify_track_count = sum(p.total_tracks for p in spotify_playlists)
+            media_track_count = media_stats.get("tracks", 0)
 
             comparison = {
                 "spotify": {
@@ -574,11 +784,11 @@ class PlaylistSyncService:
                     "playlists": len(media_playlists),
                     "artists": media_stats.get("artists", 0),
                     "albums": media_stats.get("albums", 0),
-                    "tracks": media_stats.get("tracks", 0)
+                    "tracks": media_track_count
                 },
                 "sync_potential": {
-                    "estimated_matches": min(spotify_track_count, media_stats.get("tracks", 0)),
-                    "potential_downloads": max(0, spotify_track_count - media_stats.get("tracks", 0))
+                    "estimated_matches": min(spotify_track_count, media_track_count),
+                    "potential_downloads": max(0, spotify_track_count - media_track_count)
                 }
             }
 
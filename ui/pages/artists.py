@@ -1325,17 +1325,19 @@ class ArtistResultCard(QFrame):
         """Check if this artist is in the watchlist and show eye indicator"""
         try:
             database = get_database()
-            is_watching = database.is_artist_in_watchlist(self.artist.id)
-            
-            if is_watching:
-                self.watchlist_indicator.show()
-            else:
-                self.watchlist_indicator.hide()
+            self.set_watchlist_indicator(database.is_artist_in_watchlist(self.artist.id))
                 
         except Exception as e:
             logger.error(f"Error checking watchlist status for artist {self.artist.name}: {e}")
             self.watchlist_indicator.hide()
     
+    def set_watchlist_indicator(self, is_watching: bool):
+        """Show or hide the eye indicator for a known watchlist status"""
+        if is_watching:
+            self.watchlist_indicator.show()
+        else:
+            self.watchlist_indicator.hide()
+
     def refresh_watchlist_status(self):
         """Refresh the watchlist indicator (call this when watchlist changes)"""
         self.check_watchlist_status()
@@ -5273,12 +5275,19 @@ class ArtistsPage(QWidget):
         """Refresh watchlist indicators on all visible artist cards"""
         try:
             # Find all artist cards in the search results layout
+            cards = []
             for i in range(self.artist_results_layout.count()):
                 item = self.artist_results_layout.itemAt(i)
                 if item and item.widget():
                     widget = item.widget()
                     if isinstance(widget, ArtistResultCard):
-                        widget.refresh_watchlist_status()
+                        cards.append(widget)
+
+            # Look up every card's status in one query instead of one per card
+            if cards:
+                watched_ids = get_database().are_artists_in_watchlist([card.artist.id for card in cards])
+                for card in cards:
+                    card.set_watchlist_indicator(card.artist.id in watched_ids)
         except Exception as e:
             logger.error(f"Error refreshing artist card watchlist status: {e}")
     
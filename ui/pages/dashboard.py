@@ -4127,6 +4127,9 @@ class DashboardPage(QWidget):
 class AutoWishlistProcessorWorker(QRunnable):
     """Background worker for automatic wishlist processing"""
     
+    # Number of download results written back to the wishlist per batch
+    RESULT_FLUSH_SIZE = 25
+    
     class Signals(QObject):
         processing_complete = pyqtSignal(int, int, int)  # successful, failed, total
         processing_error = pyqtSignal(str)  # error_message
@@ -4157,55 +4160,70 @@ class AutoWishlistProcessorWorker(QRunnable):
             logger.info(f"Processing {total_tracks} wishlist tracks automatically")
             
             # Process each track
-            for track_data in wishlist_tracks:
-                try:
-                    # Create search query
-                    artist_name = track_data.get('artists', [{}])[0].get('name', '') if track_data.get('artists') else ''
-                    track_name = track_data.get('name', '')
+            # Download results are written back to the wishlist in chunks as the sweep goes
+            retry_results = []
+
+            def flush_retry_results():
+                if retry_results:
+                    self.wishlist_service.mark_track_download_results(retry_results)
+                    retry_results.clear()
+
+            try:
+                for track_data in wishlist_tracks:
+                    try:
+                        # Create search query
+                        artist_name = track_data.get('artists', [{}])[0].get('name', '') if track_data.get('artists') else ''
+                        track_name = track_data.get('name', '')
                     
-                    if not track_name:
-                        failed_downloads += 1
-                        continue
+                        if not track_name:
+                            failed_downloads += 1
+                            continue
                     
-                    query = f"{artist_name} {track_name}".strip()
-                    if not query:
-                        failed_downloads += 1
-                        continue
+                        query = f"{artist_name} {track_name}".strip()
+                        if not query:
+                            failed_downloads += 1
+                            continue
                     
-                    # Attempt download
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
+                        # Attempt download
+                        loop = asyncio.new_event_loop()
+                        asyncio.set_event_loop(loop)
                     
-                    try:
-                        download_id = loop.run_until_complete(
-                            self.soulseek_client.search_and_download_best(query)
-                        )
+                        try:
+                            download_id = loop.run_until_complete(
+                                self.soulseek_client.search_and_download_best(query)
+                            )
 
-                        track_id = track_data.get('spotify_track_id')
+                            track_id = track_data.get('spotify_track_id')
                         
-                        if download_id and track_id:
-                            # Mark as successful (removes from wishlist)
-                            self.wishlist_service.mark_track_download_result(track_id, success=True)
-                            successful_downloads += 1
-                            logger.info(f"Auto-downloaded wishlist track: '{track_name}' by {artist_name}")
-                        else:
-                            # Mark as failed (increment retry count)
-                            if track_id:
-                                self.wishlist_service.mark_track_download_result(track_id, success=False, error_message="No search results found")
-                            failed_downloads += 1
+                            if download_id and track_id:
+                                # Mark as successful (removes from wishlist)
+                                retry_results.append((track_id, True, None))
+                                successful_downloads += 1
+                                logger.info(f"Auto-downloaded wishlist track: '{track_name}' by {artist_name}")
+                            else:
+                                # Mark as failed (increment retry count)
+                                if track_id:
+                                    retry_results.append((track_id, False, "No search results found"))
+                                failed_downloads += 1
                             
-                    finally:
-                        loop.close()
+                        finally:
+                            loop.close()
                         
-                except Exception as e:
-                    logger.error(f"Error processing wishlist track '{track_name}': {e}")
+                    except Exception as e:
+                        logger.error(f"Error processing wishlist track '{track_name}': {e}")
                     
-                    # Mark as failed
-                    track_id = track_data.get('spotify_track_id')
-                    if track_id:
-                        self.wishlist_service.mark_track_download_result(track_id, success=False, error_message=str(e))
-                    failed_downloads += 1
-            
+                        # Mark as failed
+                        track_id = track_data.get('spotify_track_id')
+                        if track_id:
+                            retry_results.append((track_id, False, str(e)))
+                        failed_downloads += 1
+
+                    if len(retry_results) >= self.RESULT_FLUSH_SIZE:
+                        flush_retry_results()
+            finally:
+                # Write whatever is left, even if the sweep was interrupted
+                flush_retry_results()
+
             # Emit completion
             self.signals.processing_complete.emit(successful_downloads, failed_downloads, total_tracks)
             
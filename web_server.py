@@ -44,6 +44,12 @@ import yt_dlp
 from core.matching_engine import MusicMatchingEngine
 from beatport_unified_scraper import BeatportUnifiedScraper
 
+# orjson is an optional speedup for large paginated responses (Flask's jsonify is used if missing)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Flask App Setup ---
 base_dir = os.path.abspath(os.path.dirname(__file__))
 project_root = os.path.dirname(base_dir) # Go up one level to the project root
@@ -4544,23 +4550,40 @@ def get_library_artists():
         # Get database instance
         database = get_database()
 
-        # Get artists from database
-        result = database.get_library_artists(
+        # The first item is the pagination block; pulling it here runs the query, so
+        # a failure still gets the 500 response below. The artists are then streamed
+        # straight from the cursor
+        artists = database.iter_library_artists(
             search_query=search_query,
             letter=letter,
             page=page,
             limit=limit
         )
+        pagination = next(artists)
 
-        # Fix image URLs for all artists
-        for artist in result['artists']:
-            if artist.get('image_url'):
-                artist['image_url'] = fix_artist_image_url(artist['image_url'])
+        if orjson is not None:
+            dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        else:
+            dumps = lambda obj: json.dumps(obj, sort_keys=True).encode('utf-8')
 
-        return jsonify({
-            "success": True,
-            **result
-        })
+        def generate():
+            yield b'{"pagination": ' + dumps(pagination) + b', "artists": ['
+            try:
+                for index, artist in enumerate(artists):
+                    # Fix image URLs for all artists
+                    if artist.get('image_url'):
+                        artist['image_url'] = fix_artist_image_url(artist['image_url'])
+                    yield (b', ' if index else b'') + dumps(artist)
+            except Exception as e:
+                # Headers are already sent - close the document and flag it as truncated
+                print(f"❌ Error streaming library artists: {e}")
+                yield b'], "success": false, "truncated": true, "error": ' + dumps(str(e)) + b'}'
+                return
+            finally:
+                artists.close()
+            yield b'], "success": true}'
+
+        return Response(generate(), mimetype='application/json')
 
     except Exception as e:
         print(f"❌ Error fetching library artists: {e}")
@@ -16136,31 +16159,29 @@ def _run_sync_task(playlist_id, playlist_name, tracks_json):
             original_find_track = sync_service._find_track_in_media_server
             
             # Create database-only replacement method
-            async def database_only_find_track(spotify_track):
+            # Same signature as PlaylistSyncService._find_track_in_media_server
+            async def database_only_find_track(spotify_track, media_client=None, server_type=None, db=None, exact_matches=None):
                 print(f"🗃️ Database-only search for: '{spotify_track.name}' by {spotify_track.artists}")
                 try:
                     from database.music_database import MusicDatabase
                     from config.settings import config_manager
                     
-                    db = MusicDatabase()
+                    if db is None:
+                        db = MusicDatabase()
                     active_server = config_manager.get_active_media_server()
                     original_title = spotify_track.name
                     
                     # Try each artist (same logic as original)
-                    for artist in spotify_track.artists:
-                        # Extract artist name from both string and dict formats
-                        if isinstance(artist, str):
-                            artist_name = artist
-                        elif isinstance(artist, dict) and 'name' in artist:
-                            artist_name = artist['name']
+                    for artist_name in spotify_track.artists:
+                        exact_match = exact_matches.get((original_title, artist_name)) if exact_matches else None
+                        if exact_match:
+                            db_track, confidence = exact_match
                         else:
-                            artist_name = str(artist)
-                        
-                        db_track, confidence = db.check_track_exists(
-                            original_title, artist_name, 
-                            confidence_threshold=0.7, 
-                            server_source=active_server
-                        )
+                            db_track, confidence = db.check_track_exists(
+                                original_title, artist_name, 
+                                confidence_threshold=0.7, 
+                                server_source=active_server
+                            )
                         
                         if db_track and confidence >= 0.7:
                             print(f"✅ Database match: '{db_track.title}' (confidence: {confidence:.2f})")
@@ -18192,14 +18213,6 @@ def get_discover_release_radar():
                 if track_id in tracks_by_id:
                     track = tracks_by_id[track_id]
 
-                    # Parse track_data_json if it's a string
-                    track_data = track.track_data_json
-                    if isinstance(track_data, str):
-                        try:
-                            track_data = json.loads(track_data)
-                        except:
-                            track_data = None
-
                     selected_tracks.append({
                         "spotify_track_id": track.spotify_track_id,
                         "track_name": track.track_name,
@@ -18207,7 +18220,7 @@ def get_discover_release_radar():
                         "album_name": track.album_name,
                         "album_cover_url": track.album_cover_url,
                         "duration_ms": track.duration_ms,
-                        "track_data_json": track_data  # Now properly parsed
+                        "track_data_json": track.track_data  # Parsed lazily, only for selected tracks
                     })
 
             return jsonify({"success": True, "tracks": selected_tracks})
@@ -18240,14 +18253,6 @@ def get_discover_weekly():
                 if track_id in tracks_by_id:
                     track = tracks_by_id[track_id]
 
-                    # Parse track_data_json if it's a string
-                    track_data = track.track_data_json
-                    if isinstance(track_data, str):
-                        try:
-                            track_data = json.loads(track_data)
-                        except:
-                            track_data = None
-
                     selected_tracks.append({
                         "spotify_track_id": track.spotify_track_id,
                         "track_name": track.track_name,
@@ -18255,7 +18260,7 @@ def get_discover_weekly():
                         "album_name": track.album_name,
                         "album_cover_url": track.album_cover_url,
                         "duration_ms": track.duration_ms,
-                        "track_data_json": track_data  # Now properly parsed
+                        "track_data_json": track.track_data  # Parsed lazily, only for selected tracks
                     })
 
             return jsonify({"success": True, "tracks": selected_tracks})